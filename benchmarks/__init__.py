@@ -0,0 +1,6 @@
+"""Performance benchmarks for Spaces.
+
+synthetic_survey generates thermometer evaluations files of any size and
+run_benchmarks drives the core commands over them, recording the time
+and peak memory of each step.
+"""
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.stats import kendalltau, spearmanr
+
+from typing import TYPE_CHECKING
+
+from benchmarks.synthetic_survey import generate_thermometer_survey
+
+if TYPE_CHECKING:
+	from director import Status
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+REPOSITORY = Path(__file__).resolve().parent.parent
+ELECTIONS = REPOSITORY / "data" / "Elections"
+EVALUATIONS_2004 = ELECTIONS / "2004" / ".Jacoby_2004_Evaluations.csv"
+SUBSET_2020 = ELECTIONS / "2020" / "subset2020.csv"
+# The 2020 feeling thermometers: the candidates before the election and
+# the groups after it. Ratings above 100 and negative ones are codes for
+# refused, don't know and not asked. V202169 is not in the subset
+THERMOMETERS_2020 = [
+	*(f"V2011{each_item}" for each_item in range(51, 58)),
+	*(
+		f"V2021{each_item}"
+		for each_item in (*range(56, 69), *range(70, 88))
+	),
+]
+THERMOMETER_MAXIMUM: int = 100
+
+# --------------------------------------------------------------------------
+
+
+@dataclass
+class Agreement:
+	dataset: str
+	n_individuals: int
+	n_items: int
+	tolerance: float
+	n_sampled: int
+	exact_seconds: float
+	approximate_seconds: float
+	mean_spearman: float
+	min_spearman: float
+	mean_kendall: float
+	min_kendall: float
+
+
+# --------------------------------------------------------------------------
+
+
+def write_2020_evaluations(file_name: Path) -> list[str]:
+	"""Write the 2020 thermometers of the individuals who rated every item
+	as an evaluations file and return the item names.
+	"""
+	ratings = pd.read_csv(SUBSET_2020, usecols=THERMOMETERS_2020)
+	rated = ratings[THERMOMETERS_2020]
+	rated = rated[((rated >= 0) & (rated <= THERMOMETER_MAXIMUM)).all(axis=1)]
+	with file_name.open("w", encoding="utf-8", newline="") as f:
+		f.write("# TYPE: EVALUATIONS\n")
+		rated.to_csv(f, index=False)
+	return THERMOMETERS_2020
+
+
+# --------------------------------------------------------------------------
+
+
+def measure_agreement(
+	director: Status,
+	dataset: str,
+	tolerances: list[float],
+	trials: int,
+	seed: int,
+) -> list[Agreement]:
+	"""Compare line of sight on the active evaluations with approximate
+	line of sight at each tolerance, over trials random samples each.
+	"""
+	common = director.common
+	evaluations = director.evaluations_active
+	started = time.perf_counter()
+	exact = np.asarray(common.los(evaluations).similarities_as_list)
+	exact_seconds = time.perf_counter() - started
+
+	rng = np.random.default_rng(seed)
+	agreements = []
+	for tolerance in tolerances:
+		spearmans = []
+		kendalls = []
+		approximate_seconds = 0.0
+		n_sampled = evaluations.nevaluators
+		for _ in range(trials):
+			started = time.perf_counter()
+			approximate = common.approximate_los(evaluations, tolerance, rng)
+			approximate_seconds += time.perf_counter() - started
+			n_sampled = approximate.n_individ
+			spearmans.append(
+				spearmanr(exact, approximate.similarities_as_list)[0]
+			)
+			kendalls.append(
+				kendalltau(exact, approximate.similarities_as_list)[0]
+			)
+		agreements.append(
+			Agreement(
+				dataset=dataset,
+				n_individuals=evaluations.nevaluators,
+				n_items=evaluations.nreferent,
+				tolerance=tolerance,
+				n_sampled=n_sampled,
+				exact_seconds=exact_seconds,
+				approximate_seconds=approximate_seconds / trials,
+				mean_spearman=float(np.mean(spearmans)),
+				min_spearman=float(np.min(spearmans)),
+				mean_kendall=float(np.mean(kendalls)),
+				min_kendall=float(np.min(kendalls)),
+			)
+		)
+	return agreements
+
+
+# --------------------------------------------------------------------------
+
+
+def load_evaluations(director: Status, file_name: Path) -> None:
+	"""Open file_name as the active evaluations through the script runner,
+	as an Evaluations line in a script would.
+	"""
+	from filemenu import OpenScriptCommand  # noqa: PLC0415
+
+	runner = OpenScriptCommand(director, director.common)
+	director.executing_script = True
+	try:
+		with (
+			Path(os.devnull).open("w", encoding="utf-8") as output_sink,
+			redirect_stdout(output_sink),
+		):
+			runner.execute_script_line(
+				f'Evaluations file="{file_name.as_posix()}"', 1
+			)
+	finally:
+		director.executing_script = False
+	return
+
+
+# --------------------------------------------------------------------------
+
+
+def _create_director() -> Status:
+	from PySide6.QtWidgets import QApplication  # noqa: PLC0415
+
+	if QApplication.instance() is None:
+		QApplication(sys.argv[:1])
+	from director import Status  # noqa: PLC0415
+
+	return Status()
+
+
+# --------------------------------------------------------------------------
+
+
+def format_agreement_table(agreements: list[Agreement]) -> list[str]:
+	"""Lay out the agreements as text, a line per dataset and tolerance."""
+	header = (
+		f"{'Data':<10}{'Individuals':>12}{'Items':>6}{'Tolerance':>10}"
+		f"{'Sampled':>9}{'Exact s':>9}{'Approx s':>9}"
+		f"{'Spearman':>10}{'(min)':>7}{'Kendall':>9}{'(min)':>7}"
+	)
+	lines = [header, "-" * len(header)]
+	lines.extend(
+		f"{agreement.dataset:<10}{agreement.n_individuals:>12}"
+		f"{agreement.n_items:>6}{agreement.tolerance:>10.3f}"
+		f"{agreement.n_sampled:>9}{agreement.exact_seconds:>9.3f}"
+		f"{agreement.approximate_seconds:>9.3f}"
+		f"{agreement.mean_spearman:>10.4f}"
+		f"{agreement.min_spearman:>7.3f}"
+		f"{agreement.mean_kendall:>9.4f}{agreement.min_kendall:>7.3f}"
+		for agreement in agreements
+	)
+	return lines
+
+
+# --------------------------------------------------------------------------
+
+
+def parse_command_line() -> argparse.Namespace:
+	"""Parse the tolerances, trials and synthetic survey sizes to use."""
+	parser = argparse.ArgumentParser(
+		description=(
+			"Compare approximate with exact line of sight on the bundled "
+			"2004 and 2020 election data"
+		)
+	)
+	parser.add_argument(
+		"--tolerances", type=float, nargs="+",
+		default=[0.02, 0.05, 0.1, 0.15, 0.2],
+	)
+	parser.add_argument(
+		"--trials", type=int, default=5,
+		help="random samples compared at each tolerance",
+	)
+	parser.add_argument("--seed", type=int, default=2004)
+	parser.add_argument(
+		"--respondents", type=int, nargs="*", default=[],
+		help="also compare on synthetic surveys of these sizes",
+	)
+	return parser.parse_args()
+
+
+# --------------------------------------------------------------------------
+
+
+def main() -> None:
+	"""Print how closely approximate line of sight ranks the pairs as
+	line of sight does, and how long each takes.
+	"""
+	arguments = parse_command_line()
+	agreements: list[Agreement] = []
+	with tempfile.TemporaryDirectory() as work_name:
+		work_directory = Path(work_name)
+		datasets = [("2004", EVALUATIONS_2004)]
+		write_2020_evaluations(work_directory / "2020.csv")
+		datasets.append(("2020", work_directory / "2020.csv"))
+		for n_respondents in arguments.respondents:
+			file_name = work_directory / f"synthetic_{n_respondents}.csv"
+			generate_thermometer_survey(
+				file_name, n_respondents, 13, seed=arguments.seed
+			)
+			datasets.append(("synthetic", file_name))
+		for dataset, file_name in datasets:
+			director = _create_director()
+			load_evaluations(director, file_name)
+			with (
+				Path(os.devnull).open("w", encoding="utf-8") as output_sink,
+				redirect_stdout(output_sink),
+			):
+				agreements.extend(
+					measure_agreement(
+						director,
+						dataset,
+						arguments.tolerances,
+						arguments.trials,
+						arguments.seed,
+					)
+				)
+			director.deleteLater()
+	print("\n".join(format_agreement_table(agreements)))
+	return
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from typing import TYPE_CHECKING
+
+from benchmarks.synthetic_survey import generate_thermometer_survey
+
+if TYPE_CHECKING:
+	from director import Status
+	from filemenu import OpenScriptCommand
+
+# The core is driven without showing a window, through the same script
+# runner that executes .spc files, so the timings include everything a
+# script line costs except painting the screen
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+MIN_COMPARABLE_SECONDS: float = 0.05  # faster steps are too noisy to compare
+
+# Each step is one or more script lines; the lines before the last set up
+# what the last one needs
+STEPS = (
+	"Evaluations",
+	"Line of sight",
+	"MDS",
+	"Score individuals",
+	"Reference points",
+	"Segments",
+	"Cluster",
+	"Uncertainty",
+	"Factor analysis",
+)
+
+# --------------------------------------------------------------------------
+
+
+@dataclass
+class Scenario:
+	n_respondents: int
+	n_items: int
+	n_dimensions: int
+
+
+@dataclass
+class StepResult:
+	n_respondents: int
+	n_items: int
+	n_dimensions: int
+	command: str
+	succeeded: bool
+	wall_seconds: float
+	cpu_seconds: float
+	peak_rss_bytes: int
+	peak_rss_delta_bytes: int
+	message: str = ""
+
+	def key(self) -> tuple[int, int, int, str]:
+		return (
+			self.n_respondents, self.n_items, self.n_dimensions, self.command
+		)
+
+
+# --------------------------------------------------------------------------
+
+
+def script_lines_for_step(
+	step: str,
+	scenario: Scenario,
+	item_names: list[str],
+	work_directory: Path,
+	arguments: argparse.Namespace,
+) -> list[str]:
+	"""Return the script lines that run step for scenario."""
+	evaluations_file = (work_directory / "evaluations.csv").as_posix()
+	target_file = (work_directory / "target.txt").as_posix()
+	lines_for_steps = {
+		"Evaluations": [f'Evaluations file="{evaluations_file}"'],
+		"Line of sight": ["Line of sight"],
+		"MDS": [
+			f"MDS n_components={scenario.n_dimensions} use_metric=False"
+		],
+		"Score individuals": ["Score individuals"],
+		"Reference points": [(
+			f"Reference points contest=['{item_names[0]}', "
+			f"'{item_names[1]}']"
+		)],
+		"Segments": ["Segments"],
+		"Cluster": [
+			f"Cluster data_source=scores n_clusters={arguments.clusters}"
+		],
+		"Uncertainty": [
+			f'Save configuration file="{target_file}"',
+			f'Target file="{target_file}"',
+			(
+				"Uncertainty "
+				f"probability_of_inclusion={arguments.probability} "
+				f"nrepetitions={arguments.repetitions}"
+			),
+		],
+		"Factor analysis": [
+			f"Factor analysis n_factors={scenario.n_dimensions}"
+		],
+	}
+	return lines_for_steps[step]
+
+
+# --------------------------------------------------------------------------
+
+
+def run_scenario(
+	scenario: Scenario, arguments: argparse.Namespace
+) -> list[StepResult]:
+	"""Generate the scenario's evaluations and run every step not skipped
+	on a new main window, carrying on after a step fails so that one
+	broken command does not hide the cost of the others.
+	"""
+	from filemenu import OpenScriptCommand  # noqa: PLC0415
+
+	results: list[StepResult] = []
+	with tempfile.TemporaryDirectory() as work_name:
+		work_directory = Path(work_name)
+		item_names = generate_thermometer_survey(
+			work_directory / "evaluations.csv",
+			scenario.n_respondents,
+			scenario.n_items,
+			scenario.n_dimensions,
+			arguments.seed,
+		)
+		director = _create_director()
+		runner = OpenScriptCommand(director, director.common)
+		director.executing_script = True
+		line_num = 0
+		try:
+			for step in STEPS:
+				if step in arguments.skip:
+					continue
+				for line in script_lines_for_step(
+					step, scenario, item_names, work_directory, arguments
+				):
+					line_num += 1
+					results.append(
+						_run_script_line(
+							director, runner, scenario, line, line_num
+						)
+					)
+		finally:
+			director.executing_script = False
+			director.deleteLater()
+	return results
+
+
+# --------------------------------------------------------------------------
+
+
+def _create_director() -> Status:
+	from PySide6.QtWidgets import QApplication  # noqa: PLC0415
+
+	if QApplication.instance() is None:
+		QApplication(sys.argv[:1])
+	from director import Status  # noqa: PLC0415
+
+	return Status()
+
+
+# --------------------------------------------------------------------------
+
+
+def _run_script_line(
+	director: Status,
+	runner: OpenScriptCommand,
+	scenario: Scenario,
+	line: str,
+	line_num: int,
+) -> StepResult:
+	from command_metrics import peak_rss_bytes  # noqa: PLC0415
+
+	first_index = len(director.commands_used)
+	message = ""
+	with Path(os.devnull).open("w", encoding="utf-8") as output_sink:
+		try:
+			with redirect_stdout(output_sink):
+				runner.execute_script_line(line, line_num)
+		except Exception as e:  # noqa: BLE001
+			# Report the failure in the table and go on to the next step
+			message = getattr(e, "message", str(e)).splitlines()[0]
+			if len(director.commands_used) > first_index:
+				director.command_exit_code[first_index] = 1
+	started = len(director.commands_used) > first_index
+	metrics = director.command_metrics[first_index] if started else None
+	result = StepResult(
+		n_respondents=scenario.n_respondents,
+		n_items=scenario.n_items,
+		n_dimensions=scenario.n_dimensions,
+		command=(
+			director.commands_used[first_index] if started
+			else line.split("=", 1)[0]
+		),
+		succeeded=started and director.command_exit_code[first_index] == 0,
+		wall_seconds=0.0 if metrics is None else metrics.wall_seconds,
+		cpu_seconds=0.0 if metrics is None else metrics.cpu_seconds,
+		peak_rss_bytes=peak_rss_bytes(),
+		peak_rss_delta_bytes=(
+			0 if metrics is None else metrics.peak_rss_delta_bytes
+		),
+		message=message,
+	)
+	return result
+
+
+# --------------------------------------------------------------------------
+
+
+def read_baseline(file_name: str) -> dict[tuple, StepResult]:
+	"""Read results written by write_baseline, keyed by StepResult.key."""
+	with Path(file_name).open(encoding="utf-8") as f:
+		stored = json.load(f)
+	baseline = {}
+	for each_result in stored["results"]:
+		result = StepResult(**each_result)
+		baseline[result.key()] = result
+	return baseline
+
+
+# --------------------------------------------------------------------------
+
+
+def write_baseline(file_name: str, results: list[StepResult]) -> None:
+	"""Store results as JSON to compare later runs with."""
+	with Path(file_name).open("w", encoding="utf-8") as f:
+		json.dump(
+			{"results": [asdict(result) for result in results]}, f, indent=1
+		)
+	return
+
+
+# --------------------------------------------------------------------------
+
+
+def find_regressions(
+	results: list[StepResult],
+	baseline: dict[tuple, StepResult],
+	tolerance: float,
+) -> list[StepResult]:
+	"""Return the steps that failed although they succeeded in the
+	baseline, or took more than tolerance times their baseline time.
+	"""
+	regressions = []
+	for result in results:
+		stored = baseline.get(result.key())
+		if stored is None or not stored.succeeded:
+			continue
+		if not result.succeeded or (
+			stored.wall_seconds >= MIN_COMPARABLE_SECONDS
+			and result.wall_seconds > tolerance * stored.wall_seconds
+		):
+			regressions.append(result)
+	return regressions
+
+
+# --------------------------------------------------------------------------
+
+
+def format_results_table(
+	results: list[StepResult], baseline: dict[tuple, StepResult]
+) -> list[str]:
+	"""Lay out results, with their baseline times if any, as text."""
+	header = (
+		f"{'Respondents':>11} {'Items':>5} {'Dims':>4}  {'Command':<25}"
+		f"{'Wall s':>9}{'CPU s':>9}{'Peak MB':>9}{'+MB':>8}"
+		f"{'Base s':>9}{'Ratio':>7}  Status"
+	)
+	lines = [header, "-" * len(header)]
+	for result in results:
+		stored = baseline.get(result.key())
+		if stored is None or not stored.succeeded:
+			base_column = f"{'':>9}{'':>7}"
+		else:
+			ratio = result.wall_seconds / max(stored.wall_seconds, 1e-9)
+			base_column = f"{stored.wall_seconds:>9.3f}{ratio:>7.2f}"
+		status = "ok" if result.succeeded else f"FAILED {result.message}"
+		lines.append(
+			f"{result.n_respondents:>11} {result.n_items:>5} "
+			f"{result.n_dimensions:>4}  {result.command:<25}"
+			f"{result.wall_seconds:>9.3f}{result.cpu_seconds:>9.3f}"
+			f"{result.peak_rss_bytes / 1_048_576:>9.1f}"
+			f"{result.peak_rss_delta_bytes / 1_048_576:>8.1f}"
+			f"{base_column}  {status}"
+		)
+	return lines
+
+
+# --------------------------------------------------------------------------
+
+
+def parse_command_line() -> argparse.Namespace:
+	"""Parse the sizes, step options and baseline files to use."""
+	parser = argparse.ArgumentParser(
+		description=(
+			"Time the core Spaces commands on synthetic thermometer surveys"
+		)
+	)
+	parser.add_argument(
+		"--respondents", type=int, nargs="+", default=[1000],
+		help="numbers of respondents to generate, e.g. 1000 100000 1000000",
+	)
+	parser.add_argument(
+		"--items", type=int, nargs="+", default=[13],
+		help="numbers of items to generate, from 5 to 100",
+	)
+	parser.add_argument("--dimensions", type=int, default=2)
+	parser.add_argument("--seed", type=int, default=2004)
+	parser.add_argument("--clusters", type=int, default=4)
+	parser.add_argument("--probability", type=int, default=80)
+	parser.add_argument("--repetitions", type=int, default=10)
+	parser.add_argument(
+		"--skip", nargs="+", choices=STEPS, default=[],
+		help="steps to leave out, e.g. Uncertainty for very large surveys",
+	)
+	parser.add_argument(
+		"--baseline", help="JSON file of earlier results to compare with"
+	)
+	parser.add_argument(
+		"--save-baseline", help="JSON file to store these results in"
+	)
+	parser.add_argument(
+		"--tolerance", type=float, default=1.25,
+		help="slowdown relative to the baseline reported as a regression",
+	)
+	return parser.parse_args()
+
+
+# --------------------------------------------------------------------------
+
+
+def main() -> None:
+	"""Run every combination of items and respondents, print the table
+	and exit with status 1 if any step regressed against the baseline.
+	"""
+	arguments = parse_command_line()
+	baseline = read_baseline(arguments.baseline) if arguments.baseline else {}
+
+	results: list[StepResult] = []
+	for n_items, n_respondents in itertools.product(
+		sorted(arguments.items), sorted(arguments.respondents)
+	):
+		scenario = Scenario(n_respondents, n_items, arguments.dimensions)
+		results.extend(run_scenario(scenario, arguments))
+
+	print("\n".join(format_results_table(results, baseline)))
+	if arguments.save_baseline:
+		write_baseline(arguments.save_baseline, results)
+	regressions = find_regressions(results, baseline, arguments.tolerance)
+	if regressions:
+		print(f"\n{len(regressions)} steps regressed against the baseline")
+		sys.exit(1)
+	return
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Only numpy and pandas are needed here so that files can be generated
+# without Qt, for example on a build machine before the benchmarks run
+
+# Ratings are snapped to the points printed on the ANES feeling
+# thermometer card, which is where most answers in 2004_therms.csv fall
+THERMOMETER_POINTS = np.array(
+	[0, 15, 30, 40, 50, 60, 70, 85, 100], dtype=np.uint8
+)
+CHUNK_SIZE: int = 20_000  # respondents generated and written at a time
+
+# --------------------------------------------------------------------------
+
+
+def item_names_for(n_items: int) -> list[str]:
+	"""Return n_items names whose first four characters, which Spaces uses
+	as point labels, are unique.
+	"""
+	names = [f"i{each_item:03d}" for each_item in range(1, n_items + 1)]
+	return names
+
+
+# --------------------------------------------------------------------------
+
+
+def generate_thermometer_survey(
+	file_name: str | Path,
+	n_respondents: int,
+	n_items: int,
+	n_dimensions: int = 2,
+	seed: int = 2004,
+	noise: float = 12.0,
+) -> list[str]:
+	"""Write an evaluations file like 2004_therms.csv and return its item
+	names.
+
+	Items and respondents are placed in an n_dimensions space. Each
+	respondent rates each item 100 less a multiple of the distance between
+	them, plus noise, snapped to the thermometer points, so the file has
+	the structure LOS, MDS and Factor analysis are meant to recover.
+	Respondents are generated in chunks so that files with a million
+	respondents are written without holding them all in memory.
+	"""
+	rng = np.random.default_rng(seed)
+	item_coords = rng.normal(size=(n_items, n_dimensions))
+	item_names = item_names_for(n_items)
+
+	with Path(file_name).open("w", encoding="utf-8", newline="") as f:
+		f.write("# TYPE: EVALUATIONS\n")
+		f.write(",".join(item_names) + "\n")
+		for first_respondent in range(0, n_respondents, CHUNK_SIZE):
+			n_chunk = min(CHUNK_SIZE, n_respondents - first_respondent)
+			ratings = _rate_items(rng, item_coords, n_chunk, noise)
+			pd.DataFrame(ratings).to_csv(f, header=False, index=False)
+	return item_names
+
+
+# --------------------------------------------------------------------------
+
+
+def _rate_items(
+	rng: np.random.Generator,
+	item_coords: np.ndarray,
+	n_respondents: int,
+	noise: float,
+) -> np.ndarray:
+	n_dimensions = item_coords.shape[1]
+	respondent_coords = rng.normal(size=(n_respondents, n_dimensions))
+	distances = np.linalg.norm(
+		respondent_coords[:, np.newaxis, :] - item_coords[np.newaxis, :, :],
+		axis=2,
+	)
+	raw_ratings = 100.0 - 30.0 * distances + rng.normal(
+		scale=noise, size=distances.shape
+	)
+	# Snap each rating to the nearest thermometer point
+	boundaries = (THERMOMETER_POINTS[:-1] + THERMOMETER_POINTS[1:]) / 2
+	ratings = THERMOMETER_POINTS[np.searchsorted(boundaries, raw_ratings)]
+	return ratings
+
+
+# --------------------------------------------------------------------------
+
+
+def main() -> None:
+	"""Write one file with the sizes given on the command line."""
+	parser = argparse.ArgumentParser(
+		description="Write a synthetic thermometer evaluations file"
+	)
+	parser.add_argument("file", help="evaluations file to write")
+	parser.add_argument("--respondents", type=int, default=1000)
+	parser.add_argument("--items", type=int, default=13)
+	parser.add_argument("--dimensions", type=int, default=2)
+	parser.add_argument("--seed", type=int, default=2004)
+	arguments = parser.parse_args()
+	generate_thermometer_survey(
+		arguments.file,
+		arguments.respondents,
+		arguments.items,
+		arguments.dimensions,
+		arguments.seed,
+	)
+	return
+
+
+if __name__ == "__main__":
+	main()
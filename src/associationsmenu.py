@@ -7,10 +7,16 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from constants import (
+	APPROXIMATE_LOS_CONFIDENCE,
+	APPROXIMATE_LOS_MAXIMUM_TOLERANCE,
+)
 from exceptions import (
 	SelectionError,
+	SpacesError,
 	# UnderDevelopmentError,
 )
+from seeds import child_generator
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -318,6 +324,77 @@ class LineOfSightCommand:
 	# ------------------------------------------------------------------------
 
 
+class ApproximateLineOfSightCommand(LineOfSightCommand):
+	def __init__(self, director: Status, common: Spaces) -> None:
+		"""The Approximate line of sight command computes the line of
+		sight measure of association from a random sample of individuals
+		"""
+		super().__init__(director, common)
+		self._director.command = "Approximate line of sight"
+		return
+
+	# ------------------------------------------------------------------------
+
+	def execute(self, common: Spaces) -> None:
+		common.initiate_command_processes()
+		params = common.get_command_parameters("Approximate line of sight")
+		tolerance = float(params["tolerance"])
+		self._check_tolerance(tolerance)
+		common.capture_and_push_undo_state(
+			"Approximate line of sight", "active", params)
+		self._director.similarities_active = common.approximate_los(
+			self._director.evaluations_active,
+			tolerance,
+			child_generator(params["seed"], "sampling"),
+		)
+		self._duplicate_similarities(common)
+		self._director.similarities_active.rank_similarities()
+		self._director.similarities_active.duplicate_ranked_similarities(
+			common)
+		self._director.dependency_checker.detect_consistency_issues()
+		self._print_sample(tolerance)
+		self._director.similarities_active.print_the_similarities(
+			self._width, self._decimals, common)
+		common.create_plot_for_tabs("heatmap_simi")
+		self._director.create_widgets_for_output_and_log_tabs()
+		self._director.set_focus_on_tab("Output")
+		self._director.record_command_as_successfully_completed()
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _check_tolerance(self, tolerance: float) -> None:
+		if not 0 < tolerance <= APPROXIMATE_LOS_MAXIMUM_TOLERANCE:
+			tolerance_title = "Tolerance out of range"
+			tolerance_message = (
+				f"Tolerance must be more than 0 and at most "
+				f"{APPROXIMATE_LOS_MAXIMUM_TOLERANCE}, not {tolerance}."
+			)
+			raise SpacesError(tolerance_title, tolerance_message)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _print_sample(self, tolerance: float) -> None:
+		nsampled = self._director.similarities_active.n_individ
+		nevaluators = self._director.evaluations_active.nevaluators
+		if nsampled < nevaluators:
+			print(
+				f"\nLine of sight from a random sample of {nsampled} of "
+				f"{nevaluators} individuals, within {tolerance} of all "
+				f"individuals' quantiles with "
+				f"{APPROXIMATE_LOS_CONFIDENCE:.0%} confidence"
+			)
+		else:
+			print(
+				f"\nLine of sight from all {nevaluators} individuals, as a "
+				f"tolerance of {tolerance} needs at least that many"
+			)
+		return
+
+	# ------------------------------------------------------------------------
+
+
 class PairedCommand:
 	"""The paired command is used to get the
 	interpoint distance and similarity for pairs of points.
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+from collections import deque
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import (
+	QLabel,
+	QTableView,
+	QTableWidget,
+	QTextEdit,
+	QVBoxLayout,
+	QWidget,
+)
+
+from constants import LOG_MAXIMUM_ENTRIES
+from table_model import FormattedTableModel
+
+if TYPE_CHECKING:
+	from typing import Any
+	from PySide6.QtCore import (
+		QAbstractItemModel,
+		QModelIndex,
+		QPersistentModelIndex,
+	)
+	from PySide6.QtWidgets import QScrollArea
+
+# --------------------------------------------------------------------------
+
+
+class CommandLog:
+	"""Keeps the Log tab's history of command output.
+
+	Each command's output widget is built once, for the Output tab. When
+	a later command replaces it there, its entry keeps only a record of
+	the command, its parameters and the result data the widget showed,
+	and the widget is deleted. The entry shows only a heading until it is
+	scrolled into view; only then is a widget built from the record and
+	laid out in the Log tab. Beyond maximum_entries, the oldest entries
+	are dropped along with their records.
+	"""
+
+	def __init__(
+		self,
+		scroll_area: QScrollArea,
+		layout: QVBoxLayout,
+		maximum_entries: int = LOG_MAXIMUM_ENTRIES,
+	) -> None:
+		self._layout = layout
+		self._layout.addStretch()
+		self.maximum_entries = maximum_entries
+		self._entries: deque[_LogEntry] = deque()
+		scroll_bar = scroll_area.verticalScrollBar()
+		scroll_bar.valueChanged.connect(self.refresh)
+		scroll_bar.rangeChanged.connect(self.refresh)
+
+	# ------------------------------------------------------------------------
+
+	def add_entry(
+		self, command: str, params: dict[str, Any], output_widget: QWidget
+	) -> None:
+		"""Record the output widget just put in the Output tab.
+
+		The previous entry's output has just been taken out of the Output
+		tab, so it is kept from now on only as a record, from which the Log
+		tab builds it again when it is shown.
+		"""
+		if self._entries:
+			self._entries[-1].release_output()
+		entry = _LogEntry(command, params, output_widget)
+		self._entries.append(entry)
+		# Keep the stretch added in __init__ below the entries
+		self._layout.insertWidget(self._layout.count() - 1, entry)
+		# The latest entry's output is in the Output tab, so always kept
+		while len(self._entries) > max(self.maximum_entries, 1):
+			dropped = self._entries.popleft()
+			self._layout.removeWidget(dropped)
+			dropped.drop()
+		self.refresh()
+		return
+
+	# ------------------------------------------------------------------------
+
+	def refresh(self) -> None:
+		"""Show the output of entries in view once the layout has placed
+		them.
+		"""
+		QTimer.singleShot(0, self._show_visible_output)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _show_visible_output(self) -> None:
+		for entry in self._entries:
+			if not entry.visibleRegion().isEmpty():
+				entry.show_output()
+		return
+
+
+# --------------------------------------------------------------------------
+
+
+class _LogEntry(QWidget):
+	"""A Log tab entry, a heading naming the command and its parameters
+	followed by the command's output once that is shown.
+	"""
+
+	def __init__(
+		self, command: str, params: dict[str, Any], output_widget: QWidget
+	) -> None:
+		super().__init__()
+		self._output_widget: QWidget | None = output_widget
+		self._record: _OutputRecord | None = None
+		heading = command
+		if params:
+			heading += ": " + ", ".join(f"{k}={v}" for k, v in params.items())
+		layout = QVBoxLayout(self)
+		layout.addWidget(QLabel(heading))
+		self._status = QLabel("\tShown in the Output tab")
+		layout.addWidget(self._status)
+
+	def release_output(self) -> None:
+		if self._output_widget is None:
+			return
+		self._record = _OutputRecord(self._output_widget)
+		self._output_widget.deleteLater()
+		self._output_widget = None
+		self._status.setText("\t...")
+
+	def show_output(self) -> None:
+		if self._record is None:
+			return
+		self._status.hide()
+		self.layout().addWidget(self._record.build())
+		self._record = None
+
+	def drop(self) -> None:
+		if self._output_widget is not None:
+			self._output_widget.deleteLater()
+			self._output_widget = None
+		self._record = None
+		self.deleteLater()
+
+
+# --------------------------------------------------------------------------
+
+
+class _OutputRecord:
+	"""What a Log entry needs to rebuild a command's output: the text of
+	its labels and, for a table, the model holding the result data, or
+	for text, the text. A table shown in a QTableWidget is kept as the
+	text and alignment of its cells in a model, so no widget outlives the
+	Output tab.
+	"""
+
+	def __init__(self, output_widget: QWidget) -> None:
+		self.labels: list[str] = []
+		self.model: QAbstractItemModel | None = None
+		self.column_widths: list[int] = []
+		self.headers_hidden = (False, False)
+		self.text: str | None = None
+		self.height = 0
+		layout = output_widget.layout()
+		children = [] if layout is None else [
+			layout.itemAt(i).widget() for i in range(layout.count())
+		]
+		for child in children:
+			if isinstance(child, QLabel):
+				self.labels.append(child.text())
+			elif isinstance(child, QTableView):
+				self._record_table(child)
+			elif isinstance(child, QTextEdit):
+				self.text = child.toPlainText()
+				self.height = child.minimumHeight()
+
+	# ------------------------------------------------------------------------
+
+	def _record_table(self, table: QTableView) -> None:
+		if isinstance(table, QTableWidget):
+			self.model = _table_widget_as_model(table)
+		else:
+			self.model = table.model()
+		self.column_widths = [
+			table.columnWidth(col) for col in range(self.model.columnCount())
+		]
+		self.headers_hidden = (
+			table.horizontalHeader().isHidden(),
+			table.verticalHeader().isHidden(),
+		)
+		if table.minimumHeight() == table.maximumHeight():
+			self.height = table.maximumHeight()
+		return
+
+	# ------------------------------------------------------------------------
+
+	def build(self) -> QWidget:
+		"""Return a widget showing the output as it was in the Output
+		tab.
+		"""
+		widget = QWidget()
+		layout = QVBoxLayout(widget)
+		for label in self.labels:
+			layout.addWidget(QLabel(label))
+		if self.model is not None:
+			table = QTableView()
+			table.setModel(self.model)
+			for col, width in enumerate(self.column_widths):
+				table.setColumnWidth(col, width)
+			table.horizontalHeader().setHidden(self.headers_hidden[0])
+			table.verticalHeader().setHidden(self.headers_hidden[1])
+			if self.height:
+				table.setFixedHeight(self.height)
+			layout.addWidget(table)
+		elif self.text is not None:
+			text = QTextEdit()
+			text.setReadOnly(True)
+			text.setPlainText(self.text)
+			text.setMinimumHeight(self.height)
+			layout.addWidget(text)
+		layout.addStretch()
+		return widget
+
+
+# --------------------------------------------------------------------------
+
+
+def _table_widget_as_model(table: QTableWidget) -> _TableWidgetModel:
+	"""Return the text and alignment of a QTableWidget's cells and its
+	headers in a model, leaving the widget free to be deleted.
+	"""
+	cells = np.empty((table.rowCount(), table.columnCount()), dtype=object)
+	alignments = np.zeros(cells.shape, dtype=np.int64)
+	for row in range(table.rowCount()):
+		for col in range(table.columnCount()):
+			item = table.item(row, col)
+			if item is None:
+				cells[row, col] = ""
+			else:
+				cells[row, col] = item.text()
+				alignments[row, col] = int(item.textAlignment())
+	model = _TableWidgetModel(cells, alignments)
+	for orientation, count, header_item in (
+		(Qt.Orientation.Horizontal, table.columnCount(),
+			table.horizontalHeaderItem),
+		(Qt.Orientation.Vertical, table.rowCount(), table.verticalHeaderItem),
+	):
+		for section in range(count):
+			item = header_item(section)
+			if item is not None:
+				model.setHeaderData(section, orientation, item.text())
+	return model
+
+
+# --------------------------------------------------------------------------
+
+
+class _TableWidgetModel(FormattedTableModel):
+	"""The text of a QTableWidget's cells, each aligned as it was in the
+	widget.
+	"""
+
+	def __init__(self, cells: np.ndarray, alignments: np.ndarray) -> None:
+		super().__init__(cells, "s")
+		self._alignments = alignments
+
+	# ------------------------------------------------------------------------
+
+	def data(
+		self,
+		index: QModelIndex | QPersistentModelIndex,
+		role: int = Qt.ItemDataRole.DisplayRole,
+	) -> str | Qt.AlignmentFlag | None:
+		if index.isValid() and role == Qt.ItemDataRole.TextAlignmentRole:
+			alignment = int(self._alignments[index.row(), index.column()])
+			# Cells never aligned keep the view's default
+			return Qt.AlignmentFlag(alignment) if alignment else None
+		return super().data(index, role)
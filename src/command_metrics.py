@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import ctypes
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from collections.abc import Iterator
+	from director import Status
+
+# --------------------------------------------------------------------------
+
+
+@dataclass
+class CommandMetrics:
+	"""Resources used by one command, stored in director.command_metrics
+	at the same index as its entry in commands_used and command_exit_code.
+
+	peak_rss_delta_bytes is how far the command raised the process's peak
+	resident set size, so it is zero for a command that stayed within
+	memory already used by an earlier one.
+	"""
+
+	wall_seconds: float
+	cpu_seconds: float
+	peak_rss_delta_bytes: int
+	undo_snapshot_bytes: int | None = None
+
+
+# --------------------------------------------------------------------------
+
+METRICS_HEADINGS = ["Wall s", "CPU s", "Peak RSS +MB", "Undo MB"]
+
+
+def format_metrics(metrics: CommandMetrics | None) -> list[str]:
+	"""Return the metrics as strings under METRICS_HEADINGS, blank for a
+	command that is still running or was not measured.
+	"""
+	if metrics is None:
+		return ["", "", "", ""]
+	undo_mb = (
+		"" if metrics.undo_snapshot_bytes is None
+		else f"{metrics.undo_snapshot_bytes / 1_048_576:.2f}"
+	)
+	formatted = [
+		f"{metrics.wall_seconds:.3f}",
+		f"{metrics.cpu_seconds:.3f}",
+		f"{metrics.peak_rss_delta_bytes / 1_048_576:.1f}",
+		undo_mb,
+	]
+	return formatted
+
+
+# --------------------------------------------------------------------------
+
+COMMAND_STATUSES = {
+	1: "Failed",
+	0: "Completed successfully",
+	-1: "In process",
+}
+
+
+def describe_exit_code(exit_code: int) -> str:
+	"""Return the status shown in History for a command's exit code."""
+	return COMMAND_STATUSES.get(exit_code, "Unknown status")
+
+
+# --------------------------------------------------------------------------
+
+
+def peak_rss_bytes() -> int:
+	"""Return the peak resident set size of this process so far."""
+	if sys.platform == "win32":
+		return _peak_working_set_bytes()
+	import resource  # noqa: PLC0415
+
+	max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	# Linux reports kilobytes, macOS reports bytes
+	if sys.platform == "darwin":
+		return max_rss
+	return max_rss * 1024
+
+
+# --------------------------------------------------------------------------
+
+
+class _ProcessMemoryCounters(ctypes.Structure):
+	_fields_ = (
+		("cb", ctypes.c_ulong),
+		("PageFaultCount", ctypes.c_ulong),
+		("PeakWorkingSetSize", ctypes.c_size_t),
+		("WorkingSetSize", ctypes.c_size_t),
+		("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+		("QuotaPagedPoolUsage", ctypes.c_size_t),
+		("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+		("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+		("PagefileUsage", ctypes.c_size_t),
+		("PeakPagefileUsage", ctypes.c_size_t),
+	)
+
+
+def _peak_working_set_bytes() -> int:
+	counters = _ProcessMemoryCounters()
+	counters.cb = ctypes.sizeof(counters)
+	windll = ctypes.windll  # type: ignore[attr-defined]
+	windll.psapi.GetProcessMemoryInfo(
+		windll.kernel32.GetCurrentProcess(),
+		ctypes.byref(counters),
+		counters.cb,
+	)
+	return counters.PeakWorkingSetSize
+
+
+# --------------------------------------------------------------------------
+
+
+@contextmanager
+def measure_command(director: Status) -> Iterator[None]:
+	"""Record the metrics of the command dispatched inside the block.
+
+	The command is the first one the block appends to commands_used;
+	commands it runs in turn, such as those in a script, are measured by
+	their own dispatch. Nothing is recorded if the block fails before the
+	command is started.
+	"""
+	first_index = len(director.commands_used)
+	wall_began = time.perf_counter()
+	cpu_began = time.process_time()
+	rss_began = peak_rss_bytes()
+	try:
+		yield
+	finally:
+		if len(director.command_metrics) > first_index:
+			metrics = CommandMetrics(
+				wall_seconds=time.perf_counter() - wall_began,
+				cpu_seconds=time.process_time() - cpu_began,
+				peak_rss_delta_bytes=peak_rss_bytes() - rss_began,
+			)
+			cmd_state = director.command_states[first_index]
+			if cmd_state is not None:
+				metrics.undo_snapshot_bytes = (
+					cmd_state.estimate_size_in_bytes()
+				)
+			director.command_metrics[first_index] = metrics
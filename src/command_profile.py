@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import cProfile
+import pstats
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from typing import TYPE_CHECKING
+
+from constants import PROFILE_DIRECTORY, PROFILE_TOP_FUNCTIONS
+
+if TYPE_CHECKING:
+	from collections.abc import Iterator
+	from director import Status
+
+# --------------------------------------------------------------------------
+
+
+class CommandProfiler:
+	"""Runs the next commands_remaining commands under cProfile.
+
+	Each profiled command is saved as a .prof file named after the command
+	and the time it started, which snakeviz or pstats can open, and its
+	slowest functions by cumulative time are printed to the Record tab.
+	Commands run by a profiled command, such as those in a script, are
+	part of its profile rather than profiled separately.
+	"""
+
+	def __init__(self) -> None:
+		self.commands_remaining: int = 0
+		self._active: bool = False
+
+	# ------------------------------------------------------------------------
+
+	@contextmanager
+	def profile(self, director: Status) -> Iterator[None]:
+		"""Profile the command dispatched inside the block if profiling is
+		switched on and no enclosing command is being profiled.
+		"""
+		if self.commands_remaining <= 0 or self._active:
+			yield
+			return
+		self.commands_remaining -= 1
+		first_index = len(director.commands_used)
+		started = datetime.now()  # noqa: DTZ005
+		profiler = cProfile.Profile()
+		self._active = True
+		try:
+			profiler.enable()
+			yield
+		finally:
+			profiler.disable()
+			self._active = False
+			if len(director.commands_used) > first_index:
+				command = director.commands_used[first_index]
+				file_name = self._save_profile(profiler, command, started)
+				self._print_slowest_functions(profiler, command, file_name)
+			if self.commands_remaining == 0:
+				director.show_profiling_switched_off()
+
+	# ------------------------------------------------------------------------
+
+	def _save_profile(
+		self, profiler: cProfile.Profile, command: str, started: datetime
+	) -> Path:
+		Path(PROFILE_DIRECTORY).mkdir(exist_ok=True)
+		file_name = Path(PROFILE_DIRECTORY) / (
+			f"{command.replace(' ', '_')}_"
+			f"{started.strftime('%Y%m%d_%H%M%S_%f')}.prof"
+		)
+		profiler.dump_stats(file_name)
+		return file_name
+
+	# ------------------------------------------------------------------------
+
+	def _print_slowest_functions(
+		self, profiler: cProfile.Profile, command: str, file_name: Path
+	) -> None:
+		print(
+			f"\n\tProfile of {command} written to {file_name}\n"
+			f"\tSlowest {PROFILE_TOP_FUNCTIONS} functions by cumulative time:"
+		)
+		stats = pstats.Stats(profiler, stream=sys.stdout)
+		stats.sort_stats(pstats.SortKey.CUMULATIVE)
+		stats.print_stats(PROFILE_TOP_FUNCTIONS)
+		return
@@ -3,6 +3,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, cast
 import copy
 import pickle
+import sys
+import numpy as np
 import pandas as pd
 import weakref
 from types import SimpleNamespace
@@ -11,17 +13,9 @@ if TYPE_CHECKING:
 	from collections.abc import Callable
 	from director import Status
 
-# Import for type checking unpickleable objects
-# Declare types that may not be available
-FigureCanvasQTAgg: type | None = None
-Figure: type | None = None
-
-try:
-	from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
-	from matplotlib.figure import Figure
-	MATPLOTLIB_AVAILABLE = True
-except ImportError:
-	MATPLOTLIB_AVAILABLE = False
+# matplotlib is deliberately not imported here: it is loaded lazily by the
+# presentation layer, and until it has been loaded no Figure can exist.
+# FigureCanvasQTAgg is a QWidget and is covered by the QWidget entry.
 
 QWidget: type | None = None
 
@@ -41,13 +35,37 @@ SKIP_TYPES = (
 	weakref.CallableProxyType,
 )
 
-if MATPLOTLIB_AVAILABLE:
-	SKIP_TYPES += (FigureCanvasQTAgg, Figure)
-
 if QT_AVAILABLE:
 	SKIP_TYPES += (QWidget,)
 
 
+def _types_to_skip() -> tuple[type, ...]:
+	"""Return SKIP_TYPES plus matplotlib's Figure once matplotlib is loaded."""
+	matplotlib_figure = sys.modules.get("matplotlib.figure")
+	if matplotlib_figure is None:
+		return SKIP_TYPES
+	skip_types = (*SKIP_TYPES, matplotlib_figure.Figure)
+	return skip_types
+
+
+def _is_shared(obj: object) -> bool:
+	"""Whether obj is evaluations mapped from a file or a spatial index over
+	scores, neither of which changes once made, so that snapshots refer to
+	it rather than copying it.
+	"""
+	respondent_index = sys.modules.get("respondent_index")
+	if respondent_index is not None and isinstance(
+		obj, respondent_index.RespondentIndex
+	):
+		return True
+	mapped_evaluations = sys.modules.get("mapped_evaluations")
+	if mapped_evaluations is None:
+		return False
+	return isinstance(
+		obj, mapped_evaluations.MappedEvaluations
+	) or mapped_evaluations.is_mapped_frame(obj)
+
+
 def _handle_basic_types_and_memo(
 	obj: object, memo: dict
 ) -> tuple[bool, object] | None:
@@ -61,9 +79,13 @@ def _handle_basic_types_and_memo(
 		return (True, obj)
 
 	# Handle types to skip (weakrefs, UI objects)
-	if isinstance(obj, SKIP_TYPES):
+	if isinstance(obj, _types_to_skip()):
 		return (True, None)
 
+	# Share data that cannot change, such as that mapped from files
+	if _is_shared(obj):
+		return (True, obj)
+
 	# Check memo to avoid infinite recursion
 	obj_id = id(obj)
 	if obj_id in memo:
@@ -224,6 +246,53 @@ def _copy_feature_state[T](feature_obj: T) -> T:
 # ----------------------------------------------------------------------------
 
 
+def _estimate_size_in_bytes(obj: object, seen: set[int]) -> int:
+	"""Estimate the memory held by obj, following the same structure as
+	_copy_feature_state and counting each object only once.
+	"""
+	if (
+		obj is None
+		or id(obj) in seen
+		or isinstance(obj, _types_to_skip())
+		or _is_shared(obj)
+	):
+		return 0
+	seen.add(id(obj))
+
+	# Only Python objects, such as strings, need a pass over the values;
+	# numeric data is counted from its buffers
+	if isinstance(obj, pd.DataFrame):
+		deep = obj.index.dtype.kind == "O" or any(
+			dtype.kind == "O" for dtype in obj.dtypes
+		)
+		return int(obj.memory_usage(deep=deep).sum())
+	if isinstance(obj, pd.Series):
+		deep = obj.index.dtype.kind == "O" or obj.dtype.kind == "O"
+		return int(obj.memory_usage(deep=deep))
+	if isinstance(obj, np.ndarray):
+		return obj.nbytes
+
+	size = sys.getsizeof(obj)
+	if isinstance(obj, dict):
+		size += sum(
+			_estimate_size_in_bytes(key, seen)
+			+ _estimate_size_in_bytes(value, seen)
+			for key, value in obj.items()
+		)
+	elif isinstance(obj, (list, tuple, set)):
+		size += sum(_estimate_size_in_bytes(item, seen) for item in obj)
+	elif hasattr(obj, "__dict__"):
+		size += sum(
+			_estimate_size_in_bytes(value, seen)
+			for name, value in vars(obj).items()
+			if name != "_director"
+		)
+	return size
+
+
+# ----------------------------------------------------------------------------
+
+
 class CommandState:
 	"""Captures application state before command execution for undo support.
 
@@ -746,5 +815,16 @@ class CommandState:
 		self.restore_rivalry_state(director)
 		self.restore_settings_state(director)
 
+	# ------------------------------------------------------------------------
+
+	def estimate_size_in_bytes(self) -> int:
+		"""Estimate the memory held by this state, mostly the feature
+		copies in state_snapshot, for the History command's metrics.
+		"""
+		seen: set[int] = set()
+		size = _estimate_size_in_bytes(self.command_params, seen)
+		size += _estimate_size_in_bytes(self.state_snapshot, seen)
+		return size
+
 
 # ----------------------------------------------------------------------------
@@ -6,6 +6,8 @@ import io
 # import copy
 # import itertools
 import math
+import zipfile
+from contextlib import contextmanager
 from pathlib import Path
 
 # Third-party imports
@@ -13,29 +15,31 @@ import numpy as np
 import pandas as pd
 from peek import peek # noqa: F401
 
-from pyqtgraph.Qt import QtCore
+from PySide6 import QtCore
 from PySide6.QtPrintSupport import QPrinter, QPrintDialog
 from PySide6.QtGui import QFont, QTextDocument
 from PySide6.QtWidgets import (
 	QDialog,
 	QInputDialog,
 	QMessageBox,
+	QTableView,
 	QTableWidget,
-	QTableWidgetItem,
 )
-from scipy.stats import spearmanr
-from sklearn import manifold
 
 # Local application imports
 from dialogs import SetValueDialog
 
 from constants import (
+	BINARY_TABLE_SUFFIXES,
+	EVALUATIONS_CHUNK_ROWS,
 	EXHAUSTED_EVALUATIONS,
 	MAXIMUM_NUMBER_OF_DIMENSIONS_FOR_PLOTTING,
 	MAXIMUM_NUMBER_OF_EVALUATORS,
 	MINIMUM_SIZE_FOR_PLOT,
 	MUST_HAVE_TWO_FIELDS,
+	PARQUET_TYPE_KEY,
 	REQUIRED_NUMBER_OF_FIELDS_IN_CONFIGURATION_FILE_LINE,
+	TABLE_MAXIMUM_ROWS_SIZED,
 )
 from exceptions import (
 	DependencyError,
@@ -47,12 +51,17 @@ from exceptions import (
 	UnknownTypeError,
 )
 
+from evaluation_pairs import EvaluationPairs, sample_size_for_tolerance
 from geometry import PlotExtremes
+from sample_design import SAMPLE_DESIGN_FILE_TYPE, SampleDesign
+from table_model import FormattedTableModel
 from typing import Any, TextIO, TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
-	from collections.abc import Callable
+	from collections.abc import Callable, Iterator
 	from command_state import CommandState
+	from mapped_evaluations import MappedEvaluations
+	from modelmenu import UncertaintyAnalysis
 	from spaces import Status
 	from features import (
 		ConfigurationFeature,
@@ -118,6 +127,8 @@ class Spaces:
 		self.focal_index: int = 0
 		self.point_index: int = 0
 		self.cutoff: float = 0.0
+		self.name_source: str = ""
+		self.n_clusters: int = 0
 		self.redone_command_name: str = ""
 		self.undone_command_name: str = ""
 		self.commands_executed: int = 0
@@ -157,9 +168,11 @@ class Spaces:
 		self._director.commands_used.append(self._director.command)
 		self._director.command_exit_code.append(-1)  # -1 command is in process
 		self._director.command_states.append(None)  # Updated when state pushed
+		self._director.command_metrics.append(None)  # Set when command returns
 		print(f"\nStarting {self._director.command} command: \n")
 
 		active_commands = ( # noqa: F841
+			"Append evaluations", "Approximate line of sight",
 			"Center", "Cluster", "Compare", "Configuration", "Correlations",
 			"Deactivate", "Evaluations", "Factor analysis",
 			"Factor analysis machine learning", "Grouped data", "Individuals",
@@ -187,10 +200,12 @@ class Spaces:
 			"Print evaluations", "Print grouped data", "Print individuals",
 			"Print sample design", "Print sample repetitions",
 			"Print sample solutions", "Print scores",
-			"Print similarities", "Print target", "Ranks differences",
+			"Print similarities", "Print target", "Profile",
+			"Ranks differences",
 			"Ranks distances", "Ranks similarities",
 			"Save configuration",
-			"Save correlations", "Save individuals", "Save sample design",
+			"Save correlations", "Save history", "Save individuals",
+			"Save sample design",
 			"Save sample repetitions", "Save sample solutions",
 			"Save scores", "Save similarities","Save target",
 			"Second dimension", "Segments","Shepard",
@@ -225,74 +240,31 @@ class Spaces:
 	def create_sample_design_analysis_table(self) -> pd.DataFrame:
 		"""Create a DataFrame containing sample design analysis data.
 
-		This function processes the sample design frequencies data and creates
-		a structured DataFrame with counts and percentages for selected and
-		not selected cases across repetitions.
+		The counts of selected and not selected cases in each repetition
+		come pivoted from the sample design frequencies, with the
+		percentages computed for all repetitions at once.
 
 		Returns:
 			pd.DataFrame: Analysis table with columns for repetition number,
 			selected counts and percentages, and not selected counts and
 			percentages.
 		"""
-		# Get the number of repetitions
-		nrepetitions = self._director.uncertainty_active.nrepetitions
-
-		# Initialize our results DataFrame
-		sample_design_analysis_df = pd.DataFrame(
-			columns=pd.Index([
-				"Repetition",
-				"Selected Count",
-				"Selected Percent",
-				"Not Selected Count",
-				"Not Selected Percent",
-			])
+		counts = self._director.uncertainty_active.selection_counts()
+		totals = counts.sum(axis=1, keepdims=True)
+		percents = np.divide(
+			counts * 100,
+			totals,
+			out=np.zeros(counts.shape),
+			where=totals > 0,
 		)
 
-		# Get the frequencies data
-		frequencies_df = (
-			self._director.uncertainty_active.sample_design_frequencies
-		)
-
-		# Process each repetition
-		for repetition in range(1, nrepetitions + 1):
-			# Filter data for this repetition
-			rep_data = frequencies_df[
-				frequencies_df["Repetition"] == repetition
-			]
-
-			# Get selected row (True) and not selected row (False)
-			selected_row = rep_data[rep_data["Selected"] == True]  # noqa: E712
-			not_selected_row = rep_data[rep_data["Selected"] == False]  # noqa: E712
-
-			# Extract counts
-			selected_count = (
-				selected_row["Count"].to_numpy()[0]
-				if not selected_row.empty
-				else 0
-			)
-			not_selected_count = (
-				not_selected_row["Count"].to_numpy()[0]
-				if not not_selected_row.empty
-				else 0
-			)
-
-			# Calculate total and percentages
-			total = selected_count + not_selected_count
-			selected_percent = (
-				(selected_count / total * 100) if total > 0 else 0
-			)
-			not_selected_percent = (
-				(not_selected_count / total * 100) if total > 0 else 0
-			)
-
-			# Add row to results DataFrame
-			sample_design_analysis_df.loc[len(sample_design_analysis_df)] = [
-				repetition,
-				selected_count,
-				selected_percent,
-				not_selected_count,
-				not_selected_percent,
-			]
+		sample_design_analysis_df = pd.DataFrame({
+			"Repetition": np.arange(1, len(counts) + 1),
+			"Selected Count": counts[:, 0],
+			"Selected Percent": percents[:, 0],
+			"Not Selected Count": counts[:, 1],
+			"Not Selected Percent": percents[:, 1],
+		})
 		self._director.uncertainty_active.sample_design_analysis_df = (
 			sample_design_analysis_df
 		)
@@ -406,11 +378,10 @@ class Spaces:
 		group_name: str,
 		group_code: set,
 	) -> list:
-		in_group_list = [
-			segments.loc[ind, score]
-			for ind in range(nscored)
-			if segments.loc[ind, group_name] in group_code
-		]
+		scored = segments.iloc[:nscored]
+		in_group_list = scored.loc[
+			scored[group_name].isin(group_code), score
+		].tolist()
 		return in_group_list
 
 	# ------------------------------------------------------------------------
@@ -423,11 +394,10 @@ class Spaces:
 		group_name: str,
 		group_code: set,
 	) -> list:
-		not_in_group_list = [
-			segments.loc[ind, score]
-			for ind in range(nscored)
-			if segments.loc[ind, group_name] not in group_code
-		]
+		scored = segments.iloc[:nscored]
+		not_in_group_list = scored.loc[
+			~scored[group_name].isin(group_code), score
+		].tolist()
 		return not_in_group_list
 
 	# -----------------------------------------------------------------------
@@ -1124,7 +1094,7 @@ class Spaces:
 	# ------------------------------------------------------------------------
 
 	def have_sample_design(self) -> bool:
-		return not self._director.uncertainty_active.sample_design.empty
+		return self._director.uncertainty_active.sample_design is not None
 
 	# ------------------------------------------------------------------------
 
@@ -1177,6 +1147,11 @@ class Spaces:
 
 	# ------------------------------------------------------------------------
 
+	def have_uncertainty(self) -> bool:
+		return self._director.uncertainty_active.have_point_statistics()
+
+	# ------------------------------------------------------------------------
+
 	def declare_file_type_and_size(
 		self,
 		file_handle: TextIO,
@@ -1210,21 +1185,69 @@ class Spaces:
 
 	# ------------------------------------------------------------------------
 
-	def los(self, evaluations: EvaluationsFeature) -> SimilaritiesFeature:
-		"""Line of sight analysis to extract similarities from evaluations."""
+	def los(
+		self,
+		evaluations: EvaluationsFeature,
+		pairs: EvaluationPairs | None = None,
+		cases: np.ndarray | None = None,
+	) -> SimilaritiesFeature:
+		"""Line of sight analysis to extract similarities from evaluations.
+
+		When pairs, the pair sums and differences of a larger set of
+		individuals, is given, those of the individuals at positions cases
+		in it are used rather than computing them from evaluations again.
+		"""
 		line_of_sight = self._initialize_similarities_feature(evaluations)
-		df = self._apply_reflection_if_needed(evaluations.evaluations)
-		sums_s_star, diffs_d_star = self._calculate_sums_and_diffs(
-			df, line_of_sight.nreferent
+		if pairs is None:
+			pairs = EvaluationPairs(evaluations.evaluations)
+		sums_s_star, diffs_d_star = pairs.reflected_sums_and_differences(
+			cases
 		)
 		ordered = self._create_ranked_data(
-			sums_s_star, diffs_d_star, line_of_sight
+			sums_s_star, diffs_d_star, pairs.pair_names, line_of_sight
 		)
 		best_ranking = self._find_best_ranking(ordered, evaluations)
 		self._build_final_similarities(line_of_sight, best_ranking)
 
 		return line_of_sight
 
+	def approximate_los(
+		self,
+		evaluations: EvaluationsFeature,
+		tolerance: float,
+		rng: np.random.Generator | None = None,
+	) -> SimilaritiesFeature:
+		"""Line of sight from a random sample of the individuals, large
+		enough that each pair's sums and differences are within tolerance,
+		as quantiles, of those of all individuals.
+
+		Line of sight ranks the pairs on their sorted sums and differences,
+		that is on their quantiles, so a sample with the same quantiles
+		ranks them nearly the same at a fraction of the sorting. When the
+		sample would hold everyone, this is line of sight itself. The
+		similarities' n_individ is the number of individuals sampled.
+		"""
+		from features import EvaluationsFeature  # noqa: PLC0415
+
+		npairs = evaluations.nreferent * (evaluations.nreferent - 1) // 2
+		sample_size = sample_size_for_tolerance(tolerance, npairs)
+		if sample_size >= evaluations.nevaluators:
+			return self.los(evaluations)
+		if rng is None:
+			rng = np.random.default_rng()
+		cases = np.sort(
+			rng.choice(evaluations.nevaluators, sample_size, replace=False)
+		)
+		sample = EvaluationsFeature(self._director)
+		sample.evaluations = evaluations.evaluations.iloc[cases]
+		sample.nreferent = evaluations.nreferent
+		sample.nitem = evaluations.nitem
+		sample.range_items = evaluations.range_items
+		sample.item_names = evaluations.item_names
+		sample.item_labels = evaluations.item_labels
+		sample.nevaluators = sample_size
+		return self.los(sample)
+
 	def _initialize_similarities_feature(
 		self, evaluations: EvaluationsFeature
 	) -> SimilaritiesFeature:
@@ -1266,44 +1289,11 @@ class Spaces:
 
 		return line_of_sight
 
-	def _apply_reflection_if_needed(
-		self, df_orig: pd.DataFrame
-	) -> pd.DataFrame:
-		"""Apply reflection transformation to the data if needed."""
-		reflect = "Yes"
-		if reflect == "Yes":
-			return df_orig.apply(lambda x: x.max() - x)
-		return df_orig
-
-	def _calculate_sums_and_diffs(
-		self, df: pd.DataFrame, nreferent: int
-	) -> tuple[pd.DataFrame, pd.DataFrame]:
-		"""Calculate sum and difference matrices for all item pairs."""
-		sums_s_star = pd.DataFrame()
-		diffs_d_star = pd.DataFrame()
-		n_items_less_one = nreferent - 1
-
-		for an_item in range(n_items_less_one):
-			to_pts = range(an_item + 1, nreferent)
-			for another_item in to_pts:
-				new_name = str(
-					df.columns[an_item] + "_" + df.columns[another_item]
-				)
-				sums_s_star[new_name] = (
-					df[str(df.columns[an_item])]
-					+ df[str(df.columns[another_item])]
-				)
-				diffs_d_star[new_name] = abs(
-					df[str(df.columns[an_item])]
-					- df[str(df.columns[another_item])]
-				)
-
-		return sums_s_star, diffs_d_star
-
 	def _create_ranked_data(
 		self,
-		sums_s_star: pd.DataFrame,
-		diffs_d_star: pd.DataFrame,
+		sums_s_star: np.ndarray,
+		diffs_d_star: np.ndarray,
+		pair_names: list[str],
 		line_of_sight: SimilaritiesFeature,
 	) -> pd.DataFrame:
 		"""Create ranked data from sums and differences."""
@@ -1313,26 +1303,12 @@ class Spaces:
 		)
 		line_of_sight.range_similarities = range(line_of_sight.n_pairs)
 
-		sumsort_s = sums_s_star.copy()
-		diffsort_d = diffs_d_star.copy()
-
-		# Sort columns in each dataframe
-		for each_row in line_of_sight.range_similarities:
-			a_col = list(sums_s_star[str(sums_s_star.columns[each_row])])
-			a_col.sort()
-			sumsort_s[str(sums_s_star.columns[each_row])] = a_col
-
-			a_col = list(diffs_d_star[str(diffs_d_star.columns[each_row])])
-			a_col.sort(reverse=True)
-			diffsort_d[str(diffs_d_star.columns[each_row])] = a_col
-
-		# Combine and create cumulative sums
-		combo_b = sumsort_s + diffsort_d
-		cum_b_hat = pd.DataFrame()
-		for each_pair in line_of_sight.range_similarities:
-			cum_b_hat[str(diffs_d_star.columns[each_pair])] = combo_b[
-				str(diffs_d_star.columns[each_pair])
-			].cumsum(axis=0)
+		# Each pair's sums in ascending and differences in descending
+		# order, missing ones last, combined and cumulated
+		combo_b = np.sort(sums_s_star, axis=0) - np.sort(-diffs_d_star, axis=0)
+		cum_b_hat = pd.DataFrame(
+			combo_b.astype(np.float64), columns=pd.Index(pair_names)
+		).cumsum(axis=0)
 
 		return cum_b_hat.rank(axis=1, method="average")
 
@@ -1340,6 +1316,8 @@ class Spaces:
 		self, ordered: pd.DataFrame, evaluations: EvaluationsFeature
 	) -> pd.Series:
 		"""Find the best ranking through optimization."""
+		from scipy.stats import spearmanr  # noqa: PLC0415
+
 		# Calculate iteration control parameter (unused but preserved)
 		if evaluations.nevaluators < MAXIMUM_NUMBER_OF_EVALUATORS:
 			_itcon = 4
@@ -1400,7 +1378,12 @@ class Spaces:
 		extract_ndim: int,
 		use_metric: bool,  # noqa: FBT001
 		similarities: SimilaritiesFeature,
+		random_state: int | None = None,
 	) -> ConfigurationFeature:
+		"""Solve for extract_ndim dimensions from the best of several
+		random starts, drawn from random_state when it is given.
+		"""
+		from sklearn import manifold  # noqa: PLC0415
 		from features import ConfigurationFeature  # noqa: PLC0415
 
 		configuration = ConfigurationFeature(self._director)
@@ -1412,6 +1395,7 @@ class Spaces:
 			metric_mds=use_metric,
 			init='random',
 			n_init=10,
+			random_state=random_state,
 			verbose=0,
 			normalized_stress="auto",
 		)
@@ -1612,9 +1596,23 @@ class Spaces:
 	def needs_sample_solutions(self, command: str) -> bool:
 		if not self.have_sample_solutions():
 			title = "No Sample solutions have been established."
+			message = (
+				"Open a Sample solutions file or use Model Uncertainty,"
+				" keeping every solution, to establish one before using "
+				f"{command}."
+			)
+			raise DependencyError(title, message)
+
+		return False
+
+	# ------------------------------------------------------------------------
+
+	def needs_uncertainty(self, command: str) -> bool:
+		if not self.have_uncertainty():
+			title = "No uncertainty has been established."
 			message = (
 				"Open a Sample solutions file or use Model Uncertainty"
-				" to establish one before using "
+				" to establish it before using "
 				f"{command}."
 			)
 			raise DependencyError(title, message)
@@ -1898,9 +1896,34 @@ class Spaces:
 	# ------------------------------------------------------------------------
 
 	def read_sample_design_file_check_for_errors(
-		self, file_name: str, uncertainty_active: object
+		self, file_name: str, uncertainty_active: UncertaintyAnalysis
 	) -> None:
-		"""Read sample design file (stub implementation)."""
+		"""Read a sample design file written by Save sample design,
+		raising ValueError when it is not one.
+		"""
+		file_type = self._read_file_type(
+			file_name, Path(file_name).suffix.lower()
+		)
+		self._check_file_type(file_type, SAMPLE_DESIGN_FILE_TYPE)
+		sample_design = SampleDesign.read(file_name)
+		sample_design_frequencies = sample_design.frequencies()
+
+		uncertainty_active.universe_size = sample_design.universe_size
+		uncertainty_active.nrepetitions = sample_design.nrepetitions
+		uncertainty_active.probability_of_inclusion = (
+			sample_design.probability_of_inclusion
+		)
+		uncertainty_active.sample_design = sample_design
+		uncertainty_active.sample_design_nrepetitions = (
+			sample_design.nrepetitions
+		)
+		uncertainty_active.sample_design_frequencies = (
+			sample_design_frequencies
+		)
+		uncertainty_active.sample_design_frequencies_as_json = (
+			sample_design_frequencies.to_json(orient="records")
+		)
+		return
 
 	# ------------------------------------------------------------------------
 
@@ -2245,16 +2268,25 @@ class Spaces:
 
 	@staticmethod
 	def resize_and_set_table_size(
-		gui_output_as_widget: QTableWidget, fudge: int
+		gui_output_as_widget: QTableView, fudge: int
 	) -> None:
-		n_rows = gui_output_as_widget.rowCount()
+		n_rows = gui_output_as_widget.model().rowCount()
 		#
 		gui_output_as_widget.resizeColumnsToContents()
-		gui_output_as_widget.resizeRowsToContents()
+		if n_rows <= TABLE_MAXIMUM_ROWS_SIZED:
+			gui_output_as_widget.resizeRowsToContents()
+			height_of_rows = sum(
+				[gui_output_as_widget.rowHeight(row) for row in range(n_rows)]
+			)
+		else:
+			# Size the rows like the first one and show a screenful, so
+			# the rest are only formatted when scrolled into view
+			row_height = gui_output_as_widget.sizeHintForRow(0)
+			gui_output_as_widget.verticalHeader().setDefaultSectionSize(
+				row_height
+			)
+			height_of_rows = TABLE_MAXIMUM_ROWS_SIZED * row_height
 		#
-		height_of_rows = sum(
-			[gui_output_as_widget.rowHeight(row) for row in range(n_rows)]
-		)
 		height_of_header = gui_output_as_widget.horizontalHeader().height()
 		gui_output_as_widget.setFixedHeight(
 			height_of_rows + height_of_header + fudge
@@ -2265,7 +2297,7 @@ class Spaces:
 
 	def set_column_and_row_headers(
 		self,
-		table_widget: QTableWidget,
+		table_widget: QTableView,
 		column_header: list[str],
 		row_header: list[str],
 	) -> None:
@@ -2273,7 +2305,9 @@ class Spaces:
 		if len(column_header) == 0:
 			table_widget.horizontalHeader().hide()
 		else:
-			table_widget.setHorizontalHeaderLabels(column_header)
+			self.set_header_labels(
+				table_widget, QtCore.Qt.Orientation.Horizontal, column_header
+			)
 			table_widget.horizontalHeader().setStyleSheet(
 				f"QHeaderView::section"
 				f"{{ background-color: {self._director.column_header_color} }}"
@@ -2281,7 +2315,9 @@ class Spaces:
 		if len(row_header) == 0:
 			table_widget.verticalHeader().hide()
 		else:
-			table_widget.setVerticalHeaderLabels(row_header)
+			self.set_header_labels(
+				table_widget, QtCore.Qt.Orientation.Vertical, row_header
+			)
 			table_widget.verticalHeader().setStyleSheet(
 				f"QHeaderView::section"
 				f"{{ background-color: {self._director.row_header_color} }}"
@@ -2291,106 +2327,37 @@ class Spaces:
 	# ------------------------------------------------------------------------
 
 	@staticmethod
-	def fill_table_with_formatted_data(
-		table_widget: QTableWidget,
-		data: pd.DataFrame,
-		format_spec: str | list[str],
-	) -> None:
-		"""Fill a table widget with formatted data from a DataFrame"""
-		use_column_specific_formats = isinstance(format_spec, list)
-
-		for row in range(data.shape[0]):
-			for col in range(data.shape[1]):
-				Spaces._fill_single_cell(
-					table_widget, data, row, col, format_spec,
-					use_column_specific_formats=use_column_specific_formats
-				)
-
-	@staticmethod
-	def _fill_single_cell(
-		table_widget: QTableWidget,
-		data: pd.DataFrame,
-		row: int,
-		col: int,
-		format_spec: str | list[str],
-		*,
-		use_column_specific_formats: bool,
+	def set_header_labels(
+		table_widget: QTableView,
+		orientation: QtCore.Qt.Orientation,
+		labels: list[str],
 	) -> None:
-		"""Fill a single cell with formatted data"""
-		try:
-			value = data.iloc[row, col]
-			column_format = Spaces._get_column_format(
-				format_spec, col,
-				use_column_specific_formats=use_column_specific_formats
-			)
-			formatted_value = Spaces._format_cell_value(value, column_format)
-			item = QTableWidgetItem(formatted_value)
-			Spaces._set_cell_alignment(item, column_format)
-			table_widget.setItem(row, col, item)
-		except (ValueError, TypeError) as e:
-			Spaces._handle_cell_format_error(
-				table_widget, row, col, e, value, column_format, format_spec
-			)
-
-	@staticmethod
-	def _get_column_format(
-		format_spec: str | list[str],
-		col: int,
-		*,
-		use_column_specific_formats: bool,
-	) -> str:
-		"""Get the format string for a specific column"""
-		if use_column_specific_formats and col < len(format_spec):
-			return format_spec[col]
-		# If format_spec is a list, return first element as default
-		if isinstance(format_spec, list):
-			return format_spec[0] if format_spec else ""
-		return format_spec
-
-	@staticmethod
-	def _format_cell_value(value: str | float, column_format: str) \
-		-> str:
-		"""Format a single cell value according to the column format"""
-		if column_format == "d":
-			if isinstance(value, (int, float)):
-				return str(int(value))
-			return str(value)
-		if column_format == "s":
-			return str(value)
-		if isinstance(value, (int, float)):
-			return f"{value:{column_format}}"
-		return str(value)
+		"""Label a table widget's columns or rows, or a table view's through
+		its model
+		"""
+		if isinstance(table_widget, QTableWidget):
+			if orientation == QtCore.Qt.Orientation.Horizontal:
+				table_widget.setHorizontalHeaderLabels(labels)
+			else:
+				table_widget.setVerticalHeaderLabels(labels)
+			return
+		model = table_widget.model()
+		for section, label in enumerate(labels):
+			model.setHeaderData(section, orientation, label)
+		return
 
-	@staticmethod
-	def _set_cell_alignment(
-		item: QTableWidgetItem, column_format: str
-	) -> None:
-		"""Set the alignment for a table widget item based on format"""
-		if column_format == "s":
-			alignment = (
-#				QtCore.AlignLeft |
-				QtCore.Qt.AlignmentFlag.AlignLeft |
-				QtCore.Qt.AlignmentFlag.AlignVCenter)
-		else:
-			alignment = (QtCore.Qt.AlignmentFlag.AlignCenter |
-				QtCore.Qt.AlignmentFlag.AlignVCenter)
-		item.setTextAlignment(alignment)
+	# ------------------------------------------------------------------------
 
 	@staticmethod
-	def _handle_cell_format_error(
-		table_widget: QTableWidget,
-		row: int,
-		col: int,
-		error: Exception,
-		value: object,
-		column_format: str,
+	def fill_table_with_formatted_data(
+		table_widget: QTableView,
+		data: pd.DataFrame,
 		format_spec: str | list[str],
 	) -> None:
-		"""Handle errors that occur when formatting cell values"""
-		print(f"Error formatting cell ({row}, {col}): {error!s}")
-		print(f"Value: {value}, Column format: {column_format},"
-			f"\n\tFormat spec: {format_spec}")
-		table_widget.setItem(row, col, QTableWidgetItem("Error"))
+		"""Show a DataFrame in a table view, formatting only the cells in
+		view rather than creating an item for every cell
+		"""
+		table_widget.setModel(FormattedTableModel(data, format_spec))
 
 	# ------------------------------------------------------------------------
 
@@ -2486,27 +2453,11 @@ class Spaces:
 		Returns:
 			tuple[float, float, float, float]: x_max, x_min, y_max, y_min
 		"""
-		uncertainty_active = self._director.uncertainty_active
-		sample_solutions = uncertainty_active.sample_solutions
-		npoint = uncertainty_active.npoints
-
-		# Get all coordinates for the focal point across all solutions
-		# The solutions data is organized where each row is one point's
-		# coordinates in one solution, so we need every npoint-th row starting
-		# from focal_point
-		focal_point_data = sample_solutions.iloc[focal_point::npoint]
+		point_statistics = self._director.uncertainty_active.point_statistics()
+		x_max, y_max = point_statistics.maxima[focal_point]
+		x_min, y_min = point_statistics.minima[focal_point]
 
-		# Extract x and y coordinates
-		x_coords = focal_point_data.iloc[:, 0]  # First dimension (x)
-		y_coords = focal_point_data.iloc[:, 1]  # Second dimension (y)
-
-		# Calculate extrema, preserving floating point precision
-		x_max = float(x_coords.max())
-		x_min = float(x_coords.min())
-		y_max = float(y_coords.max())
-		y_min = float(y_coords.min())
-
-		return x_max, x_min, y_max, y_min
+		return float(x_max), float(x_min), float(y_max), float(y_min)
 
 	# ------------------------------------------------------------------------
 
@@ -2519,25 +2470,10 @@ class Spaces:
 		Returns:
 			tuple[float, float]: Mean x coordinate, mean y coordinate as floats
 		"""
-		uncertainty_active = self._director.uncertainty_active
-		sample_solutions = uncertainty_active.sample_solutions
-		npoint = uncertainty_active.npoints
-
-		# Get all coordinates for the focal point across all solutions
-		# The solutions data is organized where each row is one point's
-		# coordinates in one solution, so we need every npoint-th row starting
-		# from focal_point
-		focal_point_data = sample_solutions.iloc[focal_point::npoint]
-
-		# Extract x and y coordinates
-		x_coords = focal_point_data.iloc[:, 0]  # First dimension (x)
-		y_coords = focal_point_data.iloc[:, 1]  # Second dimension (y)
-
-		# Calculate means, preserving floating point precision
-		x_mean = float(x_coords.mean())
-		y_mean = float(y_coords.mean())
+		point_statistics = self._director.uncertainty_active.point_statistics()
+		x_mean, y_mean = point_statistics.means[focal_point]
 
-		return x_mean, y_mean
+		return float(x_mean), float(y_mean)
 
 	# ------------------------------------------------------------------------
 
@@ -2550,17 +2486,8 @@ class Spaces:
 		Returns:
 			float: The largest difference between any extremum and its mean
 		"""
-		# Get extrema and means for the focal point
-		x_max, x_min, y_max, y_min = self.point_solutions_extrema(focal_point)
-		x_mean, y_mean = self.solutions_means(focal_point)
-
-		# Return the single largest difference among all four possibilities
-		return max(
-			abs(x_max - x_mean),
-			abs(x_min - x_mean),
-			abs(y_max - y_mean),
-			abs(y_min - y_mean),
-		)
+		point_statistics = self._director.uncertainty_active.point_statistics()
+		return float(point_statistics.largest_uncertainties[focal_point])
 
 	# ------------------------------------------------------------------------
 
@@ -2697,14 +2624,19 @@ class Spaces:
 
 		if self._director.executing_script:
 			# Get from script parameters
-			return self._get_script_parameters(
+			params = self._get_script_parameters(
 				command_name, cmd_info, expected_params, kwargs
 			)
-		# else:
-		# Get from interactive dialogs using metadata
-		return self._get_interactive_parameters(
-			command_name, cmd_info, expected_params, kwargs
-		)
+		else:
+			# Get from interactive dialogs using metadata
+			params = self._get_interactive_parameters(
+				command_name, cmd_info, expected_params, kwargs
+			)
+		# A command not given a seed is given one, so that the seed is
+		# recorded with it and a saved script repeats its random choices
+		if "seed" in params and params["seed"] is None:
+			params["seed"] = self._director.session_seeds.next_seed()
+		return params
 
 	# ------------------------------------------------------------------------
 
@@ -2732,6 +2664,9 @@ class Spaces:
 		params = {}
 		interactive_getters = cmd_info.get("interactive_getters", {})
 		parameter_aliases = cmd_info.get("parameter_aliases", {})
+		# Parameters added to a command after scripts were written take
+		# these values in scripts without them
+		parameter_defaults = cmd_info.get("parameter_defaults", {})
 
 		for param_name in expected_params:
 			# First check if parameter was passed via kwargs from execute
@@ -2742,6 +2677,12 @@ class Spaces:
 				params[param_name] = param_value
 				continue
 
+			if param_name in parameter_defaults and not (
+				self._script_has_parameter(param_name, parameter_aliases)
+			):
+				params[param_name] = parameter_defaults[param_name]
+				continue
+
 			# Get parameter from script, checking aliases if needed
 			script_param_name = self._find_parameter_alias(
 				param_name, parameter_aliases, command_name
@@ -2790,6 +2731,20 @@ class Spaces:
 
 	# ------------
 
+	def _script_has_parameter(
+		self, param_name: str, parameter_aliases: dict[str, str]
+	) -> bool:
+		"""Return whether the script line gives param_name, directly or
+		by an alias.
+		"""
+		script_parameters = self._director.script_parameters or {}
+		return param_name in script_parameters or any(
+			full_name == param_name and alias in script_parameters
+			for alias, full_name in parameter_aliases.items()
+		)
+
+	# ------------
+
 	def _find_parameter_alias(
 		self,
 		param_name: str,
@@ -2927,6 +2882,7 @@ class Spaces:
 		params = {}
 		interactive_getters = cmd_info.get("interactive_getters", {})
 		execute_parameters = cmd_info.get("execute_parameters", [])
+		parameter_defaults = cmd_info.get("parameter_defaults", {})
 
 		for param_name in expected_params:
 			# Try various sources for the parameter value
@@ -2938,6 +2894,14 @@ class Spaces:
 				params[param_name] = param_value
 				continue
 
+			# Parameters with a default and no dialog, such as seed, are
+			# not asked for
+			if param_name in parameter_defaults and not (
+				self._has_interactive_getter(param_name, interactive_getters)
+			):
+				params[param_name] = parameter_defaults[param_name]
+				continue
+
 			# Need to get from interactive dialog
 			getter_info, _ = self._find_getter_info(
 				command_name, param_name, interactive_getters
@@ -2953,6 +2917,16 @@ class Spaces:
 
 	# ------------
 
+	def _has_interactive_getter(
+		self, param_name: str, interactive_getters: dict
+	) -> bool:
+		return param_name in interactive_getters or any(
+			param_name in getter_data.get("boolean_params", [])
+			for getter_data in interactive_getters.values()
+		)
+
+	# ------------
+
 	def _try_get_cached_or_kwarg_parameter(
 		self,
 		param_name: str,
@@ -4432,6 +4406,9 @@ class Spaces:
 
 		Writes a comment line identifying the file type as the first line,
 		followed by the CSV data. This allows validation when reading.
+		When file_name ends in .npz or .parquet the data are written in
+		that binary format instead, with the type kept in its metadata and
+		without the index.
 
 		Args:
 			df: DataFrame to write
@@ -4446,13 +4423,74 @@ class Spaces:
 			label1,label2,label3
 			1.0,2.0,3.0
 		"""
-		with Path(file_name).open('w', encoding='utf-8') as f:
-			f.write(f"# TYPE: {file_type.upper()}\n")
-		df.to_csv(file_name, mode='a', **kwargs)
+		match Path(file_name).suffix.lower():
+			case ".npz":
+				self._write_npz_with_type(df, file_name, file_type)
+			case ".parquet":
+				self._write_parquet_with_type(df, file_name, file_type)
+			case _:
+				with Path(file_name).open('w', encoding='utf-8') as f:
+					f.write(f"# TYPE: {file_type.upper()}\n")
+				df.to_csv(file_name, mode='a', **kwargs)
 		return
 
 	# ------------------------------------------------------------------------
 
+	def _write_npz_with_type(
+		self, df: pd.DataFrame, file_name: str, file_type: str
+	) -> None:
+		"""Write each column as an array in a compressed .npz file.
+
+		Text columns are stored as fixed width strings, so that reading
+		them needs no pickling, with a mask of any missing values.
+		"""
+		arrays: dict[str, np.ndarray] = {
+			"type": np.array(file_type.upper()),
+			"columns": np.array([str(column) for column in df.columns]),
+		}
+		for each_col in range(df.shape[1]):
+			column = df.iloc[:, each_col]
+			values = column.to_numpy()
+			if values.dtype == object:
+				missing = column.isna().to_numpy()
+				if missing.any():
+					arrays[f"missing_{each_col}"] = missing
+				values = column.astype(str).to_numpy(dtype=str)
+			arrays[f"column_{each_col}"] = values
+		np.savez_compressed(file_name, **arrays)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _write_parquet_with_type(
+		self, df: pd.DataFrame, file_name: str, file_type: str
+	) -> None:
+		pa, pq = self._import_pyarrow()
+		table = pa.Table.from_pandas(df, preserve_index=False)
+		metadata = {
+			**(table.schema.metadata or {}),
+			PARQUET_TYPE_KEY: file_type.upper().encode(),
+		}
+		pq.write_table(table.replace_schema_metadata(metadata), file_name)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _import_pyarrow(self) -> tuple[Any, Any]:
+		try:
+			import pyarrow as pa  # noqa: PLC0415
+			import pyarrow.parquet as pq  # noqa: PLC0415
+		except ImportError:
+			parquet_title = "Parquet not available"
+			parquet_message = (
+				"Reading and writing .parquet files needs the pyarrow "
+				"package.\nInstall it, or use a .npz or .csv file."
+			)
+			raise SpacesError(parquet_title, parquet_message) from None
+		return pa, pq
+
+	# ------------------------------------------------------------------------
+
 	def read_csv_with_type_check(
 		self,
 		file_name: str,
@@ -4461,7 +4499,9 @@ class Spaces:
 		"""Read CSV file and verify type header.
 
 		Reads a CSV file that was written with write_csv_with_type_header(),
-		verifying that the type identifier matches expectations.
+		verifying that the type identifier matches expectations. Files
+		ending in .npz or .parquet are read as written in those formats,
+		with the type taken from their metadata.
 
 		Args:
 			file_name: Path to input file
@@ -4474,33 +4514,124 @@ class Spaces:
 			SpacesError: If file not found, permission denied, type header
 				missing, or type mismatch
 		"""
-		try:
+		with self._file_read_errors(file_name):
+			suffix = Path(file_name).suffix.lower()
+			if suffix in BINARY_TABLE_SUFFIXES:
+				file_type, df = self._read_binary_table_with_type(
+					file_name, suffix
+				)
+				self._check_file_type(file_type, expected_type)
+				return df
 			# Check type header
-			with Path(file_name).open('r', encoding='utf-8') as f:
-				first_line = f.readline().strip()
-				if not first_line.startswith("# TYPE:"):
-					self.event_driven_automatic_restoration()
-					file_type_title="Missing File Type"
-					file_type_message=(
-						"This file does not have a type identifier.\n"
-						f"Expected '# TYPE: {expected_type.upper()}' "
-						"as first line."
-					)
-					raise SpacesError(file_type_title, file_type_message)
-
-				file_type = first_line.split(":", 1)[1].strip()
-				if file_type != expected_type.upper():
-					self.event_driven_automatic_restoration()
-					
-					wrong_type_title = "Wrong File Type"
-					wrong_type_message = (
-						"This file has an incorrect type identifier.\n"
-						f"Expected '# TYPE: {expected_type.upper()}' "
-					)
-					raise SpacesError(wrong_type_title, wrong_type_message)
+			self._check_file_type(
+				self._read_file_type(file_name, suffix), expected_type
+			)
 			# Read the data (comments are automatically skipped)
 			return pd.read_csv(file_name, comment='#')
 
+	# ------------------------------------------------------------------------
+
+	def map_evaluations_with_type_check(
+		self, file_name: str
+	) -> MappedEvaluations:
+		"""Read an evaluations file into a memory-mapped file.
+
+		Like read_csv_with_type_check, but the file is read
+		EVALUATIONS_CHUNK_ROWS rows, or for .npz files a column, at a time
+		and written to a MappedEvaluations, so that the evaluations need
+		never fit in memory.
+
+		Raises:
+			SpacesError: As read_csv_with_type_check
+			ValueError: If any evaluation is not a number
+		"""
+		with self._file_read_errors(file_name):
+			suffix = Path(file_name).suffix.lower()
+			self._check_file_type(
+				self._read_file_type(file_name, suffix), "EVALUATIONS"
+			)
+			match suffix:
+				case ".npz":
+					mapped = self._map_npz(file_name)
+				case ".parquet":
+					mapped = self._map_parquet(file_name)
+				case _:
+					mapped = self._map_csv(file_name)
+		mapped.finish_writing()
+		return mapped
+
+	# ------------------------------------------------------------------------
+
+	def _map_csv(self, file_name: str) -> MappedEvaluations:
+		from mapped_evaluations import MappedEvaluations  # noqa: PLC0415
+
+		# The rows are counted first so the mapped file can be made at
+		# its full size
+		with Path(file_name).open('r', encoding='utf-8') as f:
+			nrows = sum(
+				1 for line in f if line.strip() and not line.startswith("#")
+			) - 1  # the column names
+		mapped = None
+		start = 0
+		for chunk in pd.read_csv(
+			file_name, comment='#', chunksize=EVALUATIONS_CHUNK_ROWS
+		):
+			if mapped is None:
+				mapped = MappedEvaluations(chunk.columns.tolist(), nrows)
+			mapped.write_rows(start, chunk)
+			start += len(chunk)
+		if mapped is None or start != nrows:
+			msg = f"Read {start} of {nrows} rows"
+			raise ValueError(msg)
+		return mapped
+
+	# ------------------------------------------------------------------------
+
+	def _map_npz(self, file_name: str) -> MappedEvaluations:
+		from mapped_evaluations import MappedEvaluations  # noqa: PLC0415
+
+		with (
+			self._binary_read_errors(file_name),
+			np.load(file_name, allow_pickle=False) as npz,
+		):
+			item_names = npz["columns"].tolist()
+			mapped = MappedEvaluations(
+				item_names, npz["column_0"].shape[0]
+			)
+			for each_col in range(len(item_names)):
+				mapped.write_column(each_col, npz[f"column_{each_col}"])
+		return mapped
+
+	# ------------------------------------------------------------------------
+
+	def _map_parquet(self, file_name: str) -> MappedEvaluations:
+		from mapped_evaluations import MappedEvaluations  # noqa: PLC0415
+
+		with self._binary_read_errors(file_name):
+			_pa, pq = self._import_pyarrow()
+			parquet_file = pq.ParquetFile(file_name)
+			mapped = MappedEvaluations(
+				parquet_file.schema_arrow.names,
+				parquet_file.metadata.num_rows,
+			)
+			start = 0
+			for batch in parquet_file.iter_batches(
+				batch_size=EVALUATIONS_CHUNK_ROWS
+			):
+				mapped.write_rows(start, batch.to_pandas())
+				start += batch.num_rows
+		return mapped
+
+	# ------------------------------------------------------------------------
+
+	@contextmanager
+	def _file_read_errors(self, file_name: str) -> Iterator[None]:
+		"""Restore the previous state and raise a SpacesError when a file
+		cannot be found, opened or parsed.
+		"""
+		try:
+			yield
+
 		except FileNotFoundError:
 			self.event_driven_automatic_restoration()
 			file_not_found_title = "File Not Found"
@@ -4533,6 +4664,107 @@ class Spaces:
 
 	# ------------------------------------------------------------------------
 
+	@contextmanager
+	def _binary_read_errors(self, file_name: str) -> Iterator[None]:
+		"""Restore the previous state when a .npz or .parquet file cannot
+		be read, raising a SpacesError unless it cannot be found or opened.
+		"""
+		try:
+			yield
+		except (FileNotFoundError, PermissionError):
+			raise
+		except SpacesError:
+			self.event_driven_automatic_restoration()
+			raise
+		except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+			self.event_driven_automatic_restoration()
+			binary_read_title = "Unreadable File"
+			binary_read_message = (
+				f"Unable to read file: {file_name}\n"
+				"It is not a file written by Spaces in that format."
+			)
+			raise SpacesError(binary_read_title, binary_read_message) from e
+
+	# ------------------------------------------------------------------------
+
+	def _read_file_type(self, file_name: str, suffix: str) -> str | None:
+		"""Return the type in a file's header or metadata, or None."""
+		if suffix not in BINARY_TABLE_SUFFIXES:
+			with Path(file_name).open('r', encoding='utf-8') as f:
+				first_line = f.readline().strip()
+			if not first_line.startswith("# TYPE:"):
+				return None
+			return first_line.split(":", 1)[1].strip()
+		with self._binary_read_errors(file_name):
+			if suffix == ".parquet":
+				_pa, pq = self._import_pyarrow()
+				file_type = (pq.read_schema(file_name).metadata or {}).get(
+					PARQUET_TYPE_KEY
+				)
+				return None if file_type is None else file_type.decode()
+			with np.load(file_name, allow_pickle=False) as npz:
+				return str(npz["type"]) if "type" in npz.files else None
+
+	# ------------------------------------------------------------------------
+
+	def _check_file_type(
+		self, file_type: str | None, expected_type: str
+	) -> None:
+		if file_type is None:
+			self.event_driven_automatic_restoration()
+			file_type_title="Missing File Type"
+			file_type_message=(
+				"This file does not have a type identifier.\n"
+				f"Expected '# TYPE: {expected_type.upper()}' "
+				"as first line."
+			)
+			raise SpacesError(file_type_title, file_type_message)
+
+		if file_type != expected_type.upper():
+			self.event_driven_automatic_restoration()
+			
+			wrong_type_title = "Wrong File Type"
+			wrong_type_message = (
+				"This file has an incorrect type identifier.\n"
+				f"Expected '# TYPE: {expected_type.upper()}' "
+			)
+			raise SpacesError(wrong_type_title, wrong_type_message)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _read_binary_table_with_type(
+		self, file_name: str, suffix: str
+	) -> tuple[str | None, pd.DataFrame]:
+		"""Return the type in a .npz or .parquet file's metadata, or None,
+		and its data.
+		"""
+		with self._binary_read_errors(file_name):
+			if suffix == ".parquet":
+				_pa, pq = self._import_pyarrow()
+				table = pq.read_table(file_name)
+				file_type = (table.schema.metadata or {}).get(PARQUET_TYPE_KEY)
+				return (
+					None if file_type is None else file_type.decode(),
+					table.to_pandas(),
+				)
+			with np.load(file_name, allow_pickle=False) as npz:
+				file_type = str(npz["type"]) if "type" in npz.files else None
+				columns = npz["columns"].tolist()
+				data = {}
+				for each_col in range(len(columns)):
+					values = npz[f"column_{each_col}"]
+					if values.dtype.kind == "U":
+						values = values.astype(object)
+						if f"missing_{each_col}" in npz.files:
+							values[npz[f"missing_{each_col}"]] = np.nan
+					data[each_col] = values
+			df = pd.DataFrame(data)
+			df.columns = pd.Index(columns)
+		return file_type, df
+
+	# ------------------------------------------------------------------------
+
 	def print_to_printer(self, text: str) -> None:
 		"""Send text to a physical printer."""
 
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+# Evaluations are held as uint8 when every one is a whole number from 0 to
+# 255, as thermometer ratings from 0 to 100 are, an eighth of the memory
+# float64 would take. Missing evaluations are marked by a mask, as in
+# pandas' nullable UInt8 columns, rather than by a sentinel value, so that
+# every rating stays a valid number.
+
+# --------------------------------------------------------------------------
+
+
+def fits_uint8(values: np.ndarray) -> bool:
+	"""Whether values, missing values as NaN, can be held as uint8."""
+	present = values[~np.isnan(values)]
+	return bool(
+		present.size == 0
+		or (
+			present.min() >= 0
+			and present.max() <= np.iinfo(np.uint8).max
+			and np.array_equal(present, np.floor(present))
+		)
+	)
+
+
+# --------------------------------------------------------------------------
+
+
+def compact_evaluations(evaluations: pd.DataFrame) -> pd.DataFrame:
+	"""Return evaluations with uint8 columns, nullable UInt8 columns where
+	some are missing, when every evaluation fits, or else unchanged.
+	"""
+	columns: dict[str, np.ndarray | pd.arrays.IntegerArray] = {}
+	for name, column in evaluations.items():
+		if not pd.api.types.is_numeric_dtype(column):
+			return evaluations
+		values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+		if not fits_uint8(values):
+			return evaluations
+		missing = np.isnan(values)
+		compact = np.where(missing, 0, values).astype(np.uint8)
+		columns[str(name)] = (
+			pd.arrays.IntegerArray(compact, missing)
+			if missing.any()
+			else compact
+		)
+	return pd.DataFrame(columns, index=evaluations.index)
+
+
+# --------------------------------------------------------------------------
+
+
+def is_compact(evaluations: pd.DataFrame) -> bool:
+	"""Whether every column of evaluations is uint8 or UInt8."""
+	return evaluations.shape[1] > 0 and all(
+		dtype in (np.uint8, pd.UInt8Dtype())
+		for dtype in evaluations.dtypes
+	)
+
+
+# --------------------------------------------------------------------------
+
+
+def widen_compact_evaluations(evaluations: pd.DataFrame) -> pd.DataFrame:
+	"""Return compact evaluations as float32, missing evaluations as NaN,
+	or other evaluations unchanged.
+
+	Sums and differences of uint8 evaluations would wrap around, whereas
+	in float32 they are exact, so arithmetic on evaluations that may be
+	compact is done on them widened.
+	"""
+	if not is_compact(evaluations):
+		return evaluations
+	return pd.DataFrame(
+		evaluations.to_numpy(dtype=np.float32, na_value=np.nan),
+		index=evaluations.index,
+		columns=evaluations.columns,
+	)
@@ -1,8 +1,18 @@
+APPROXIMATE_LOS_CONFIDENCE: float = 0.95  # of every pair within tolerance
+APPROXIMATE_LOS_TOLERANCE: float = 0.05  # Approximate line of sight
+APPROXIMATE_LOS_MAXIMUM_TOLERANCE: float = 0.5  # half of all individuals
+BINARY_TABLE_SUFFIXES: tuple[str, ...] = (".npz", ".parquet")  # not CSV
 CORE_SIZE_FULL: float = 0.4
 CORE_SIZE_HALF: float = CORE_SIZE_FULL / 2
 DEFAULT_ALLOWABLE_CUT_OFF: float = 0.0
 DEFAULT_NUMBER_OF_CLUSTERS: int = 2
+DENSITY_PLOT_BINS: int = 256  # grid cells per axis of a density plot
+DENSITY_PLOT_THRESHOLD: int = 50_000  # more respondents use density plot
+EVALUATIONS_CHUNK_ROWS: int = 100_000  # rows per step of a streaming pass
+EVALUATIONS_MAPPING_THRESHOLD: int = 256 * 2**20  # bytes; larger are mapped
 EXHAUSTED_EVALUATIONS: int = 4
+GALLERY_MAXIMUM_THUMBNAILS: int = 50  # thumbnails kept in memory
+GALLERY_THUMBNAIL_WIDTH: int = 320  # pixels
 INDEX_OF_FIRST_DIMENSION_NAME_IN_DIM_NAMES: int = 0
 INDEX_OF_FOURTH_DIMENSION_NAME_IN_DIM_NAMES: int = 3
 INDEX_OF_LABEL_IN_ROW: int = 1
@@ -15,6 +25,7 @@ ITEM_LABEL_FIRST_COLUMN: int = 0
 ITEM_LABEL_LENGTH: int = 4
 LEN_WHEN_NAME_AND_LABEL_ONLY: int = 2
 LEN_WHEN_NAME_ONLY: int = 1
+LOG_MAXIMUM_ENTRIES: int = 100  # --log-entries default
 MAXIMUM_ALLOWABLE_CUT_OFF: float = 10000.0
 MAXIMUM_NUMBER_OF_DIMENSIONS_FOR_PLOTTING: int = 2
 MAXIMUM_NUMBER_OF_DIMENSIONS_FOR_UNCERTAINTY: int = 12
@@ -37,7 +48,22 @@ N_ROWS_IN_SETTINGS_PLOT_TABLE: int = 4
 N_ROWS_IN_SETTINGS_SEGMENTS_TABLE: int = 2
 N_ROWS_IN_SETTINGS_VECTOR_TABLE: int = 2
 N_ROWS_IN_STATUS_TABLE: int = 20
+PARQUET_TYPE_KEY: bytes = b"spaces_type"  # metadata key holding the TYPE
+PICK_RADIUS_PIXELS: int = 8  # hover distance to show an individual
+PROFILE_DIRECTORY: str = "profiles"  # Profile command .prof files
+PROFILE_TOP_FUNCTIONS: int = 20  # printed to Record tab per command
+QUANTILE_SKETCH_SIZE: int = 100_000  # evaluations sampled per item
+RECORD_FLUSH_INTERVAL_MS: int = 100  # Record tab output buffering
+RECORD_MAXIMUM_BUFFERED_CHARACTERS: int = 1_000_000  # flushed when passed
+RECORD_SCROLLBACK_LINES: int = 20_000  # --record-scrollback default
+SCORES_RECALCULATED_TO_CHECK: int = 100  # Append evaluations
 REQUIRED_NUMBER_OF_FIELDS_IN_CONFIGURATION_FILE_LINE: int = 2  # Read_Config
+SERVICE_BATCH_WAIT_MS: float = 5.0  # scoring service gathers requests
+SERVICE_LATENCY_WINDOW: int = 10_000  # requests in latency percentiles
+SERVICE_MAX_BATCH_ROWS: int = 50_000  # rows scored together at most
+SERVICE_PORT: int = 8765  # spaces.py --port default
+STARTUP_BUDGET_SECONDS: float = 5.0  # spaces.py --profile-startup
+TABLE_MAXIMUM_ROWS_SIZED: int = 50  # larger tables scroll within a view
 TEST_FOR_LESS_THAN_FOUR_COORDINATES: int = 4
 TEST_FOR_LESS_THAN_FOUR_DIMENSIONS: int = 4
 TEST_FOR_LESS_THAN_THREE_COORDINATES: int = 3
@@ -52,6 +78,8 @@ TEST_IF_BISECTOR_SELECTED: int = 0
 TEST_IF_CONNECTOR_SELECTED: int = 1
 TEST_IF_JUST_REFERENCE_POINTS_SELECTED: int = 3
 TEST_IF_REFERENCE_POINTS_SELECTED: int = 2
+UNCERTAINTY_CONVERGENCE_BATCH: int = 5  # repetitions between checks
+UNCERTAINTY_MINIMUM_REPETITIONS: int = 20  # before stopping early
 # Battleground assignment values
 BATTLEGROUND_ASSIGNMENT: int = 1
 SETTLED_ASSIGNMENT: int = 2
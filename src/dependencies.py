@@ -357,7 +357,7 @@ class DependencyChecking:
 			new: str = "Configuration"
 		elif command == "New grouped data":
 			new: str = "Grouped data"
-		elif command == "Line of sight":
+		elif command in ("Line of sight", "Approximate line of sight"):
 			new: str = "Similarities"
 		else:
 			new: str = command
@@ -8,11 +8,15 @@ from constants import (
 	MAXIMUM_ALLOWABLE_CUT_OFF,
 	DEFAULT_ALLOWABLE_CUT_OFF,
 	IS_CUTOFF_AN_INTEGER,
+	APPROXIMATE_LOS_MAXIMUM_TOLERANCE,
+	APPROXIMATE_LOS_TOLERANCE,
+	UNCERTAINTY_MINIMUM_REPETITIONS,
 )
 
 # Command class imports for request_dict and widget_dict
 from associationsmenu import (
 	AlikeCommand,
+	ApproximateLineOfSightCommand,
 	DistancesCommand,
 	LineOfSightCommand,
 	PairedCommand,
@@ -28,6 +32,7 @@ from editmenu import (
 )
 from experimental import TesterCommand
 from filemenu import (
+	AppendEvaluationsCommand,
 	ConfigurationCommand,
 	CorrelationsCommand,
 	CreateCommand,
@@ -56,6 +61,7 @@ from filemenu import (
 	SaveConfigurationCommand,
 	SaveCorrelationsCommand,
 	SaveGroupedDataCommand,
+	SaveHistoryCommand,
 	SaveIndividualsCommand,
 	SaveSampleDesignCommand,
 	SaveSampleRepetitionsCommand,
@@ -77,6 +83,7 @@ from filemenu import (
 from helpmenu import (
 	AboutCommand,
 	HelpCommand,
+	ProfileCommand,
 	StatusCommand,
 	TerseCommand,
 	VerboseCommand,
@@ -176,6 +183,39 @@ command_dict = MappingProxyType({
 			}
 		}
 	},
+	"Approximate line of sight": {
+		"type": "active",
+		"state_capture": ["similarities"],
+		"script_parameters": ["tolerance", "seed"],
+		"parameter_defaults": {"seed": None},
+		"interactive_getters": {
+			"tolerance": {
+				"getter_type": "set_value_dialog",
+				"title": "Set tolerance",
+				"label": (
+					"Largest difference between the sample's quantiles"
+					"\nand those of all individuals"
+				),
+				"min_val": 0.001,
+				"max_val": APPROXIMATE_LOS_MAXIMUM_TOLERANCE,
+				"is_integer": False,
+				"default": APPROXIMATE_LOS_TOLERANCE
+			}
+		}
+	},
+	"Append evaluations": {
+		"type": "active",
+		"state_capture": [
+			"evaluations", "correlations", "scores", "rivalry"],
+		"script_parameters": ["file"],
+		"interactive_getters": {
+			"file": {
+				"getter_type": "file_dialog",
+				"caption": "Append evaluations",
+				"filter": "*.csv *.npz *.parquet"
+			}
+		}
+	},
 	"Base": {
 		"type": "passive",
 		"state_capture": [],
@@ -195,7 +235,8 @@ command_dict = MappingProxyType({
 		"type": "active",
 		"state_capture": ["conditional"],  # Conditio
 		# based on user's data source
-		"script_parameters": ["data_source", "n_clusters"],
+		"script_parameters": ["data_source", "n_clusters", "seed"],
+		"parameter_defaults": {"seed": None},
 		"interactive_getters": {
 			"data_source": {
 				"getter_type": "chose_option_dialog",
@@ -287,7 +328,7 @@ command_dict = MappingProxyType({
 			"file": {
 				"getter_type": "file_dialog",
 				"caption": "Open evaluations",
-				"filter": "*.csv"
+				"filter": "*.csv *.npz *.parquet"
 			}
 		}
 	},
@@ -363,7 +404,7 @@ command_dict = MappingProxyType({
 			"file": {
 				"getter_type": "file_dialog",
 				"caption": "Open individuals",
-				"filter": "*.csv"
+				"filter": "*.csv *.npz *.parquet"
 			}
 		}
 	},
@@ -398,8 +439,9 @@ command_dict = MappingProxyType({
 	"MDS": {
 		"type": "active",
 		"state_capture": ["configuration", "rivalry"],
-		"script_parameters": ["n_components", "use_metric"],
+		"script_parameters": ["n_components", "use_metric", "seed"],
 		"execute_parameters": ["use_metric"],
+		"parameter_defaults": {"seed": None},
 		"interactive_getters": {
 			"n_components": {
 				"getter_type": "set_value_dialog",
@@ -482,7 +524,7 @@ command_dict = MappingProxyType({
 			"file": {
 				"getter_type": "file_dialog",
 				"caption": "Open scores",
-				"filter": "*.csv"
+				"filter": "*.csv *.npz *.parquet"
 			}
 		}
 	},
@@ -573,6 +615,22 @@ command_dict = MappingProxyType({
 		"state_capture": [],
 		"script_parameters": []
 	},
+	"Profile": {
+		"type": "passive",
+		"state_capture": [],
+		"script_parameters": ["n_commands"],
+		"interactive_getters": {
+			"n_commands": {
+				"getter_type": "set_value_dialog",
+				"title": "Profile commands",
+				"label": "Number of commands to profile (0 switches off):",
+				"min_val": 0,
+				"max_val": 100,
+				"is_integer": True,
+				"default": 1
+			}
+		}
+	},
 	"Ranks differences": {
 		"type": "passive",
 		"state_capture": [],
@@ -648,7 +706,9 @@ command_dict = MappingProxyType({
 	"Sample designer": {
 		"type": "active",
 		"state_capture": ["uncertainty"],
-		"script_parameters": ["probability_of_inclusion", "nrepetitions"],
+		"script_parameters": [
+			"probability_of_inclusion", "nrepetitions", "seed"],
+		"parameter_defaults": {"seed": None},
 		"interactive_getters": {
 			"sample_parameters": {
 				"getter_type": "modify_values_dialog",
@@ -710,6 +770,20 @@ command_dict = MappingProxyType({
 			}
 		}
 	},
+	"Save history": {
+		"type": "passive",
+		"state_capture": [],
+		"script_parameters": ["file"],
+		"interactive_getters": {
+			"file": {
+				"getter_type": "file_dialog",
+				"caption": "Save history of commands",
+				"filter": "*.csv *.jsonl",
+				"mode": "save",
+				"directory": "data"
+			}
+		}
+	},
 	"Save individuals": {
 		"type": "passive",
 		"state_capture": [],
@@ -718,7 +792,7 @@ command_dict = MappingProxyType({
 			"file": {
 				"getter_type": "file_dialog",
 				"caption": "Save active individuals",
-				"filter": "*.csv",
+				"filter": "*.csv *.npz *.parquet",
 				"mode": "save",
 				"directory": "data"
 			}
@@ -774,7 +848,7 @@ command_dict = MappingProxyType({
 			"file": {
 				"getter_type": "file_dialog",
 				"caption": "Save active scores",
-				"filter": "*.csv",
+				"filter": "*.csv *.npz *.parquet",
 				"mode": "save",
 				"directory": "data"
 			}
@@ -1032,18 +1106,51 @@ command_dict = MappingProxyType({
 	"Uncertainty": {
 		"type": "active",
 		"state_capture": ["uncertainty"],
-		"script_parameters": ["probability_of_inclusion", "nrepetitions"],
+		"script_parameters": [
+			"probability_of_inclusion", "nrepetitions", "keep_solutions",
+			"convergence_tolerance", "min_repetitions", "seed"],
+		"parameter_defaults": {
+			"keep_solutions": True,
+			"convergence_tolerance": 0.0,
+			"min_repetitions": UNCERTAINTY_MINIMUM_REPETITIONS,
+			"seed": None
+		},
 		"interactive_getters": {
 			"sample_parameters": {
 				"getter_type": "modify_values_dialog",
 				"title": "Set sample parameters for uncertainty analysis",
 				"labels": [
 					"Probability of inclusion",
-					"Number of repetitions"
+					"Most repetitions",
+					"Fewest repetitions, if stopping early"
 				],
 				"is_integer": True,
-				"defaults": [50, 100],
-				"boolean_params": ["probability_of_inclusion", "nrepetitions"]
+				"defaults": [50, 100, UNCERTAINTY_MINIMUM_REPETITIONS],
+				"boolean_params": [
+					"probability_of_inclusion", "nrepetitions",
+					"min_repetitions"]
+			},
+			"convergence_tolerance": {
+				"getter_type": "set_value_dialog",
+				"title": "Set convergence tolerance",
+				"label": (
+					"Stop once no ellipse area changes by more than"
+					"\nthis proportion (0 solves every repetition)"
+				),
+				"min_val": 0.0,
+				"max_val": 1.0,
+				"is_integer": False,
+				"default": 0.0
+			},
+			"keep_solutions": {
+				"getter_type": "chose_option_dialog",
+				"title": "Uncertainty solutions",
+				"options_title": "Keep:",
+				"options": [
+					"Every solution",
+					"Only each point's mean, covariance and extrema"
+				],
+				"values": [True, False]
 			}
 		}
 	},
@@ -1170,6 +1277,24 @@ explain_dict = MappingProxyType({
 	"Only pairs of points with a similarity "
 	"above, or a dissimilarity below, the cutoff will have "
 	"a line joining the points.",
+	"Approximate line of sight": "Approximate line of sight computes "
+	"the Line of sight measure of association from a random sample of "
+	"the individuals.\n"
+	"The user will be asked for a tolerance. The sample is large enough "
+	"that, with 95% confidence, the quantiles of every pair's sums and "
+	"differences in the sample are within the tolerance of those of all "
+	"individuals.\n"
+	"Smaller tolerances give results closer to Line of sight but sample "
+	"more individuals. When the sample would include everyone, Line of "
+	"sight itself is computed.",
+	"Append evaluations": "Append evaluations reads in a file containing "
+	"the evaluations of more individuals, of the same items as the "
+	"active evaluations, and adds them after those already active.\n"
+	"Correlations and summary statistics are updated to include them.\n"
+	"If scores have been calculated with Score individuals, the new "
+	"individuals are scored in the same way and, if individuals have "
+	"been assigned to segments, they are assigned too, leaving those "
+	"already scored and assigned as they were.",
 	"Base": "Base identifies regions close to the reference "
 	"points in the battleground region.\n"
 	"Individuals in these areas prefer these candidates.",
@@ -1365,6 +1490,12 @@ explain_dict = MappingProxyType({
 	"Print similarities": "Print similarities is used to print "
 	"the active similarities.",
 	"Print target": "Print target is used to print the active target.",
+	"Profile": "Profile runs the next commands under cProfile.\n"
+	"Each profiled command is saved as a .prof file named after the "
+	"command and the time it started, and its slowest functions by "
+	"cumulative time are printed to the Record tab.\n"
+	"The user will be asked for the number of commands to profile; "
+	"0 switches profiling off.",
 	"Ranks differences": "Ranks differences displays a matrix of "
 	"inter-point rank differences.",
 	"Ranks distances": "Ranks distances is used to display ranks of "
@@ -1412,6 +1543,12 @@ explain_dict = MappingProxyType({
 	"Save grouped data": "Save grouped data is used to save the "
 	"active grouped data to a file.\n"
 	"The user will be asked for a file name.\n",
+	"Save history": "Save history is used to save the commands used "
+	"in this session, with their status, wall time, CPU time, peak "
+	"memory increase and undo snapshot size.\n"
+	"A file name ending in .jsonl is written as JSON lines, any other "
+	"as CSV.\n"
+	"The user will be asked for a file name.\n",
 	"Save individuals": "Save individuals is used to save the "
 	"active individuals to a file.\n"
 	"The user will be asked for a file name.\n",
@@ -1521,7 +1658,17 @@ explain_dict = MappingProxyType({
 	"program.",
 	"Uncertainty": "Uncertainty uses the sample repetitions to create"
 	"a plot \n"
-	"showing uncertainty in the location of points.\n",
+	"showing uncertainty in the location of points.\n"
+	"Each point's mean, covariance and extrema are accumulated as "
+	"each repetition's solution arrives. Unless every solution is "
+	"kept, the solutions themselves are not, so many repetitions need "
+	"little memory, but the plot shows no cloud of solutions and they "
+	"cannot be viewed, printed or saved.\n"
+	"With a convergence tolerance above zero, the number of repetitions "
+	"is the most to solve. Every five repetitions the area of each "
+	"point's ellipse is compared with five repetitions before, and once "
+	"the fewest repetitions have been solved, solving stops when no "
+	"area changed by more than the tolerance.\n",
 	"Undo": "Undo undoes the last action.",
 	"Varimax": "Varimax performs a varimax rotation of the active "
 	"configuration.",
@@ -1726,6 +1873,7 @@ request_dict = MappingProxyType({
 	),
 	"open_correlations": (CorrelationsCommand, None),
 	"open_evaluations": (EvaluationsCommand, None),
+	"append_evaluations": (AppendEvaluationsCommand, None),
 	"open_individuals": (IndividualsCommand, None),
 	"open_scores": (OpenScoresCommand, None),
 	"open_sample_design": (OpenSampleDesignCommand, None),
@@ -1736,6 +1884,7 @@ request_dict = MappingProxyType({
 	"save_target": (SaveTargetCommand, None),
 	"save_correlations": (SaveCorrelationsCommand, None),
 	"save_grouped_data": (SaveGroupedDataCommand, None),
+	"save_history": (SaveHistoryCommand, None),
 	"save_similarities": (SaveSimilaritiesCommand, None),
 	"save_individuals": (SaveIndividualsCommand, None),
 	"save_scores": (SaveScoresCommand, None),
@@ -1830,6 +1979,7 @@ request_dict = MappingProxyType({
 	"similarities": (ViewSimilaritiesCommand, None),
 	"paired": (PairedCommand, None),
 	"line_of_sight": (LineOfSightCommand, None),
+	"approximate_line_of_sight": (ApproximateLineOfSightCommand, None),
 	"alike": (AlikeCommand, None),
 	"cluster": (ClusterCommand, None),
 	"distances": (DistancesCommand, None),
@@ -1892,6 +2042,7 @@ request_dict = MappingProxyType({
 	"about": (AboutCommand, None),
 	"terse": (TerseCommand, None),
 	"verbose": (VerboseCommand, None),
+	"profile": (ProfileCommand, None),
 	"tester": (TesterCommand, None),
 })
 
@@ -1925,6 +2076,16 @@ def create_widget_dict(parent: Status) -> FrozenDict:
 			"shared",
 			lambda: parent.statistics.display_table("alike"),
 		],
+		"Approximate line of sight": [
+			ApproximateLineOfSightCommand,
+			"shared",
+			lambda: parent.squares.display_table("similarities"),
+		],
+		"Append evaluations": [
+			AppendEvaluationsCommand,
+			"shared",
+			lambda: parent.statistics.display_table("evaluations"),
+		],
 		"Base": [
 			BaseCommand,
 			"shared",
@@ -2130,6 +2291,7 @@ def create_widget_dict(parent: Status) -> FrozenDict:
 			"shared",
 			lambda: parent.tables.display_table("target"),
 		],
+		"Profile": [ProfileCommand, "shared", parent.display_a_line],
 		"Ranks differences": [
 			RanksDifferencesCommand,
 			"shared",
@@ -2186,6 +2348,11 @@ def create_widget_dict(parent: Status) -> FrozenDict:
 			"shared",
 			lambda: parent.tables.display_table("grouped_data"),
 		],
+		"Save history": [
+			SaveHistoryCommand,
+			"shared",
+			parent.display_a_line,
+		],
 		"Save individuals": [
 			SaveIndividualsCommand,
 			"shared",
@@ -2449,6 +2616,11 @@ file_menu_dict = MappingProxyType({
 				"open_evaluations",
 				"Open existing evaluations file",
 			],
+			"Append evaluations": [
+				"spaces_evaluations_icon.jpg",
+				"append_evaluations",
+				"Append more individuals to the active evaluations",
+			],
 			"Individuals": [
 				"spaces_individuals_icon.jpg",
 				"open_individuals",
@@ -2541,6 +2713,11 @@ file_menu_dict = MappingProxyType({
 				"save_script",
 				"Save command history as script",
 			],
+			"History": [
+				None,
+				"save_history",
+				"Save history of commands with timings and memory",
+			],
 		},
 	},
 	"Deactivate": [
@@ -2861,6 +3038,11 @@ associations_menu_dict = MappingProxyType({
 		"line_of_sight",
 		"Compute Line of sight coefficients",
 	],
+	"Approximate line of sight": [
+		"spaces_los_icon.jpg",
+		"approximate_line_of_sight",
+		"Compute Line of sight from a sample of individuals",
+	],
 	"Paired": [
 		"spaces_paired_icon.jpg",
 		"paired",
@@ -3208,6 +3390,7 @@ help_menu_dict = MappingProxyType({
 		"verbose",
 		"Toggle between Terse and Verbose",
 	],
+	"Profile": [None, "profile", "Profile the next commands with cProfile"],
 	"About": ["spaces_about_icon.jpg", "about", "About Spaces"],
 })
 
@@ -3612,6 +3795,17 @@ title_generator_dict = MappingProxyType({
 	"Alike": lambda d: (
 		f"Pairs with similarity using cutoff: {d.common.cutoff}"
 	),
+	"Approximate line of sight": lambda d: (
+		f"Approximate line of sight:\n"
+		f"The {d.similarities_active.value_type} matrix has "
+		f"{d.similarities_active.nreferent} items, from "
+		f"{d.similarities_active.n_individ} of "
+		f"{d.evaluations_active.nevaluators} individuals"
+	),
+	"Append evaluations": lambda d: (
+		f"Evaluations of {d.evaluations_active.nevaluators} individuals "
+		f"with correlations updated"
+	),
 	"Base": lambda d: (
 		f"Base supporters of {d.rivalry.rival_a.name} and "
 		f"{d.rivalry.rival_b.name}"
@@ -3760,6 +3954,11 @@ title_generator_dict = MappingProxyType({
 		f"Target configuration has {d.target_active.ndim} dimensions and "
 		f"{d.target_active.npoint} points"
 	),
+	"Profile": lambda d: (
+		f"Profiling the next {d.command_profiler.commands_remaining} commands"
+		if d.command_profiler.commands_remaining > 0
+		else "Profiling switched off"
+	),
 	"Ranks differences": lambda _: "Difference of Ranks",
 	"Ranks distances": lambda _: "Rank of Distances",
 	"Ranks similarities": lambda _: "Rank of Similarities",
@@ -3803,6 +4002,10 @@ title_generator_dict = MappingProxyType({
 		f"The active grouped data has been written to: \n"
 		f"{d.common.name_of_file_written_to}\n"
 	),
+	"Save history": lambda d: (
+		f"The history of commands has been written to:\n"
+		f"{d.common.name_of_file_written_to}\n"
+	),
 	"Save individuals": lambda d: (
 		f"The active individuals have been written to:\n"
 		f"{d.common.name_of_file_written_to}\n"
@@ -3910,7 +4113,7 @@ title_generator_dict = MappingProxyType({
 		f"Uncertainty: "
 		f"{d.undo_stack[-1].command_params.get('probability_of_inclusion')}%"
 		f" probability of inclusion, "
-		f"{d.undo_stack[-1].command_params.get('nrepetitions')} repetitions"
+		f"{d.uncertainty_active.nsolutions} repetitions"
 	),
 	"Undo": lambda d: f"Undid {d.common.undone_command_name} command",
 	"Varimax": lambda _: "Varimax rotation of active configuration",
@@ -3989,12 +4192,14 @@ title_generator_dict = MappingProxyType({
 #  correlations,
 #          individual_data, distances, ranks_distances, ranks_similarities,
 #          scores, evaluations, target, grouped_data, sample_design,
-#          sample_repetitions, sample_solutions
+#          sample_repetitions, sample_solutions, uncertainty
 # ----------------------------------------------------------------------------
 
 command_dependencies_dict = MappingProxyType({
 	"About": (),
 	"Alike": ("configuration", "similarities"),
+	"Approximate line of sight": ("evaluations",),
+	"Append evaluations": ("evaluations",),
 	"Base": ("configuration", "reference_points"),
 	"Battleground": ("configuration", "reference_points"),
 	"Center": ("configuration",),
@@ -4043,6 +4248,7 @@ command_dependencies_dict = MappingProxyType({
 	"Print scores": ("scores",),
 	"Print similarities": ("similarities",),
 	"Print target": ("target",),
+	"Profile": (),
 	"Ranks differences": ("similarities", "ranks_distances",
 		"ranks_similarities"),
 	"Ranks distances": ("configuration", "distances"),
@@ -4056,6 +4262,7 @@ command_dependencies_dict = MappingProxyType({
 	"Save configuration": ("configuration",),
 	"Save correlations": ("correlations",),
 	"Save grouped data": ("grouped_data",),
+	"Save history": (),
 	"Save individuals": ("individual_data",),
 	"Save sample design": ("sample_design",),
 	"Save sample repetitions": ("sample_repetitions",),
@@ -4094,14 +4301,14 @@ command_dependencies_dict = MappingProxyType({
 	"View evaluations": ("evaluations",),
 	"View grouped data": ("grouped_data",),
 	"View individuals": ("individual_data",),
-	"View point uncertainty": ("sample_solutions",),
+	"View point uncertainty": ("uncertainty",),
 	"View sample design": ("sample_design",),
 	"View sample repetitions": ("sample_repetitions",),
 	"View sample solutions": ("sample_solutions",),
 	"View scores": ("scores",),
 	"View script": (),
 	"View similarities": ("similarities",),
-	"View spatial uncertainty": ("sample_solutions",),
+	"View spatial uncertainty": ("uncertainty",),
 	"View target": ("target",),
 })
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 # Standard library imports
 import os
+import sys
 from pathlib import Path
 from itertools import islice
 
@@ -19,13 +20,13 @@ from PySide6.QtWidgets import (
 	QLabel,
 	QMainWindow,
 	QMenu,
+	QPlainTextEdit,
 	QProgressBar,
 	QPushButton,
 	QScrollArea,
 	QSizePolicy,
-	QSpacerItem,
 	QStatusBar,
-	QTableWidget,
+	QTableView,
 	QTabWidget,
 	QTextEdit,
 	QToolBar,
@@ -37,14 +38,20 @@ from PySide6.QtWidgets import (
 # Typing imports
 from typing import TYPE_CHECKING, Any, Literal
 
-from matplotlib_common import MatplotlibCommon
-from pyqtgraph_common import PyQtGraphCommon
-
 if TYPE_CHECKING:
 	from collections.abc import Callable
 	from matplotlib import pyplot as plt
+	from command_metrics import CommandMetrics
 	from command_state import CommandState
-
+	from matplotlib_common import MatplotlibCommon
+	from matplotlib_plots import MatplotlibMethods
+	from pyqtgraph_common import PyQtGraphCommon
+	from pyqtgraph_plots import PyQtGraphMethods
+	from startup_profile import StartupProfiler
+
+from command_log import CommandLog
+from command_metrics import measure_command
+from command_profile import CommandProfiler
 from constants import TEST_IF_ACTION_OR_SUBMENU_HAS_THREE_ITEMS
 from dependencies import DependencyChecking
 from dictionaries import (
@@ -68,7 +75,9 @@ from dictionaries import (
 	command_dependencies_dict,
 )
 from exceptions import SpacesError
+from gallery import Gallery
 from geometry import Point
+from seeds import SessionSeeds
 from table_builder import (
 	BuildOutputForGUI,
 	BasicTableWidget,
@@ -78,9 +87,6 @@ from table_builder import (
 )
 from common import Spaces
 
-from matplotlib_plots import MatplotlibMethods
-from pyqtgraph_plots import PyQtGraphMethods
-
 
 # --------------------------------------------------------------------------
 
@@ -95,11 +101,22 @@ class Status(QMainWindow):
 	plot_to_show: str
 	selected_point_indices: list[int]
 
-	def __init__(self, parent: QWidget | None = None) -> None:
+	def __init__(
+		self,
+		parent: QWidget | None = None,
+		startup_profiler: StartupProfiler | None = None,
+	) -> None:
 		"""Initializer."""
 		super().__init__(parent)  # Call the base class constructor
 
 		from rivalry import Rivalry  # noqa: PLC0415
+		from startup_profile import StartupProfiler  # noqa: PLC0415
+
+		# spaces.py passes an enabled profiler for --profile-startup;
+		# otherwise a disabled one makes the spans below no-ops
+		self.startup_profiler = startup_profiler or StartupProfiler(
+			0.0, enabled=False
+		)
 
 		self.dependency_checker = DependencyChecking(self)
 		self.tables = BasicTableWidget(self)
@@ -118,7 +135,8 @@ class Status(QMainWindow):
 		self.variables_used_for_command_handling()
 		self.directories_being_used_for_data()
 		self.rivalry = Rivalry(self)
-		self.create_instances()
+		with self.startup_profiler.span("create_instances"):
+			self.create_instances()
 
 		self.variables_used_for_widget_building_etc()
 		#
@@ -135,6 +153,8 @@ class Status(QMainWindow):
 		self.commands_used = _structure.commands_used
 		self.command_exit_code = _structure.command_exit_code
 		self.command_states = _structure.command_states
+		self.command_metrics = _structure.command_metrics
+		self.command_profiler = CommandProfiler()
 		self.command = _structure.command
 		self.undo_stack = _structure.undo_stack
 		self.undo_stack_source = _structure.undo_stack_source
@@ -154,6 +174,9 @@ class Status(QMainWindow):
 		# multiple times (e.g., when later parameters depend on earlier ones)
 		self.obtained_parameters: dict[str, Any] = {}
 
+		# Seeds for commands that make random choices and are not given one
+		self.session_seeds = SessionSeeds()
+
 		# Track number of similar pairs for alike command
 		self.n_similar_pairs: int = 0
 
@@ -163,6 +186,10 @@ class Status(QMainWindow):
 		# Verbosity toggle state
 		self.verbosity_alternative: Literal["Terse", "Verbose"] = "Terse"
 
+		# Seconds from process start until the main window was shown,
+		# set by spaces.py once startup is complete
+		self.startup_seconds: float = 0.0
+
 	# ------------------------------------------------------------------------
 
 	def directories_being_used_for_data(self) -> None:
@@ -189,19 +216,30 @@ class Status(QMainWindow):
 	# ------------------------------------------------------------------------
 
 	def setup_gui(self) -> None:
+		startup_profiler = self.startup_profiler
 		self.setWindowTitle("Spaces")
-		self.create_menu_bar()
-		self.create_status_bar()
+		with startup_profiler.span("create_menu_bar"):
+			self.create_menu_bar()
+		with startup_profiler.span("create_status_bar"):
+			self.create_status_bar()
 		self.create_explanations()
-		self.create_tool_bar()
-		self.create_tabs()
+		with startup_profiler.span("create_tool_bar"):
+			self.create_tool_bar()
+		with startup_profiler.span("create_tabs"):
+			self.create_tabs()
 		# Initialize Undo and Redo as disabled (no stack items on startup)
 		self.disable_undo()
 		self.disable_redo()
 
 		# The following checks the consistency of dictionaries
 		# Do they all handle all commands and are in the same order!!!!!!!!!!!!
+		# It is only run when profiling startup so its cost is tracked
 		# self.check_consistency_of_dictionaries_and_arrays()
+		if startup_profiler.enabled:
+			with startup_profiler.span(
+				"check_consistency_of_dictionaries_and_arrays"
+			):
+				self.check_consistency_of_dictionaries_and_arrays()
 
 	# ------------------------------------------------------------------------
 
@@ -228,10 +266,53 @@ class Status(QMainWindow):
 		self.target_active = TargetFeature(self)
 		self.scores_active = ScoresFeature(self)
 		self.uncertainty_active = UncertaintyAnalysis(self)
-		self.matplotlib_plotter = MatplotlibMethods(self)
-		self.pyqtgraph_plotter = PyQtGraphMethods(self)
-		self.matplotlib_common = MatplotlibCommon(self)
-		self.pyqtgraph_common = PyQtGraphCommon(self)
+		# The presentation layers are built on first use (see the
+		# properties below) so neither matplotlib nor pyqtgraph is
+		# imported until a plot is requested from that layer
+		self._matplotlib_plotter: MatplotlibMethods | None = None
+		self._pyqtgraph_plotter: PyQtGraphMethods | None = None
+		self._matplotlib_common: MatplotlibCommon | None = None
+		self._pyqtgraph_common: PyQtGraphCommon | None = None
+
+	# ------------------------------------------------------------------------
+
+	@property
+	def matplotlib_plotter(self) -> MatplotlibMethods:
+		if self._matplotlib_plotter is None:
+			from matplotlib_plots import MatplotlibMethods  # noqa: PLC0415
+
+			self._matplotlib_plotter = MatplotlibMethods(self)
+		return self._matplotlib_plotter
+
+	# ------------------------------------------------------------------------
+
+	@property
+	def pyqtgraph_plotter(self) -> PyQtGraphMethods:
+		if self._pyqtgraph_plotter is None:
+			from pyqtgraph_plots import PyQtGraphMethods  # noqa: PLC0415
+
+			self._pyqtgraph_plotter = PyQtGraphMethods(self)
+		return self._pyqtgraph_plotter
+
+	# ------------------------------------------------------------------------
+
+	@property
+	def matplotlib_common(self) -> MatplotlibCommon:
+		if self._matplotlib_common is None:
+			from matplotlib_common import MatplotlibCommon  # noqa: PLC0415
+
+			self._matplotlib_common = MatplotlibCommon(self)
+		return self._matplotlib_common
+
+	# ------------------------------------------------------------------------
+
+	@property
+	def pyqtgraph_common(self) -> PyQtGraphCommon:
+		if self._pyqtgraph_common is None:
+			from pyqtgraph_common import PyQtGraphCommon  # noqa: PLC0415
+
+			self._pyqtgraph_common = PyQtGraphCommon(self)
+		return self._pyqtgraph_common
 
 	# ------------------------------------------------------------------------
 
@@ -247,7 +328,7 @@ class Status(QMainWindow):
 		self.tab_widget.setTabPosition(
 			QTabWidget.South) # ty: ignore[unresolved-attribute]
 		#
-		self.text_to_tab = QTextEdit()
+		self.text_to_tab = QPlainTextEdit()
 		#
 		self.tab_plot_scroll_area = QScrollArea()
 		self.tab_output_widget = QWidget()
@@ -261,6 +342,7 @@ class Status(QMainWindow):
 		self.tab_gallery_scroll_area = QScrollArea()
 		self.tab_gallery_scroll_area.setWidgetResizable(True)
 		self.tab_gallery_scroll_area.setWidget(self.tab_gallery_widget)
+		self.gallery = Gallery(self, self.tab_gallery_layout)
 		#
 		self.tab_log_widget = QWidget()
 		self.tab_log_layout = QVBoxLayout()
@@ -270,6 +352,9 @@ class Status(QMainWindow):
 		self.tab_log_scroll_area = QScrollArea()
 		self.tab_log_scroll_area.setWidgetResizable(True)
 		self.tab_log_scroll_area.setWidget(self.tab_log_widget)
+		self.command_log = CommandLog(
+			self.tab_log_scroll_area, self.tab_log_layout
+		)
 		#
 		self.tab_widget.addTab(self.tab_plot_scroll_area, "Plot")
 		self.tab_widget.addTab(self.tab_output_widget, "Output")
@@ -277,6 +362,7 @@ class Status(QMainWindow):
 		self.tab_widget.addTab(self.tab_log_scroll_area, "Log")
 		# self.tab_widget.addTab(self.tab_log, "Log")
 		self.tab_widget.addTab(self.text_to_tab, "Record")
+		self.tab_widget.currentChanged.connect(self.command_log.refresh)
 		#
 		# Set the Qt Style Sheet for the QTabWidget
 		#
@@ -406,49 +492,28 @@ class Status(QMainWindow):
 
 	def set_column_and_row_headers(
 		self,
-		table_widget: QTableWidget,
+		table_widget: QTableView,
 		column_header: list[str],
 		row_header: list[str],
 	) -> None:
-		if len(column_header) == 0:
-			table_widget.horizontalHeader().hide()
-		else:
-			table_widget.setHorizontalHeaderLabels(column_header)
-			table_widget.horizontalHeader().setStyleSheet(
-				f"QHeaderView::section"
-				f"{{ background-color: {self.column_header_color} }}"
-			)
-		if len(row_header) == 0:
-			table_widget.verticalHeader().hide()
-		else:
-			table_widget.setVerticalHeaderLabels(row_header)
-			table_widget.verticalHeader().setStyleSheet(
-				f"QHeaderView::section"
-				f"{{ background-color: {self.row_header_color} }}"
-			)
+		self.common.set_column_and_row_headers(
+			table_widget, column_header, row_header
+		)
 
 	# ------------------------------------------------------------------------
 
 	@staticmethod
 	def resize_and_set_table_size(
-		gui_output_as_widget: QTableWidget, fudge: int
+		gui_output_as_widget: QTableView, fudge: int
 	) -> None:
-		"""Resize a table widget to fit its contents plus a fudge factor.
+		"""Resize a table to fit its contents plus a fudge factor, or to
+		show its first rows when it is too long for that.
 
 		Args:
-			gui_output_as_widget: The table widget to resize
+			gui_output_as_widget: The table widget or view to resize
 			fudge: Additional height in pixels to add
 		"""
-		n_rows = gui_output_as_widget.rowCount()
-		gui_output_as_widget.resizeColumnsToContents()
-		gui_output_as_widget.resizeRowsToContents()
-		height_of_rows = sum(
-			[gui_output_as_widget.rowHeight(row) for row in range(n_rows)]
-		)
-		height_of_header = gui_output_as_widget.horizontalHeader().height()
-		gui_output_as_widget.setFixedHeight(
-			height_of_rows + height_of_header + fudge
-		)
+		Spaces.resize_and_set_table_size(gui_output_as_widget, fudge)
 		return
 
 	# ------------------------------------------------------------------------
@@ -542,8 +607,9 @@ class Status(QMainWindow):
 		]
 
 		for menu_name, menu_dict in menus:
-			menu = self.spaces_menu_bar.addMenu(menu_name)
-			self.add_submenus(menu, menu_dict)
+			with self.startup_profiler.span(f"{menu_name} menu"):
+				menu = self.spaces_menu_bar.addMenu(menu_name)
+				self.add_submenus(menu, menu_dict)
 
 	# ------------------------------------------------------------------------
 
@@ -627,9 +693,9 @@ class Status(QMainWindow):
 	) -> QAction:
 		"""Create a QAction with or without an icon"""
 		if icon_name:
-			return QAction(
-				QIcon(self._create_icon_path(icon_name)), name, self
-			)
+			with self.startup_profiler.span(f"{name} ({icon_name})", "icon"):
+				icon = QIcon(self._create_icon_path(icon_name))
+			return QAction(icon, name, self)
 		return QAction(name, self)
 
 	def _configure_action_properties(
@@ -716,6 +782,10 @@ class Status(QMainWindow):
 			action.setCheckable(True)
 			self.help_verbosity_action = action
 			action.triggered.connect(self.toggle_verbosity)
+		elif name == "Profile":
+			action.setCheckable(True)
+			self.help_profile_action = action
+			action.triggered.connect(self.create_lambda_with_toggle(command))
 		else:
 			action.triggered.connect(self.create_lambda_with_toggle(command))
 
@@ -737,6 +807,14 @@ class Status(QMainWindow):
 		self.spaces_menu_bar.addAction(self.help_verbosity_action)
 		self.help_verbosity_action.blockSignals(False)  # noqa: FBT003
 
+	# -------------------------------------------------------------------------
+
+	def show_profiling_switched_off(self) -> None:
+		self.help_profile_action.blockSignals(True)  # noqa: FBT003
+		self.help_profile_action.setChecked(False)
+		self.help_profile_action.blockSignals(False)  # noqa: FBT003
+		self.spaces_statusbar.showMessage("Profiling switched off", 80000)
+
 	# ------------------------------------------------------------------------
 
 	def create_status_bar(self) -> None:
@@ -783,6 +861,8 @@ class Status(QMainWindow):
 		self.commands = (
 			"About",
 			"Alike",
+			"Append evaluations",
+			"Approximate line of sight",
 			"Base",
 			"Battleground",
 			"Center",
@@ -831,6 +911,7 @@ class Status(QMainWindow):
 			"Print scores",
 			"Print similarities",
 			"Print target",
+			"Profile",
 			"Ranks differences",
 			"Ranks distances",
 			"Ranks similarities",
@@ -843,6 +924,7 @@ class Status(QMainWindow):
 			"Save configuration",
 			"Save correlations",
 			"Save grouped data",
+			"Save history",
 			"Save individuals",
 			"Save sample design",
 			"Save sample repetitions",
@@ -900,17 +982,25 @@ class Status(QMainWindow):
 
 		try:
 			command_class = request_dict_local[next_command][0]
-			if request_dict_local[next_command][1] is None:
-				self.current_command = command_class(self, common)
-				self.current_command.execute(common)
-			else:
-				self.current_command = command_class(self, common)
-				self.current_command.execute(
-					common, request_dict_local[next_command][1]
-				)
+			with (
+				self.command_profiler.profile(self),
+				measure_command(self),
+			):
+				if request_dict_local[next_command][1] is None:
+					self.current_command = command_class(self, common)
+					self.current_command.execute(common)
+				else:
+					self.current_command = command_class(self, common)
+					self.current_command.execute(
+						common, request_dict_local[next_command][1]
+					)
 		except SpacesError as e:
 			self.unable_to_complete_command_set_status_as_failed()
+			# Show what the command printed before the error dialog
+			sys.stdout.flush()
 			self.common.error(e.title, e.message)
+		# Record tab output is buffered; show it all once the command ends
+		sys.stdout.flush()
 
 	# ------------------------------------------------------------------------
 
@@ -930,11 +1020,11 @@ class Status(QMainWindow):
 
 		for key, (icon, _next_command, _) in button_dict.items():
 			# Create the QAction dynamically
-			button_action = QAction(
-				QIcon(str(Path(self.basedir) / icon_directory / icon)),
-				key.capitalize(),
-				self,
-			)
+			with self.startup_profiler.span(f"{key} button ({icon})", "icon"):
+				button_icon = QIcon(
+					str(Path(self.basedir) / icon_directory / icon)
+				)
+			button_action = QAction(button_icon, key.capitalize(), self)
 
 			button_action.triggered.connect(self.create_lambda(_next_command))
 
@@ -982,9 +1072,11 @@ class Status(QMainWindow):
 		self.commands_used.append(self.command)
 		self.command_exit_code.append(-1)  # -1  command is in process
 		self.command_states.append(None)  # Will be updated when state pushed
+		self.command_metrics.append(None)  # Set when command returns
 		print(f"\nStarting {self.command} command: \n")
 
 		active_commands = ( # noqa: F841
+			"Append evaluations", "Approximate line of sight",
 			"Center", "Cluster", "Compare", "Configuration", "Correlations",
 			"Deactivate", "Evaluations", "Factor analysis",
 			"Factor analysis machine learning", "Grouped data", "Individuals",
@@ -1012,10 +1104,12 @@ class Status(QMainWindow):
 			"Print evaluations", "Print grouped data", "Print individuals",
 			"Print sample design", "Print sample repetitions",
 			"Print sample solutions", "Print scores",
-			"Print similarities", "Print target", "Ranks differences",
+			"Print similarities", "Print target", "Profile",
+			"Ranks differences",
 			"Ranks distances", "Ranks similarities",
 			"Save configuration",
-			"Save correlations", "Save individuals", "Save sample design",
+			"Save correlations", "Save history", "Save individuals",
+			"Save sample design",
 			"Save sample repetitions", "Save sample solutions",
 			"Save scores", "Save similarities","Save target",
 			"Second dimension", "Segments","Shepard",
@@ -1226,7 +1320,6 @@ class Status(QMainWindow):
 
 	def create_widgets_for_output_and_log_tabs(self) -> None:
 		_tab_output_layout = self.tab_output_layout
-		_tab_log_layout = self.tab_log_layout
 
 		for i in reversed(range(_tab_output_layout.count())):
 			widget = _tab_output_layout.itemAt(i).widget()
@@ -1234,16 +1327,19 @@ class Status(QMainWindow):
 				widget.setParent(None)
 		table_to_output = BuildOutputForGUI(self)
 		_tab_output_layout.addWidget(table_to_output)
-		table_to_log = BuildOutputForGUI(self)
-		spacer = QSpacerItem(20, 40,
-			QSizePolicy.Minimum, # ty: ignore[unresolved-attribute]
-			QSizePolicy.Fixed) # ty: ignore[unresolved-attribute]
-		# Adjust size as needed
-		_tab_log_layout.addItem(spacer)
-		_tab_log_layout.addWidget(table_to_log)
+		# The Log tab shows the same widget once the Output tab lets it go.
+		# A script's commands are recorded after it, so its own state
+		# is not the last one
+		command_state = self.command_states[-1]
+		if command_state is None or self.commands_used[-1] != self.command:
+			command_params = {}
+		else:
+			command_params = command_state.command_params
+		self.command_log.add_entry(
+			self.command, command_params, table_to_output
+		)
 
 		self.tab_output_layout = _tab_output_layout
-		self.tab_log_layout = _tab_log_layout
 
 		return
 
@@ -1568,6 +1664,7 @@ class EstablishSpacesStructure:
 		self.commands_used: list[str] = ["Initialize"]
 		self.command_exit_code: list[int] = [0]
 		self.command_states: list[CommandState | None] = [None]
+		self.command_metrics: list[CommandMetrics | None] = [None]
 		self.command: str = ""
 		self.undo_stack: list[CommandState] = []
 		self.undo_stack_source: list[str] = ["Initialize"]
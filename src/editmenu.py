@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pandas as pd
 import peek  # noqa: F401
-from PySide6.QtWidgets import QTableWidget, QTableWidgetItem
+from PySide6.QtWidgets import QTableView, QTableWidget, QTableWidgetItem
 from typing import TYPE_CHECKING
 
 from command_state import CommandState
@@ -164,7 +164,7 @@ class RedoCommand:
 
 	# ------------------------------------------------------------------------
 
-	def _display(self) -> QTableWidget:
+	def _display(self) -> QTableView:
 		"""Create and return the table widget for the redo output.
 
 		This method is called by the widget system after execute()
@@ -179,14 +179,14 @@ class RedoCommand:
 
 	def _build_restoration_table(
 		self, cmd_state: CommandState
-	) -> QTableWidget:
+	) -> QTableView:
 		"""Build and return a table widget showing what was restored.
 
 		Args:
 			cmd_state: The CommandState containing restoration details
 
 		Returns:
-			QTableWidget displaying the restoration details
+			QTableView displaying the restoration details
 		"""
 		# Extract restoration details from cmd_state
 		restoration_data = self._extract_restoration_details(cmd_state)
@@ -205,22 +205,22 @@ class RedoCommand:
 			restoration_data, columns=pd.Index(columns)
 		)
 
-		# Create table widget
-		table_widget: QTableWidget = QTableWidget(df.shape[0], df.shape[1])
-		# Fill table with data
+		# Create table view
+		table_view: QTableView = QTableView()
+		# Show the table data
 		self._director.common.fill_table_with_formatted_data(
-			table_widget, df, ["s", "s"]  # Both columns are strings
+			table_view, df, ["s", "s"]  # Both columns are strings
 		)
 
 		# Set headers
 		self._director.common.set_column_and_row_headers(
-			table_widget, ["Items Restored", "Details"], []
+			table_view, ["Items Restored", "Details"], []
 		)
 
 		# Resize and finalize
-		self._director.common.resize_and_set_table_size(table_widget, 4)
+		self._director.common.resize_and_set_table_size(table_view, 4)
 
-		return table_widget
+		return table_view
 
 	# ------------------------------------------------------------------------
 
@@ -363,7 +363,7 @@ class UndoCommand:
 
 	# ------------------------------------------------------------------------
 
-	def _display(self) -> QTableWidget:
+	def _display(self) -> QTableView:
 		"""Create and return the table widget for the undo output.
 
 		This method is called by the widget system after execute()
@@ -378,14 +378,14 @@ class UndoCommand:
 
 	def _build_restoration_table(
 		self, cmd_state: CommandState
-	) -> QTableWidget:
+	) -> QTableView:
 		"""Build and return a table widget showing what was restored.
 
 		Args:
 			cmd_state: The CommandState containing restoration details
 
 		Returns:
-			QTableWidget displaying the restoration details
+			QTableView displaying the restoration details
 		"""
 		# Extract restoration details from cmd_state
 		restoration_data = self._extract_restoration_details(cmd_state)
@@ -404,22 +404,22 @@ class UndoCommand:
 			restoration_data, columns=pd.Index(columns)
 		)
 
-		# Create table widget
-		table_widget: QTableWidget = QTableWidget(df.shape[0], df.shape[1])
-		# Fill table with data
+		# Create table view
+		table_view: QTableView = QTableView()
+		# Show the table data
 		self._director.common.fill_table_with_formatted_data(
-			table_widget, df, ["s", "s"]  # Both columns are strings
+			table_view, df, ["s", "s"]  # Both columns are strings
 		)
 
 		# Set headers
 		self._director.common.set_column_and_row_headers(
-			table_widget, ["Items Restored", "Details"], []
+			table_view, ["Items Restored", "Details"], []
 		)
 
 		# Resize and finalize
-		self._director.common.resize_and_set_table_size(table_widget, 4)
+		self._director.common.resize_and_set_table_size(table_view, 4)
 
-		return table_widget
+		return table_view
 
 	# ------------------------------------------------------------------------
 
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from compact_evaluations import is_compact
+from constants import APPROXIMATE_LOS_CONFIDENCE
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	import pandas as pd
+
+# --------------------------------------------------------------------------
+
+
+class EvaluationPairs:
+	"""The sum and the difference of each individual's evaluations of
+	every pair of items, from which line of sight ranks the pairs.
+
+	Line of sight reflects each item's evaluations about their maximum
+	before adding and subtracting them, and the maximum depends on which
+	individuals are included. The reflected sum of items a and b is
+	max_a + max_b - (a + b) and the reflected difference is
+	|(max_a - max_b) - (a - b)|, so the unreflected sums and differences
+	are computed once for all individuals and those of any subset of them,
+	such as an uncertainty repetition, are taken from them with only the
+	subset's maxima still to find.
+
+	Pairs are in the order item 0 with items 1, 2, ..., then item 1 with
+	items 2, 3, ... and so on.
+	"""
+
+	def __init__(self, evaluations: pd.DataFrame) -> None:
+		# Whole-number evaluations are exact in float32 at half the memory
+		dtype = np.float32 if is_compact(evaluations) else np.float64
+		self._values = evaluations.to_numpy(dtype=dtype, na_value=np.nan)
+		item_names = [str(name) for name in evaluations.columns]
+		(self._first_items, self._second_items) = np.triu_indices(
+			len(item_names), k=1
+		)
+		self.pair_names = [
+			f"{item_names[first]}_{item_names[second]}"
+			for first, second in zip(
+				self._first_items, self._second_items, strict=True
+			)
+		]
+		self._sums = (
+			self._values[:, self._first_items]
+			+ self._values[:, self._second_items]
+		)
+		self._differences = (
+			self._values[:, self._first_items]
+			- self._values[:, self._second_items]
+		)
+
+	# ------------------------------------------------------------------------
+
+	def reflected_sums_and_differences(
+		self, cases: np.ndarray | None = None
+	) -> tuple[np.ndarray, np.ndarray]:
+		"""Return the reflected sums and absolute differences of every
+		pair, a row per individual in cases, or for all individuals when
+		cases is None.
+		"""
+		if cases is None:
+			values = self._values
+			sums = self._sums
+			differences = self._differences
+		else:
+			values = self._values[cases]
+			sums = self._sums[cases]
+			differences = self._differences[cases]
+		# As Series.max, ignoring missing evaluations
+		maxima = np.fmax.reduce(values, axis=0)
+		reflected_sums = (
+			maxima[self._first_items] + maxima[self._second_items] - sums
+		)
+		reflected_differences = np.abs(
+			(maxima[self._first_items] - maxima[self._second_items])
+			- differences
+		)
+		return reflected_sums, reflected_differences
+
+
+# --------------------------------------------------------------------------
+
+
+def sample_size_for_tolerance(tolerance: float, npairs: int) -> int:
+	"""Return how many individuals, sampled at random, put the quantiles
+	of every pair's sums and differences within tolerance of those of all
+	individuals with APPROXIMATE_LOS_CONFIDENCE.
+
+	By the Dvoretzky-Kiefer-Wolfowitz inequality, the empirical
+	distribution of n draws is further than tolerance from the true one
+	with probability at most 2 exp(-2 n tolerance^2); that risk is shared
+	among the two distributions, sums and differences, of each pair.
+	"""
+	risk = (1.0 - APPROXIMATE_LOS_CONFIDENCE) / max(2 * npairs, 1)
+	return math.ceil(math.log(2.0 / risk) / (2.0 * tolerance**2))
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from compact_evaluations import fits_uint8
+from constants import QUANTILE_SKETCH_SIZE
+
+# Rows at the start of a chunk whose means centre its sums of squares
+_SHIFT_ROWS: int = 1024
+
+# --------------------------------------------------------------------------
+
+
+class EvaluationsAccumulator:
+	"""Statistics of evaluations accumulated a chunk of rows at a time.
+
+	Each chunk's statistics are merged into those of the chunks before it
+	as in Welford's algorithm, generalized by Chan et al. to chunks, so
+	evaluations are passed over once, need never be in memory together,
+	and can be added to as more arrive. For each pair of items the
+	statistics are over the individuals who evaluated both, as
+	DataFrame.corr computes them; an item's own statistics are those of
+	the pair it makes with itself. Quartiles come from a _QuantileSketch
+	per item.
+	"""
+
+	def __init__(self, item_names: list[str]) -> None:
+		self.item_names = item_names
+		nitem = len(item_names)
+		# [i, j] is over those who evaluated both i and j; means[i, j] and
+		# sums_of_squares[i, j] are of item i's evaluations
+		self.n_both = np.zeros((nitem, nitem))
+		self.means = np.zeros((nitem, nitem))
+		self.sums_of_squares = np.zeros((nitem, nitem))
+		self.cross_products = np.zeros((nitem, nitem))
+		self.minima = np.full(nitem, np.inf)
+		self.maxima = np.full(nitem, -np.inf)
+		rng = np.random.default_rng(0)
+		self._sketches = [_QuantileSketch(rng) for _ in range(nitem)]
+
+	# ------------------------------------------------------------------------
+
+	def add(self, chunk: np.ndarray) -> None:
+		"""Add a chunk of evaluations, a row per individual and missing
+		evaluations as NaN.
+		"""
+		if chunk.shape[0] == 0:
+			return
+		missing = np.isnan(chunk)
+		any_missing = bool(missing.any())
+		# Centred near the chunk's means the chunk's sums of squares are
+		# small, so computing them directly loses little. The first rows
+		# are near enough and much cheaper than the whole chunk
+		with np.errstate(invalid="ignore"), warnings.catch_warnings():
+			warnings.simplefilter("ignore", RuntimeWarning)
+			shift = np.nan_to_num(
+				np.nanmean(chunk[:_SHIFT_ROWS], axis=0)
+			)
+		values = chunk - shift
+		if any_missing:
+			values[missing] = 0.0
+			weights = (~missing).astype(np.float64)
+			n_chunk = weights.T @ weights
+			sums = values.T @ weights
+			chunk_cross_products = values.T @ values
+			# Squared in place, as nothing else needs values after this
+			np.square(values, out=values)
+			squares = values.T @ weights
+		else:
+			# Every pair is over every individual in the chunk, so each
+			# item's statistics are the same whichever item it is paired
+			# with
+			n_rows = float(chunk.shape[0])
+			n_chunk = np.full(self.n_both.shape, n_rows)
+			sums = np.broadcast_to(
+				values.sum(axis=0)[:, np.newaxis], self.n_both.shape
+			)
+			chunk_cross_products = values.T @ values
+			squares = np.broadcast_to(
+				np.einsum("ri,ri->i", values, values)[:, np.newaxis],
+				self.n_both.shape,
+			)
+		with np.errstate(divide="ignore", invalid="ignore"):
+			chunk_means = np.where(n_chunk > 0, sums / n_chunk, 0.0)
+		chunk_sums_of_squares = squares - sums * chunk_means
+		chunk_cross_products -= sums * chunk_means.T
+		chunk_means += shift[:, np.newaxis]
+
+		# Merge with the statistics so far
+		n_total = self.n_both + n_chunk
+		with np.errstate(divide="ignore", invalid="ignore"):
+			share = np.where(n_total > 0, n_chunk / n_total, 0.0)
+		delta = np.where(n_chunk > 0, chunk_means - self.means, 0.0)
+		weight = self.n_both * share
+		self.means += delta * share
+		self.sums_of_squares += chunk_sums_of_squares + delta**2 * weight
+		self.cross_products += chunk_cross_products + delta * delta.T * weight
+		self.n_both = n_total
+
+		counts = self._count_chunk(chunk, missing)
+		if counts is None:
+			# fmin and fmax pass over missing evaluations
+			chunk_minima = np.fmin.reduce(chunk, axis=0)
+			chunk_maxima = np.fmax.reduce(chunk, axis=0)
+			for each_item, sketch in enumerate(self._sketches):
+				sketch.add(chunk[~missing[:, each_item], each_item])
+		else:
+			# The extremes are the first and last values counted
+			counted = counts > 0
+			any_counted = counted.any(axis=1)
+			chunk_minima = np.where(
+				any_counted, counted.argmax(axis=1), np.nan
+			)
+			chunk_maxima = np.where(
+				any_counted,
+				counts.shape[1] - 1 - counted[:, ::-1].argmax(axis=1),
+				np.nan,
+			)
+			for each_item, sketch in enumerate(self._sketches):
+				sketch.add_counts(counts[each_item])
+		self.minima = np.fmin(self.minima, chunk_minima)
+		self.maxima = np.fmax(self.maxima, chunk_maxima)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _count_chunk(
+		self, chunk: np.ndarray, missing: np.ndarray
+	) -> np.ndarray | None:
+		"""Return how many times each item was given each of 0 to 255, a
+		row per item, while every sketch is counting and the chunk is whole
+		numbers from 0 to 255, or else None.
+
+		Every item is counted in one bincount, each item's values offset
+		from the others' and missing evaluations counted in a last bin,
+		which is dropped.
+		"""
+		if not all(sketch.counting for sketch in self._sketches):
+			return None
+		with np.errstate(invalid="ignore"):
+			codes = chunk.astype(np.intp)
+		codes[missing] = 0
+		n_values = np.iinfo(np.uint8).max + 1
+		if (
+			codes.size == 0
+			or codes.min() < 0
+			or codes.max() >= n_values
+			or not ((codes == chunk) | missing).all()
+		):
+			return None
+		nitem = len(self._sketches)
+		codes[missing] = n_values
+		codes += np.arange(nitem) * (n_values + 1)
+		counts = np.bincount(
+			codes.ravel(), minlength=nitem * (n_values + 1)
+		).reshape(nitem, n_values + 1)
+		return counts[:, :-1]
+
+	# ------------------------------------------------------------------------
+
+	def covariances(self) -> pd.DataFrame:
+		with np.errstate(divide="ignore", invalid="ignore"):
+			covariances = self.cross_products / (self.n_both - 1)
+		return self._square_frame(covariances)
+
+	# ------------------------------------------------------------------------
+
+	def correlations(self) -> pd.DataFrame:
+		with np.errstate(divide="ignore", invalid="ignore"):
+			correlations = np.clip(
+				self.cross_products
+				/ np.sqrt(self.sums_of_squares * self.sums_of_squares.T),
+				-1.0,
+				1.0,
+			)
+		return self._square_frame(correlations)
+
+	# ------------------------------------------------------------------------
+
+	def summary(self) -> pd.DataFrame:
+		"""Return each item's mean, standard deviation, minimum, quartiles
+		and maximum.
+		"""
+		counts = np.diag(self.n_both)
+		evaluated = counts > 0
+		with np.errstate(divide="ignore", invalid="ignore"):
+			stds = np.sqrt(np.diag(self.sums_of_squares) / (counts - 1))
+		quartiles = np.array(
+			[sketch.quantiles([0.25, 0.5, 0.75]) for sketch in self._sketches]
+		).reshape(len(self.item_names), 3)
+		return pd.DataFrame(
+			{
+				"Mean": np.where(evaluated, np.diag(self.means), np.nan),
+				"Standard\nDeviation": stds,
+				"Min": np.where(evaluated, self.minima, np.nan),
+				"First\nquartile": quartiles[:, 0],
+				"Median": quartiles[:, 1],
+				"Third\nquartile": quartiles[:, 2],
+				"Max": np.where(evaluated, self.maxima, np.nan),
+			},
+			index=pd.Index(self.item_names),
+		)
+
+	# ------------------------------------------------------------------------
+
+	def _square_frame(self, values: np.ndarray) -> pd.DataFrame:
+		return pd.DataFrame(
+			values,
+			index=pd.Index(self.item_names),
+			columns=pd.Index(self.item_names),
+		)
+
+
+# --------------------------------------------------------------------------
+
+
+class _QuantileSketch:
+	"""Quantiles of one item's evaluations, added any number at a time.
+
+	While every evaluation is a whole number from 0 to 255, as thermometer
+	ratings are, a count of each is kept and quantiles are exact. After
+	that, a uniform random sample of at most QUANTILE_SKETCH_SIZE
+	evaluations is kept instead, those given the smallest random keys, so
+	that the sample stays uniform as evaluations are added. It holds every
+	evaluation, and so is exact, until there are more than that.
+	"""
+
+	def __init__(self, rng: np.random.Generator) -> None:
+		self._rng = rng
+		self._counts: np.ndarray | None = np.zeros(
+			np.iinfo(np.uint8).max + 1, dtype=np.int64
+		)
+		self._sample = np.empty(0)
+		self._keys = np.empty(0)
+
+	@property
+	def counting(self) -> bool:
+		return self._counts is not None
+
+	def add_counts(self, counts: np.ndarray) -> None:
+		"""Add how many times each of 0 to 255 was given, while counting."""
+		self._counts += counts
+
+	def add(self, values: np.ndarray) -> None:
+		if self._counts is not None:
+			if fits_uint8(values):
+				self._counts += np.bincount(
+					values.astype(np.intp), minlength=self._counts.size
+				)
+				return
+			self._sample_counts()
+		sample = np.concatenate([self._sample, values])
+		keys = np.concatenate([self._keys, self._rng.random(values.size)])
+		if sample.size > QUANTILE_SKETCH_SIZE:
+			kept = np.argpartition(keys, QUANTILE_SKETCH_SIZE)[
+				:QUANTILE_SKETCH_SIZE
+			]
+			sample = sample[kept]
+			keys = keys[kept]
+		self._sample = sample
+		self._keys = keys
+
+	def _sample_counts(self) -> None:
+		"""Replace the counts by a uniform sample of the evaluations counted,
+		drawn from the counts without listing every evaluation.
+		"""
+		counts = self._counts
+		self._counts = None
+		n = int(counts.sum())
+		size = min(n, QUANTILE_SKETCH_SIZE)
+		drawn = self._rng.multivariate_hypergeometric(counts, size)
+		self._sample = np.repeat(
+			np.arange(counts.size, dtype=np.float64), drawn
+		)
+		# The smallest size of n uniform keys, as the cumulative sums of
+		# exponential spacings, given to the drawn evaluations in random
+		# order
+		spacings = np.cumsum(self._rng.exponential(size=size))
+		total = (spacings[-1] if size else 0.0) + self._rng.gamma(n - size + 1)
+		self._keys = self._rng.permutation(spacings / total)
+
+	def quantiles(self, probabilities: list[float]) -> np.ndarray:
+		"""Return the quantiles, interpolated as numpy.quantile does."""
+		if self._counts is None:
+			if self._sample.size == 0:
+				return np.full(len(probabilities), np.nan)
+			return np.quantile(self._sample, probabilities)
+		n = int(self._counts.sum())
+		if n == 0:
+			return np.full(len(probabilities), np.nan)
+		positions = (n - 1) * np.asarray(probabilities)
+		below = np.floor(positions).astype(np.int64)
+		# The value at each rank, from the cumulative counts
+		cumulative = np.cumsum(self._counts)
+		lower = np.searchsorted(cumulative, below, side="right")
+		upper = np.searchsorted(
+			cumulative, np.minimum(below + 1, n - 1), side="right"
+		)
+		return lower + (positions - below) * (upper - lower)
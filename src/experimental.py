@@ -3,7 +3,7 @@ from __future__ import annotations
 import pandas as pd
 import peek  # noqa: F401
 
-from pyqtgraph.Qt import QtCore
+from PySide6 import QtCore
 from PySide6.QtWidgets import (
 	QTableWidget,
 	QTableWidgetItem,
@@ -8,19 +8,23 @@ import numpy as np
 import pandas as pd
 import peek # noqa: F401
 
-import scipy.stats as ss
-
+from compact_evaluations import compact_evaluations
+from evaluations_accumulator import EvaluationsAccumulator
 from experimental import ItemFrame
 from geometry import PeoplePoints
-from typing import TYPE_CHECKING, Any
+from mapped_evaluations import MappedEvaluations
+from respondent_index import RespondentIndex
+from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
+	from collections.abc import Iterator
 	from common import Spaces
 	from director import Status
 # from constants import (
 #     MAXIMUM_NUMBER_OF_DIMENSIONS_FOR_PLOTTING,
 # )
 
+from constants import EVALUATIONS_CHUNK_ROWS
 from exceptions import DependencyError, SpacesError
 
 # --------------------------------------------------------------------------
@@ -554,6 +558,7 @@ class ConfigurationFeature:
 
 	# ------------------------------------------------------------------------
 	def rank_distances(self) -> None:
+		import scipy.stats as ss  # noqa: PLC0415
 
 		point_names = self.point_names
 		point_labels = self.point_labels
@@ -752,6 +757,12 @@ class EvaluationsFeature:
 		self.nevaluators: int = 0
 		self.universe_size: int = 0
 		self.evaluations: pd.DataFrame = pd.DataFrame()
+		# When evaluations is a frame over a memory-mapped file, the
+		# MappedEvaluations keeping the file
+		self.mapped: MappedEvaluations | None = None
+		# The statistics of evaluations, once accumulated
+		self.accumulator: EvaluationsAccumulator | None = None
+		self._accumulated_evaluations: pd.DataFrame | None = None
 		self.stats_eval: pd.DataFrame = pd.DataFrame()
 		self.avg_eval: pd.Series = pd.Series()
 		# if not self._director.pyqtgraph_common.have_sample_design():
@@ -768,44 +779,40 @@ class EvaluationsFeature:
 
 	# ------------------------------------------------------------------------
 
-	def summarize_evaluations(self) -> None:
+	def evaluation_chunks(
+		self, chunk_rows: int = EVALUATIONS_CHUNK_ROWS, first_row: int = 0
+	) -> Iterator[np.ndarray]:
+		"""Yield the evaluations from first_row on, chunk_rows rows at a
+		time, as float64 arrays, missing evaluations as NaN.
+
+		Only one chunk is converted at a time, so a pass over evaluations
+		in a memory-mapped file reads it from disk as it goes.
+		"""
 		evaluations = self.evaluations
-		# stats_eval = self.stats_eval
-		# avg_eval = self.avg_eval
-		temp_stats_eval = evaluations.describe(
-			percentiles=[0.25, 0.5, 0.75]
-		).transpose()
-		stats_eval = temp_stats_eval[
-			["mean", "std", "min", "max", "25%", "50%", "75%"]
-		]
-		stats_eval.columns = [
-			"Mean",
-			"Standard\nDeviation",
-			"Min",
-			"Max",
-			"First\nquartile",
-			"Median",
-			"Third\nquartile",
-		]
-		new_order = [
-			"Mean",
-			"Standard\nDeviation",
-			"Min",
-			"First\nquartile",
-			"Median",
-			"Third\nquartile",
-			"Max",
-		]
-		stats_eval = stats_eval.reindex(columns=new_order)
+		for start in range(first_row, len(evaluations), chunk_rows):
+			yield evaluations.iloc[start : start + chunk_rows].to_numpy(
+				dtype=np.float64, na_value=np.nan
+			)
+
+	# ------------------------------------------------------------------------
+
+	def correlations(self) -> pd.DataFrame:
+		"""Return the Pearson correlations between items, each over the
+		individuals who evaluated both items, as DataFrame.corr computes
+		them.
+		"""
+		return self.accumulated_statistics().correlations()
+
+	# ------------------------------------------------------------------------
+
+	def summarize_evaluations(self) -> None:
+		stats_eval = self.accumulated_statistics().summary()
 		stats_eval_sorted = stats_eval.sort_values(by="Mean", ascending=False)
-		# stats_eval_sorted = pd.DataFrame(stats_eval_sorted)
 		names_eval_sorted = stats_eval_sorted.index.tolist()
-		# columns = stats_eval_sorted.columns.tolist()
 
-		avg_eval = evaluations.mean()
+		avg_eval = stats_eval["Mean"].rename(None)
 		avg_eval.sort_values(inplace=True)
 
-		# self.stats_eval = stats_eval
 		self.stats_eval_sorted = stats_eval_sorted
 		self.names_eval_sorted = names_eval_sorted
 		self.avg_eval = avg_eval
@@ -814,6 +821,69 @@ class EvaluationsFeature:
 
 	# ------------------------------------------------------------------------
 
+	def accumulated_statistics(self) -> EvaluationsAccumulator:
+		"""Return the statistics of the evaluations, accumulated in one
+		chunked pass over them the first time they are needed.
+
+		The statistics are accumulated again if evaluations has been
+		replaced since.
+		"""
+		if (
+			self.accumulator is None
+			or self._accumulated_evaluations is not self.evaluations
+		):
+			accumulator = EvaluationsAccumulator(
+				self.evaluations.columns.tolist()
+			)
+			for chunk in self.evaluation_chunks():
+				accumulator.add(chunk)
+			self.accumulator = accumulator
+			self._accumulated_evaluations = self.evaluations
+		return self.accumulator
+
+	# ------------------------------------------------------------------------
+
+	def append_evaluations(self, appended: pd.DataFrame) -> None:
+		"""Add the evaluations of more individuals, of the same items, after
+		those of the individuals already here.
+
+		The evaluations already here are kept as they are held, in memory
+		or in a memory-mapped file, and the statistics of the appended
+		evaluations are added to those accumulated so far rather than
+		accumulated again over all of them.
+		"""
+		accumulator = self.accumulated_statistics()
+		first_appended = len(self.evaluations)
+		appended = compact_evaluations(appended)
+		if self.mapped is None:
+			self.evaluations = pd.concat(
+				[self.evaluations, appended], ignore_index=True
+			)
+		else:
+			# The mapped file is read-only, so the evaluations are copied
+			# to a larger one a chunk of rows at a time
+			mapped = MappedEvaluations(
+				self.item_names, first_appended + len(appended)
+			)
+			for start in range(0, first_appended, EVALUATIONS_CHUNK_ROWS):
+				mapped.write_rows(
+					start,
+					self.evaluations.iloc[
+						start : start + EVALUATIONS_CHUNK_ROWS
+					],
+				)
+			mapped.write_rows(first_appended, appended)
+			mapped.finish_writing()
+			self.mapped = mapped
+			self.evaluations = mapped.frame
+		self.nevaluators = len(self.evaluations)
+		for chunk in self.evaluation_chunks(first_row=first_appended):
+			accumulator.add(chunk)
+		self._accumulated_evaluations = self.evaluations
+		return
+
+	# ------------------------------------------------------------------------
+
 
 class GroupedDataFeature:
 	def __init__(self, director: Status) -> None:
@@ -964,6 +1034,11 @@ class ScoresFeature:
 		self.vert_max: float = 0.0
 		self.vert_min: float = 0.0
 		self.offset: float = 0.0
+		# When Score individuals calculated the scores, the weights and
+		# offsets by which each individual's evaluations become their
+		# scores
+		self.score_weights: np.ndarray = np.empty((0, 2))
+		self.score_offsets: np.ndarray = np.empty(0)
 
 		self._hor_max: float = 0.0
 		self._hor_min: float = 0.0
@@ -977,6 +1052,35 @@ class ScoresFeature:
 		self.n_clusters: int = 0
 		self.original_clustered_data: pd.DataFrame | None = None
 
+		# Spatial index used to pick individuals on plots
+		self.respondent_index: RespondentIndex | None = None
+		self._indexed_scores: tuple[pd.Series, pd.Series] | None = None
+		self.selected_individuals: np.ndarray = np.array([], dtype=np.intp)
+
+	# ------------------------------------------------------------------------
+
+	def index_respondents(self) -> None:
+		"""Build the spatial index over score_1 and score_2."""
+		self.respondent_index = RespondentIndex(self.score_1, self.score_2)
+		self._indexed_scores = (self.score_1, self.score_2)
+		self.selected_individuals = np.array([], dtype=np.intp)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def current_respondent_index(self) -> RespondentIndex:
+		"""Return the spatial index, rebuilding it if the scores have been
+		replaced since it was built, as by Open scores or Invert.
+		"""
+		if (
+			self.respondent_index is None
+			or self._indexed_scores is None
+			or self._indexed_scores[0] is not self.score_1
+			or self._indexed_scores[1] is not self.score_2
+		):
+			self.index_respondents()
+		return cast("RespondentIndex", self.respondent_index)
+
 	# ------------------------------------------------------------------------
 
 	def print_scores(self) -> None:
@@ -1374,6 +1478,7 @@ class SimilaritiesFeature:
 	# ------------------------------------------------------------------------
 
 	def rank_similarities(self) -> None:
+		import scipy.stats as ss  # noqa: PLC0415
 
 		nitem = self.nitem
 		item_names = self.item_names
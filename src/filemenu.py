@@ -6,6 +6,7 @@ from pathlib import Path
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, TextIO
 
+import numpy as np
 import pandas as pd
 import peek # noqa: F401
 from PySide6.QtWidgets import (
@@ -17,7 +18,9 @@ from PySide6.QtWidgets import (
 	QTextEdit,
 )
 
+from command_metrics import describe_exit_code, measure_command
 from command_state import CommandState
+from compact_evaluations import compact_evaluations
 # from features import UncertaintyFeature
 from modelmenu import UncertaintyAnalysis
 
@@ -28,10 +31,12 @@ if TYPE_CHECKING:
 from exceptions import SpacesError
 from rivalry import Rivalry
 from constants import(
+	EVALUATIONS_MAPPING_THRESHOLD,
 	MAXIMUM_NUMBER_OF_DIMENSIONS_FOR_PLOTTING,
 	MAXIMUM_NUMBER_OF_DIMENSIONS_FOR_UNCERTAINTY,
 	MINIMUM_NUMBER_OF_ITEMS_IN_EVALUATIONS_FILE,
-	MINIMUM_NUMBER_OF_DIMENSIONS_FOR_PLOTTING
+	MINIMUM_NUMBER_OF_DIMENSIONS_FOR_PLOTTING,
+	SCORES_RECALCULATED_TO_CHECK,
 )
 
 if __name__ == "__main__":  # pragma: no cover
@@ -714,7 +719,7 @@ class EvaluationsCommand:
 		self.common = common
 		self._director.command = "Evaluations"
 		self._evaluations_caption = "Open evaluations"
-		self._evaluations_filter = "*.csv"
+		self._evaluations_filter = "*.csv *.npz *.parquet"
 		self._evaluations_error_bad_input_title = "Evaluations problem"
 		self._evaluations_error_bad_input_message = (
 			"Input is inconsistent with an evaluations file.\nLook at "
@@ -752,10 +757,24 @@ class EvaluationsCommand:
 		self._clear_linked_correlations_if_needed()
 
 		try:
-			# Read CSV with type validation
-			evaluations = self.common.read_csv_with_type_check(
-				file_name, "EVALUATIONS"
-			)
+			# Read CSV with type validation, into a memory-mapped file
+			# when too large to be comfortably held in memory
+			mapped = None
+			if (
+				Path(file_name).is_file()
+				and Path(file_name).stat().st_size
+				>= EVALUATIONS_MAPPING_THRESHOLD
+			):
+				mapped = self.common.map_evaluations_with_type_check(
+					file_name
+				)
+				evaluations = mapped.frame
+			else:
+				evaluations = compact_evaluations(
+					self.common.read_csv_with_type_check(
+						file_name, "EVALUATIONS"
+					)
+				)
 			(nevaluators, nreferent) = evaluations.shape
 			nitem = nreferent
 			range_items = range(nreferent)
@@ -777,6 +796,7 @@ class EvaluationsCommand:
 
 			# Now set the attributes on the new object
 			self._director.evaluations_active.evaluations = evaluations
+			self._director.evaluations_active.mapped = mapped
 			self._director.evaluations_active.nevaluators = nevaluators
 			self._director.evaluations_active.nreferent = nreferent
 			self._director.evaluations_active.nitem = nitem
@@ -824,9 +844,10 @@ class EvaluationsCommand:
 		nreferent = self._director.evaluations_active.nreferent
 		item_names = self._director.evaluations_active.item_names
 		item_labels = self._director.evaluations_active.item_labels
-		evaluations = self._director.evaluations_active.evaluations
 
-		correlations_as_dataframe = evaluations.corr(method="pearson")
+		correlations_as_dataframe = (
+			self._director.evaluations_active.correlations()
+		)
 
 		correlations = []
 		for each_col in range(1, nreferent):
@@ -859,6 +880,167 @@ class EvaluationsCommand:
 	# ------------------------------------------------------------------------
 
 
+class AppendEvaluationsCommand(EvaluationsCommand):
+	"""The Append evaluations command is used to add the evaluations of
+	more individuals, such as a new wave of respondents, to the active
+	evaluations.
+
+	Correlations and summary statistics are updated by adding the new
+	evaluations to those accumulated so far. If scores have been
+	calculated, only the new individuals are scored, as those before them
+	were, and if individuals have been assigned to segments, only the new
+	individuals are assigned.
+	"""
+
+	def __init__(self, director: Status, common: Spaces) -> None:
+		super().__init__(director, common)
+		self._director.command = "Append evaluations"
+		self._evaluations_caption = "Append evaluations"
+		self._scores_error_title = "Scores cannot be extended"
+		self._scores_error_message = (
+			"The active scores were not calculated from the active "
+			"evaluations by Score individuals.\nDeactivate the scores, "
+			"append the evaluations and then use Score individuals."
+		)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def execute(self, common: Spaces) -> None:
+		common.initiate_command_processes()
+		params = common.get_command_parameters("Append evaluations")
+		file_name: str = params["file"]
+		common.capture_and_push_undo_state(
+			"Append evaluations", "active", params)
+		first_appended = self._director.evaluations_active.nevaluators
+		self._check_scores_follow_from_evaluations(common)
+		self._append_evaluations(file_name)
+		self._compute_correlations_from_evaluations(common)
+		self._director.evaluations_active.summarize_evaluations()
+		if common.have_scores():
+			self._score_appended_individuals(first_appended)
+			if common.have_segments():
+				self._director.rivalry.\
+					assign_appended_individuals_to_segments(first_appended)
+		self._print_appended(common, first_appended)
+		common.create_plot_for_tabs("evaluations")
+		self._director.create_widgets_for_output_and_log_tabs()
+		self._director.record_command_as_successfully_completed()
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _check_scores_follow_from_evaluations(self, common: Spaces) -> None:
+		"""Check that the active scores are those Score individuals
+		calculated, by recalculating the first few of them.
+
+		Scores opened from a file, or changed since they were calculated,
+		cannot be extended to the new individuals.
+		"""
+		if not common.have_scores():
+			return
+		scores_active = self._director.scores_active
+		evaluations_active = self._director.evaluations_active
+		scores = scores_active.scores
+		nchecked = min(len(scores), SCORES_RECALCULATED_TO_CHECK)
+		if not (
+			scores_active.score_weights.shape[0] == evaluations_active.nitem
+			and scores.shape[1] == scores_active.score_weights.shape[1] + 1
+			and len(scores) == evaluations_active.nevaluators
+			and np.allclose(
+				next(evaluations_active.evaluation_chunks(nchecked))
+				@ scores_active.score_weights
+				+ scores_active.score_offsets,
+				scores.iloc[:nchecked, 1:].to_numpy(dtype=np.float64),
+				equal_nan=True,
+			)
+		):
+			common.event_driven_automatic_restoration()
+			raise SpacesError(
+				self._scores_error_title, self._scores_error_message
+			)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _append_evaluations(self, file_name: str) -> None:
+		evaluations_active = self._director.evaluations_active
+		# read_csv_with_type_check handles restoration for its errors
+		appended = self.common.read_csv_with_type_check(
+			file_name, "EVALUATIONS"
+		)
+		if appended.columns.tolist() != evaluations_active.item_names or (
+			not all(
+				pd.api.types.is_numeric_dtype(dtype)
+				for dtype in appended.dtypes
+			)
+		):
+			self.common.event_driven_automatic_restoration()
+			raise SpacesError(
+				self._evaluations_error_title,
+				"The evaluations to append must be numbers, for the same "
+				"items in the same order as the active evaluations.",
+			)
+		evaluations_active.append_evaluations(appended)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _score_appended_individuals(self, first_appended: int) -> None:
+		"""Score the appended individuals with the weights and offsets by
+		which Score individuals scored those before them.
+		"""
+		scores_active = self._director.scores_active
+		evaluations_active = self._director.evaluations_active
+		scores = scores_active.scores
+		appended_scores = pd.DataFrame(
+			np.vstack(
+				[
+					np.empty((0, scores.shape[1] - 1)),
+					*(
+						chunk @ scores_active.score_weights
+						+ scores_active.score_offsets
+						for chunk in evaluations_active.evaluation_chunks(
+							first_row=first_appended
+						)
+					),
+				]
+			),
+			columns=scores.columns[1:],
+		)
+		appended_scores.insert(
+			0,
+			scores.columns[0],
+			evaluations_active.evaluations.index[first_appended:],
+		)
+		scores = pd.concat([scores, appended_scores], ignore_index=True)
+
+		scores_active.scores = scores
+		scores_active.nscored_individ = len(scores)
+		scores_active.range_nscored_individ = range(len(scores))
+		scores_active.score_1 = scores[scores_active.score_1_name]
+		scores_active.score_2 = scores[scores_active.score_2_name]
+		scores_active.summarize_scores()
+		scores_active.index_respondents()
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _print_appended(self, common: Spaces, first_appended: int) -> None:
+		nevaluators = self._director.evaluations_active.nevaluators
+		print(
+			f"\n\t{nevaluators - first_appended} individuals appended to "
+			f"the evaluations of {first_appended}, making {nevaluators}\n"
+		)
+		if common.have_scores():
+			print("\tThe appended individuals have been scored")
+		if common.have_segments():
+			print("\tThe appended individuals have been assigned to segments")
+		return
+
+	# ------------------------------------------------------------------------
+
+
 class ExitCommand:
 	"""The Exit command is used to exit the application."""
 
@@ -1197,7 +1379,7 @@ class IndividualsCommand:
 		self.common = common
 		self._director.command = "Individuals"
 		self._individuals_caption = "Open individuals"
-		self._individuals_filter = "*.csv"
+		self._individuals_filter = "*.csv *.npz *.parquet"
 
 		return
 
@@ -1751,7 +1933,7 @@ class OpenScoresCommand:
 		self.common = common
 		self._director.command = "Open scores"
 		self._scores_caption = "Open scores"
-		self._scores_filter = "*.csv"
+		self._scores_filter = "*.csv *.npz *.parquet"
 		self._scores_error_bad_input_title = "Scores problem"
 		self._scores_error_bad_input_message = (
 			"Input is inconsistent with a scores file.\nLook at "
@@ -2072,6 +2254,16 @@ class OpenScriptCommand:
 
 	# ------------------------------------------------------------------------
 
+	def execute_script_line(self, line: str, line_num: int) -> None:
+		"""Execute one script line on its own, as the benchmarks do to
+		measure each command separately. The caller sets executing_script.
+		"""
+		command_name, params_dict = self.common.parse_script_line(line)
+		self._execute_script_command(command_name, params_dict, line_num)
+		return
+
+	# ------------------------------------------------------------------------
+
 	def _display(self) -> object:
 		"""Display widget for script execution completion.
 
@@ -2145,12 +2337,16 @@ class OpenScriptCommand:
 
 		try:
 			# Instantiate and execute command
-			command_instance = command_class(self._director, self.common)
-			self._director.current_command = command_instance
-
-			self._execute_command_with_signature(
-				command_instance, command_name, params_dict, line_num
-			)
+			with (
+				self._director.command_profiler.profile(self._director),
+				measure_command(self._director),
+			):
+				command_instance = command_class(self._director, self.common)
+				self._director.current_command = command_instance
+
+				self._execute_command_with_signature(
+					command_instance, command_name, params_dict, line_num
+				)
 
 		finally:
 			# Clear script parameters
@@ -2753,6 +2949,100 @@ class SaveGroupedDataCommand:
 # ----------------------------------------------------------------------------
 
 
+class SaveHistoryCommand:
+	"""The Save history command writes the commands used in this session,
+	with their status and metrics, to a CSV file or, when the file name
+	ends in .jsonl, to a JSON lines file.
+	"""
+
+	def __init__(self, director: Status, common: Spaces) -> None:
+		self._director = director
+		self.common = common
+		self._director.command = "Save history"
+		self._director.name_of_file_written_to = ""
+		self._save_history_error_title = "History save problem"
+		self._save_history_error_message = (
+			"Unable to write history file.\n"
+			"Check file path and permissions, then try again."
+		)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def execute(self, common: Spaces) -> None:
+		common.initiate_command_processes()
+		params = common.get_command_parameters("Save history")
+		file_name: str = params["file"]
+		common.capture_and_push_undo_state("Save history", "passive", params)
+		history = self._create_history_df()
+		self._write_history_file(history, file_name)
+		common.name_of_file_written_to = file_name
+		self._print_save_history_confirmation(len(history), file_name)
+		self._director.create_widgets_for_output_and_log_tabs()
+		self._director.set_focus_on_tab("Output")
+		self._director.record_command_as_successfully_completed()
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _create_history_df(self) -> pd.DataFrame:
+		"""One row per command after Initialize; metrics are empty for
+		commands that were not measured, including this one.
+		"""
+		director = self._director
+		rows = []
+		for i in range(1, len(director.commands_used)):
+			metrics = director.command_metrics[i]
+			rows.append({
+				"command": director.commands_used[i],
+				"status": describe_exit_code(director.command_exit_code[i]),
+				"wall_seconds":
+					None if metrics is None else metrics.wall_seconds,
+				"cpu_seconds":
+					None if metrics is None else metrics.cpu_seconds,
+				"peak_rss_delta_bytes":
+					None if metrics is None else metrics.peak_rss_delta_bytes,
+				"undo_snapshot_bytes":
+					None if metrics is None else metrics.undo_snapshot_bytes,
+			})
+		history = pd.DataFrame(rows).astype({
+			"peak_rss_delta_bytes": "Int64",
+			"undo_snapshot_bytes": "Int64",
+		})
+		return history
+
+	# ------------------------------------------------------------------------
+
+	def _write_history_file(
+		self, history: pd.DataFrame, file_name: str
+	) -> None:
+		"""Write history as JSON lines or CSV with error handling."""
+		try:
+			if Path(file_name).suffix.lower() == ".jsonl":
+				history.to_json(file_name, orient="records", lines=True)
+			else:
+				history.to_csv(file_name, index=False)
+		except (OSError, PermissionError, ValueError) as e:
+			raise SpacesError(
+				self._save_history_error_title,
+				self._save_history_error_message,
+			) from e
+
+	# ------------------------------------------------------------------------
+
+	def _print_save_history_confirmation(
+		self, n_commands: int, file_name: str
+	) -> None:
+		print(
+			f"\n\tHistory of {n_commands} commands has been written to:\n"
+			f"\t{file_name}\n"
+		)
+		return
+
+
+# ----------------------------------------------------------------------------
+
+
 class SaveCorrelationsCommand:
 	"""The Save correlations command is used to write a copy of the active
 	correlations to a file.
@@ -2828,7 +3118,7 @@ class SaveIndividualsCommand:
 	def __init__(self, director: Status, common: Spaces) -> None: # noqa: ARG002
 		self._director = director
 		self._director.command = "Save individuals"
-		self._save_individuals_filter = "*.csv"
+		self._save_individuals_filter = "*.csv *.npz *.parquet"
 		self._director.name_of_file_written_to = ""
 		self._save_individuals_error_title = "Individuals save problem"
 		self._save_individuals_error_message = (
@@ -2927,46 +3217,11 @@ class SaveSampleDesignCommand:
 	# ------------------------------------------------------------------------
 
 	def _write_sample_design_file(self, file_name: str) -> None:
-		uncertainty_active = self._director.uncertainty_active
-
-		ndim = uncertainty_active.ndim
-		npoint = uncertainty_active.npoint
-		# nfacets = uncertainty_active.nfacets
-
-		with Path(file_name).open("w", encoding="utf-8") as f:
-			# Line 1: Comment line
-			f.write("# Sample design file created: ")
-
-			# Line 2: Basic dimensions (I4 format)
-			# f.write(f"{ndim:4d}{npoint:4d}{nfacets:4d}\n")
-			f.write(f"{ndim:4d}{npoint:4d}\n")
-			# Section: Description of dimensions
-			for i in range(ndim):
-				dim_label = uncertainty_active.dim_labels[i]
-				dim_name = uncertainty_active.dim_names[i]
-				f.write(f"{dim_label};{dim_name}\n")
-
-			# Section: Description of points
-			for i in range(npoint):
-				point_label = uncertainty_active.point_labels[i]
-				point_name = uncertainty_active.point_names[i]
-				f.write(f"{point_label};{point_name}\n")
-
-			# Section: Description of facets
-			# for i in range(nfacets):
-			# 	facet_label = uncertainty_active.facet_labels[i]
-			# 	facet_name = uncertainty_active.facet_names[i]
-			# 	f.write(f"{facet_label};{facet_name}\n")
-
-			# Section: Sample design data
-			# design_df = uncertainty_active.sample_design_df
-			design_df = uncertainty_active.sample_design
-
-			for row_idx in range(len(design_df)):
-				for col_idx in range(len(design_df.columns)):
-					value = design_df.iloc[row_idx, col_idx]
-					f.write(f"{value:8.4f}")
-				f.write("\n")
+		"""Write the design's parameters and seed, from which it is
+		regenerated when read, rather than every selection.
+		"""
+		self._director.uncertainty_active.sample_design.write(file_name)
+		return
 
 # ----------------------------------------------------------------------------
 
@@ -3164,7 +3419,7 @@ class SaveScoresCommand:
 		self._director = director
 		self.common = common
 		self._director.command = "Save scores"
-		self._save_scores_filter = "*.csv"
+		self._save_scores_filter = "*.csv *.npz *.parquet"
 		self._director.name_of_file_written_to = ""
 		self._save_scores_error_title = "Scores save problem"
 		self._save_scores_error_message = (
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QLabel
+
+from constants import GALLERY_MAXIMUM_THUMBNAILS, GALLERY_THUMBNAIL_WIDTH
+
+if TYPE_CHECKING:
+	from collections.abc import Callable
+	from matplotlib.figure import Figure
+	from PySide6.QtGui import QMouseEvent
+	from PySide6.QtWidgets import QVBoxLayout, QWidget
+	from director import Status
+
+# --------------------------------------------------------------------------
+
+
+class Gallery:
+	"""Keeps one entry per plot in the Gallery tab.
+
+	Each plot is rendered once, for the Plot tab, and saved at full
+	resolution as a PNG file in a temporary directory that is removed when
+	Spaces exits. The Gallery tab shows a thumbnail of each plot; only the
+	most recently used GALLERY_MAXIMUM_THUMBNAILS thumbnails are kept in
+	memory and the rest are reloaded from their files when clicked.
+	Clicking an entry shows the full resolution image in the Plot tab.
+	"""
+
+	def __init__(self, director: Status, layout: QVBoxLayout) -> None:
+		self._director = director
+		self._layout = layout
+		self._layout.addStretch()
+		self._image_directory = tempfile.TemporaryDirectory(
+			prefix="spaces_gallery_"
+		)
+		self._entries: list[_GalleryEntry] = []
+		self._thumbnails: OrderedDict[int, QPixmap] = OrderedDict()
+
+	# ------------------------------------------------------------------------
+
+	def add_figure(self, fig: Figure) -> None:
+		"""Add a matplotlib figure, saved at the resolution it was drawn."""
+		image_file = self._next_image_file()
+		fig.savefig(image_file, dpi=fig.dpi)
+		self._add_entry(image_file)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def add_widget(self, widget: QWidget) -> None:
+		"""Add a plot widget, such as a pyqtgraph GraphicsLayoutWidget,
+		as it is currently rendered.
+		"""
+		image_file = self._next_image_file()
+		widget.grab().save(str(image_file), "PNG")
+		self._add_entry(image_file)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _next_image_file(self) -> Path:
+		image_file = (
+			Path(self._image_directory.name)
+			/ f"plot_{len(self._entries) + 1:05d}.png"
+		)
+		return image_file
+
+	# ------------------------------------------------------------------------
+
+	def _add_entry(self, image_file: Path) -> None:
+		entry_index = len(self._entries)
+		entry = _GalleryEntry(
+			image_file,
+			f"{self._director.command} - click to view",
+			lambda: self.show_full_size(entry_index),
+		)
+		self._entries.append(entry)
+		# Keep the stretch added in __init__ below the entries
+		self._layout.insertWidget(self._layout.count() - 1, entry)
+		self._show_thumbnail(entry_index)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _show_thumbnail(self, entry_index: int) -> None:
+		"""Give the entry its thumbnail, loading it from the image file if
+		it was evicted, and evict the least recently used beyond the cap.
+		"""
+		thumbnail = self._thumbnails.pop(entry_index, None)
+		if thumbnail is None:
+			thumbnail = QPixmap(
+				str(self._entries[entry_index].image_file)
+			).scaledToWidth(
+				GALLERY_THUMBNAIL_WIDTH,
+				Qt.TransformationMode.SmoothTransformation,
+			)
+		self._thumbnails[entry_index] = thumbnail
+		self._entries[entry_index].setPixmap(thumbnail)
+		while len(self._thumbnails) > GALLERY_MAXIMUM_THUMBNAILS:
+			evicted_index, _ = self._thumbnails.popitem(last=False)
+			self._entries[evicted_index].show_caption()
+		return
+
+	# ------------------------------------------------------------------------
+
+	def show_full_size(self, entry_index: int) -> None:
+		"""Show the entry's full resolution image in the Plot tab."""
+		self._show_thumbnail(entry_index)
+		full_size = QLabel()
+		full_size.setPixmap(
+			QPixmap(str(self._entries[entry_index].image_file))
+		)
+		self._director.tab_plot_scroll_area.setWidget(full_size)
+		self._director.set_focus_on_tab("Plot")
+		return
+
+
+# --------------------------------------------------------------------------
+
+
+class _GalleryEntry(QLabel):
+	"""A Gallery tab entry showing a thumbnail, or a caption once its
+	thumbnail has been evicted, which calls on_click when clicked.
+	"""
+
+	def __init__(
+		self, image_file: Path, caption: str, on_click: Callable[[], None]
+	) -> None:
+		super().__init__()
+		self.image_file = image_file
+		self._caption = caption
+		self._on_click = on_click
+		self.setCursor(Qt.CursorShape.PointingHandCursor)
+		self.setToolTip(caption)
+
+	def show_caption(self) -> None:
+		self.clear()
+		self.setText(self._caption)
+
+	def mousePressEvent(self, event: QMouseEvent) -> None:  # noqa: N802
+		self._on_click()
+		super().mousePressEvent(event)
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
 	from collections.abc import Sequence
 
-from pyqtgraph import QtCore
+from PySide6 import QtCore
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QTableWidget, QTableWidgetItem
 from exceptions import SpacesError
@@ -15,6 +15,7 @@ from exceptions import SpacesError
 from constants import (
 	MAXIMUM_NUMBER_OF_ROWS_IN_ACKNOWLEDGEMENTS_TABLE,
 	N_ROWS_IN_STATUS_TABLE,
+	PROFILE_DIRECTORY,
 )
 
 if TYPE_CHECKING:
@@ -276,6 +277,9 @@ class StatusCommand:
 		self._director.common.print_vector_sizing_settings()
 		self._director.common.print_presentation_layer_settings()
 		self._director.common.print_layout_options_settings()
+		print(
+			f"   Startup time: {self._director.startup_seconds:.2f} seconds"
+		)
 		return
 
 	# ------------------------------------------------------------------------
@@ -744,3 +748,48 @@ class TerseCommand:
 	def _print_terse_message(self) -> None:
 		print("\n\tCommands will not include explanations.")
 		return
+
+	# ------------------------------------------------------------------------
+
+
+class ProfileCommand:
+	"""The Profile command switches on cProfile for the next n_commands
+	commands, or switches it off when n_commands is 0.
+	"""
+
+	def __init__(self, director: Status, common: Spaces) -> None:
+		self._director = director
+		self.common = common
+		self._director.command = "Profile"
+		return
+
+	# ------------------------------------------------------------------------
+
+	def execute(self, common: Spaces) -> None:
+		common.initiate_command_processes()
+		params = common.get_command_parameters("Profile")
+		n_commands: int = params["n_commands"]
+		common.capture_and_push_undo_state("Profile", "passive", params)
+		self._director.command_profiler.commands_remaining = n_commands
+		self._print_profile_message(n_commands)
+
+		self._director.help_profile_action.blockSignals(True)  # noqa: FBT003
+		self._director.help_profile_action.setChecked(n_commands > 0)
+		self._director.help_profile_action.blockSignals(False)  # noqa: FBT003
+		self._director.create_widgets_for_output_and_log_tabs()
+		self._director.set_focus_on_tab("Output")
+		self._director.record_command_as_successfully_completed()
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _print_profile_message(self, n_commands: int) -> None:
+		if n_commands == 0:
+			print("\n\tProfiling is switched off.")
+		else:
+			print(
+				f"\n\tThe next {n_commands} commands will be profiled.\n"
+				f"\tProfiles are saved in the {PROFILE_DIRECTORY} "
+				"directory."
+			)
+		return
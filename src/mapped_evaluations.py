@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import tempfile
+import weakref
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from compact_evaluations import fits_uint8
+from constants import EVALUATIONS_CHUNK_ROWS
+
+# The frames over mapped files, by id, so that they can be recognized
+# without looking into their data
+_MAPPED_FRAMES: weakref.WeakValueDictionary[int, pd.DataFrame] = (
+	weakref.WeakValueDictionary()
+)
+
+# --------------------------------------------------------------------------
+
+
+class MappedEvaluations:
+	"""Evaluations held in a read-only memory-mapped file rather than in
+	memory.
+
+	The evaluations are written once, a chunk of rows or a column at a
+	time, to column-major .npy files in a temporary directory that is
+	removed once nothing refers to it. They are written as uint8, with a
+	second file masking any missing evaluations, for as long as every
+	evaluation fits; from the first that does not, all are float32 with
+	missing evaluations as NaN. After finish_writing, frame is a DataFrame
+	over the mapped files, so only the parts of it that are used are read
+	from disk. Neither can change, so undo snapshots refer to them rather
+	than copying them.
+	"""
+
+	def __init__(self, item_names: list[str], nrows: int) -> None:
+		self.item_names = item_names
+		self._shape = (nrows, len(item_names))
+		self._directory = tempfile.TemporaryDirectory(
+			prefix="spaces_evaluations_", ignore_cleanup_errors=True
+		)
+		self._values = self._open_for_writing("evaluations.npy", np.uint8)
+		self._missing: np.ndarray | None = None
+		self.frame = pd.DataFrame()
+
+	# ------------------------------------------------------------------------
+
+	@property
+	def nrows(self) -> int:
+		return self._shape[0]
+
+	# ------------------------------------------------------------------------
+
+	def write_rows(self, start: int, rows: pd.DataFrame) -> None:
+		"""Write rows starting at row start."""
+		self._write(
+			np.s_[start : start + len(rows)],
+			rows.to_numpy(dtype=np.float64, na_value=np.nan),
+		)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def write_column(self, col: int, values: np.ndarray) -> None:
+		self._write(np.s_[:, col], values.astype(np.float64))
+		return
+
+	# ------------------------------------------------------------------------
+
+	def finish_writing(self) -> None:
+		"""Reopen the files read-only and make frame a DataFrame over
+		them.
+		"""
+		self._values = self._open_for_reading(self._values)
+		if self._missing is None:
+			self.frame = pd.DataFrame(
+				self._values, columns=pd.Index(self.item_names), copy=False
+			)
+		else:
+			self._missing = self._open_for_reading(self._missing)
+			self.frame = pd.DataFrame(
+				{
+					item_name: pd.arrays.IntegerArray(
+						self._values[:, each_item], self._missing[:, each_item]
+					)
+					for each_item, item_name in enumerate(self.item_names)
+				},
+				copy=False,
+			)
+		_MAPPED_FRAMES[id(self.frame)] = self.frame
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _write(
+		self, where: slice | tuple[slice | int, ...], values: np.ndarray
+	) -> None:
+		if self._values.dtype == np.uint8 and not fits_uint8(values):
+			self._widen()
+		if self._values.dtype != np.uint8:
+			self._values[where] = values
+			return
+		missing = np.isnan(values)
+		if missing.any():
+			if self._missing is None:
+				self._missing = self._open_for_writing("missing.npy", np.bool_)
+			self._missing[where] = missing
+		self._values[where] = np.where(missing, 0, values)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _widen(self) -> None:
+		"""Rewrite what has been written as float32."""
+		widened = self._open_for_writing("evaluations_float32.npy", np.float32)
+		for start in range(0, self.nrows, EVALUATIONS_CHUNK_ROWS):
+			rows = np.s_[start : start + EVALUATIONS_CHUNK_ROWS]
+			widened[rows] = self._values[rows]
+			if self._missing is not None:
+				widened[rows][self._missing[rows]] = np.nan
+		self._values = widened
+		self._missing = None
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _open_for_writing(
+		self, file_name: str, dtype: type[np.generic]
+	) -> np.ndarray:
+		return np.lib.format.open_memmap(
+			Path(self._directory.name) / file_name,
+			mode="w+",
+			dtype=dtype,
+			shape=self._shape,
+			fortran_order=True,
+		)
+
+	# ------------------------------------------------------------------------
+
+	@staticmethod
+	def _open_for_reading(values: np.ndarray) -> np.ndarray:
+		values.flush()  # type: ignore[attr-defined]
+		return np.load(values.filename, mmap_mode="r")  # type: ignore[attr-defined]
+
+
+# --------------------------------------------------------------------------
+
+
+def is_mapped_frame(obj: object) -> bool:
+	"""Whether obj is the frame of a MappedEvaluations."""
+	return _MAPPED_FRAMES.get(id(obj)) is obj
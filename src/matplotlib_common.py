@@ -3,14 +3,12 @@ from __future__ import annotations
 import math
 from matplotlib import pyplot as plt
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib import transforms
 from matplotlib.patches import Ellipse
-import numpy as np
-from PySide6.QtWidgets import QSizePolicy, QSpacerItem
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+	import numpy as np
 	from director import Status
 
 from exceptions import SelectionError, UnderDevelopmentError
@@ -563,41 +561,33 @@ class MatplotlibCommon:
 		canvas_plot.setFixedSize(width, height)
 		canvas_plot.draw()
 		self._director.tab_plot_scroll_area.setWidget(canvas_plot)
-		# Add the plot to the Gallery tab (append to existing plots)
-		canvas_gallery = FigureCanvas(fig)
-		canvas_gallery.setFixedSize(width, height)
-		canvas_gallery.draw()
-		self._director.tab_gallery_layout.addWidget(canvas_gallery)
-		# Add a spacer at the end to push plots to the top
-		spacer = QSpacerItem(
-			20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding \
-			# type: ignore[unresolved-argument]
-		)
-		self._director.tab_gallery_layout.addItem(spacer)
+		# Add an image of the same figure to the Gallery tab rather than
+		# drawing a second canvas
+		self._director.gallery.add_figure(fig)
 		plt.close(fig)
 
 	# ------------------------------------------------------------------------
 
 	def confidence_ellipse_using_matplotlib(
 		self,
-		x: list[float] | np.ndarray,
-		y: list[float] | np.ndarray,
 		ax: plt.Axes,
+		focal_point: int,
 		n_std: float = 3.0,
 		facecolor: str = "none",
 		**kwargs: object,
 	) -> Ellipse:
 		"""
-		Create a plot of the covariance confidence ellipse of *x* and *y*.
+		Create a plot of the covariance confidence ellipse of a point's
+		coordinates across the sample solutions.
 
 		Parameters
 		----------
-		x, y : array-like, shape (n, )
-			Input data.
-
 		ax : matplotlib.axes.Axes
 			The Axes object to draw the ellipse into.
 
+		focal_point : int
+			The index of a point in the solutions.
+
 		n_std : float
 			The number of standard deviations to determine the ellipse's
 			radiuses.
@@ -609,40 +599,20 @@ class MatplotlibCommon:
 		-------
 		matplotlib.patches.Ellipse
 		"""
-
-		cov = np.cov(x, y)
-		pearson = cov[0, 1] / np.sqrt(cov[0, 0] * cov[1, 1])
-		# Using a special case to obtain the eigenvalues of this
-		# two-dimensional dataset.
-		ell_radius_x = np.sqrt(1 + pearson)
-		ell_radius_y = np.sqrt(1 - pearson)
+		point_statistics = self._director.uncertainty_active.point_statistics()
+		mean_x, mean_y = point_statistics.means[focal_point]
+		# The axes of the ellipse lie along the eigenvectors of the
+		# covariance matrix, each n_std square roots of its eigenvalue long
+		width, height, angle = point_statistics.ellipse(focal_point, n_std)
 		ellipse = Ellipse(
-			(0, 0),
-			width=ell_radius_x * 2,
-			height=ell_radius_y * 2,
+			(float(mean_x), float(mean_y)),
+			width=width,
+			height=height,
+			angle=angle,
 			facecolor=facecolor,
 			**kwargs,  # type: ignore[arg-type]
 		)
 
-		# Calculating the standard deviation of x from
-		# the squareroot of the variance and multiplying
-		# with the given number of standard deviations.
-		scale_x = float(np.sqrt(cov[0, 0]) * n_std)
-		mean_x = float(np.mean(x))
-
-		# calculating the standard deviation of y ...
-		scale_y = float(np.sqrt(cov[1, 1]) * n_std)
-		mean_y = float(np.mean(y))
-
-		transf = (
-			transforms.Affine2D()
-			.rotate_deg(45)
-			.scale(scale_x, scale_y)
-			.translate(mean_x, mean_y)
-		)
-
-		ellipse.set_transform(transf + ax.transData)
-
 		ax.add_patch(ellipse)
 
 		return ellipse
@@ -650,12 +620,12 @@ class MatplotlibCommon:
 	# ------------------------------------------------------------------------
 
 	def add_ellipse_mode_matplotlib(
-		self, ax: plt.Axes, x_coords: np.ndarray, y_coords: np.ndarray
+		self, ax: plt.Axes, each_point: int
 	) -> None:
 		"""Add ellipse mode visualization to uncertainty plots."""
 		ax.patches.Ellipse = ( # type: ignore[unresolved-attribute]
 			self.confidence_ellipse_using_matplotlib(
-				x_coords, y_coords, ax, n_std=2.0,
+				ax, each_point, n_std=2.0,
 				facecolor="none", edgecolor="r"
 			)
 		)
@@ -2030,7 +2030,7 @@ class MatplotlibMethods:
 		uncertainty_active = director.uncertainty_active
 
 		common.set_axis_extremes_based_on_coordinates(
-			uncertainty_active.solutions
+			uncertainty_active.solution_extremes()
 		)
 		fig = self.plot_uncertainty_using_matplotlib()
 
@@ -2051,14 +2051,13 @@ class MatplotlibMethods:
 		dim_names = uncertainty_active.dim_names
 		point_labels = uncertainty_active.point_labels
 		range_points = uncertainty_active.range_points
-		npoint = uncertainty_active.npoints
 		ndim = uncertainty_active.ndim
 
 		if ndim > MAXIMUM_NUMBER_OF_DIMENSIONS_FOR_PLOTTING:
 			director.set_focus_on_tab("Output")
 			return None
 
-		solutions = director.uncertainty_active.solutions
+		point_statistics = uncertainty_active.point_statistics()
 
 		fig, ax = matplotlib_common.begin_matplotlib_plot_with_title(
 			"Uncertainty"
@@ -2069,18 +2068,14 @@ class MatplotlibMethods:
 		matplotlib_common.set_ranges_for_matplotlib_plot(ax)
 
 		for each_point in range_points:
-			point_coordinates_for_repetition = solutions.iloc[
-				each_point::npoint
-			]
-			x_coords = point_coordinates_for_repetition.iloc[:, 0].to_numpy()
-			y_coords = point_coordinates_for_repetition.iloc[:, 1].to_numpy()
+			x_coords = point_statistics.x_coords[each_point]
+			y_coords = point_statistics.y_coords[each_point]
 			x_mean, y_mean = common.solutions_means(each_point)
 			ax.text(x_mean, y_mean, point_labels[each_point])
 			ax.scatter(x_coords, y_coords, color="r", s=0.5)
 			matplotlib_common.confidence_ellipse_using_matplotlib(
-				x_coords,
-				y_coords,
 				ax,
+				each_point,
 				n_std=2.0,
 				facecolor="none",
 				edgecolor="r",
@@ -2100,7 +2095,7 @@ class MatplotlibMethods:
 		uncertainty_active = director.uncertainty_active
 
 		common.set_axis_extremes_based_on_coordinates(
-			uncertainty_active.solutions
+			uncertainty_active.solution_extremes()
 		)
 		fig = self.plot_spatial_uncertainty_using_matplotlib()
 
@@ -2121,7 +2116,6 @@ class MatplotlibMethods:
 		dim_names = uncertainty_active.dim_names
 		point_labels = uncertainty_active.point_labels
 		range_points = uncertainty_active.range_points
-		npoint = uncertainty_active.npoints
 		ndim = uncertainty_active.ndim
 
 		if ndim > MAXIMUM_NUMBER_OF_DIMENSIONS_FOR_PLOTTING:
@@ -2131,7 +2125,7 @@ class MatplotlibMethods:
 		# Get the visualization mode from the ViewSpatialUncertainty command
 		plot_to_show = getattr(director, "plot_to_show", "ellipses")
 
-		solutions = uncertainty_active.solutions
+		point_statistics = uncertainty_active.point_statistics()
 
 		title = "Uncertainty"
 		fig, ax = matplotlib_common.begin_matplotlib_plot_with_title(title)
@@ -2141,11 +2135,8 @@ class MatplotlibMethods:
 		matplotlib_common.set_ranges_for_matplotlib_plot(ax)
 
 		for each_point in range_points:
-			point_coordinates_for_repetition = solutions.iloc[
-				each_point::npoint
-			]
-			x_coords = point_coordinates_for_repetition.iloc[:, 0].to_numpy()
-			y_coords = point_coordinates_for_repetition.iloc[:, 1].to_numpy()
+			x_coords = point_statistics.x_coords[each_point]
+			y_coords = point_statistics.y_coords[each_point]
 			x_mean, y_mean = common.solutions_means(each_point)
 			ax.text(x_mean, y_mean, point_labels[each_point])
 			ax.scatter(x_coords, y_coords, color="r", s=0.5)
@@ -2153,7 +2144,7 @@ class MatplotlibMethods:
 			match plot_to_show:
 				case "ellipses":
 					matplotlib_common.add_ellipse_mode_matplotlib(
-						ax, x_coords, y_coords
+						ax, each_point
 					)
 				case "boxes":
 					matplotlib_common.add_box_mode_matplotlib(ax, each_point)
@@ -2179,7 +2170,7 @@ class MatplotlibMethods:
 		uncertainty_active = director.uncertainty_active
 
 		common.set_axis_extremes_based_on_coordinates(
-			uncertainty_active.solutions
+			uncertainty_active.solution_extremes()
 		)
 		fig = self.plot_point_uncertainty_using_matplotlib()
 
@@ -2200,7 +2191,6 @@ class MatplotlibMethods:
 		dim_names = uncertainty_active.dim_names
 		point_labels = uncertainty_active.point_labels
 		range_points = uncertainty_active.range_points
-		npoint = uncertainty_active.npoints
 		ndim = uncertainty_active.ndim
 
 		if ndim > MAXIMUM_NUMBER_OF_DIMENSIONS_FOR_PLOTTING:
@@ -2211,7 +2201,7 @@ class MatplotlibMethods:
 		selected_point_indices = getattr(
 			director, "selected_point_indices", range_points
 		)
-		solutions = uncertainty_active.solutions
+		point_statistics = uncertainty_active.point_statistics()
 
 		title = "Uncertainty"
 		fig, ax = matplotlib_common.begin_matplotlib_plot_with_title(title)
@@ -2225,18 +2215,15 @@ class MatplotlibMethods:
 			ax.text(x_mean, y_mean, point_labels[each_point])
 
 		for each_point in selected_point_indices:
-			point_coordinates_for_repetition = solutions.iloc[
-				each_point::npoint
-			]
-			x_coords = point_coordinates_for_repetition.iloc[:, 0].to_numpy()
-			y_coords = point_coordinates_for_repetition.iloc[:, 1].to_numpy()
+			x_coords = point_statistics.x_coords[each_point]
+			y_coords = point_statistics.y_coords[each_point]
 			x_mean, y_mean = common.solutions_means(each_point)
 			ax.scatter(x_coords, y_coords, color="r", s=0.5)
 
 			match plot_to_show:
 				case "ellipses":
 					matplotlib_common.add_ellipse_mode_matplotlib(
-						ax, x_coords, y_coords
+						ax, each_point
 					)
 				case "boxes":
 					matplotlib_common.add_box_mode_matplotlib(ax, each_point)
@@ -2,29 +2,27 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from factor_analyzer import FactorAnalyzer
 import numpy as np
 import pandas as pd
 import peek  # noqa: F401
-import random
 
 
 from PySide6 import QtCore
-from PySide6.QtWidgets import QApplication, QTableWidget, QTableWidgetItem
-from scipy.spatial import procrustes
-
-from sklearn import manifold
-from sklearn.cluster import KMeans
-from sklearn.metrics import silhouette_score
-from sklearn.decomposition import FactorAnalysis
-from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
+from PySide6.QtWidgets import (
+	QApplication,
+	QTableView,
+	QTableWidget,
+	QTableWidgetItem,
+)
 
-from tabulate import tabulate
+# scipy, sklearn, factor_analyzer and tabulate are imported inside the
+# methods that use them so that building the menus at startup does not
+# pay for loading them
 
 if TYPE_CHECKING:
-	# from sklearn.decomposition import PCA, FactorAnalysis
-	# from sklearn.preprocessing import StandardScaler
+	from factor_analyzer import FactorAnalyzer
+	from sklearn.decomposition import PCA, FactorAnalysis
+	from sklearn.preprocessing import StandardScaler
 	from director import Status
 	from common import Spaces
 	from command_state import CommandState
@@ -33,9 +31,14 @@ from constants import (
 	DEFAULT_NUMBER_OF_CLUSTERS,
 	MAXIMUM_NUMBER_OF_DIMENSIONS_FOR_PLOTTING,
 	MINIMAL_DIFFERENCE_FROM_ZERO,
+	UNCERTAINTY_CONVERGENCE_BATCH,
 )
+from evaluation_pairs import EvaluationPairs
 from exceptions import SpacesError
 from features import EvaluationsFeature, SimilaritiesFeature, TargetFeature
+from sample_design import SampleDesign
+from seeds import child_seed
+from table_model import FormattedTableModel
 
 # --------------------------------------------------------------------------
 
@@ -75,9 +78,13 @@ class ClusterCommand:
 
 	def execute(self, common: Spaces) -> None:
 		common.initiate_command_processes()
-		name_source, n_clusters = self._get_clustering_parameters(common)
-		self._capture_state_for_undo(name_source, n_clusters)
-		self._perform_clustering(n_clusters)
+		name_source, n_clusters, seed = self._get_clustering_parameters(
+			common
+		)
+		self._capture_state_for_undo(name_source, n_clusters, seed)
+		common.name_source = name_source
+		common.n_clusters = n_clusters
+		self._perform_clustering(n_clusters, seed)
 		self._print_cluster_results(
 			self._director.scores_active.cluster_centers, n_clusters
 		)
@@ -90,10 +97,11 @@ class ClusterCommand:
 
 	def _get_clustering_parameters(
 		self, common: Spaces
-	) -> tuple[str, int]:
+	) -> tuple[str, int, int]:
 		"""Get clustering parameters from user or script."""
 		params_step1 = common.get_command_parameters("Cluster")
 		name_source = params_step1["data_source"]
+		seed = params_step1["seed"]
 		self.data_for_clustering = self._get_data_for_source(name_source)
 
 		if not self._director.executing_script:
@@ -101,7 +109,7 @@ class ClusterCommand:
 		else:
 			n_clusters = params_step1["n_clusters"]
 
-		return name_source, n_clusters
+		return name_source, n_clusters, seed
 
 	# ------------------------------------------------------------------------
 
@@ -130,14 +138,18 @@ class ClusterCommand:
 	# ------------------------------------------------------------------------
 
 	def _capture_state_for_undo(
-		self, name_source: str, n_clusters: int
+		self, name_source: str, n_clusters: int, seed: int
 	) -> None:
 		"""Capture state for undo based on data source."""
 		from command_state import CommandState  # noqa: PLC0415
 		from datetime import datetime  # noqa: PLC0415
 
 		state_to_capture = self._determine_state_to_capture(name_source)
-		params = {"data_source": name_source, "n_clusters": n_clusters}
+		params = {
+			"data_source": name_source,
+			"n_clusters": n_clusters,
+			"seed": seed,
+		}
 
 		cmd_state = CommandState("Cluster", "active", params)
 		cmd_state.timestamp = datetime.now().strftime(
@@ -178,9 +190,15 @@ class ClusterCommand:
 
 	# ------------------------------------------------------------------------
 
-	def _perform_clustering(self, n_clusters: int) -> None:
+	def _perform_clustering(self, n_clusters: int, seed: int) -> None:
 		"""Perform K-means clustering and store results."""
-		kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
+		from sklearn.cluster import KMeans  # noqa: PLC0415
+
+		kmeans = KMeans(
+			n_clusters=n_clusters,
+			random_state=child_seed(seed, "clustering"),
+			n_init=10,
+		)
 		cluster_labels = kmeans.fit_predict(self.data_for_clustering)
 		cluster_centers = kmeans.cluster_centers_
 
@@ -289,6 +307,8 @@ class ClusterCommand:
 	def _find_optimal_clusters(self, data: pd.DataFrame) -> int:
 		"""Find optimal number of clusters using elbow method and
 		silhouette analysis"""
+		from sklearn.cluster import KMeans  # noqa: PLC0415
+		from sklearn.metrics import silhouette_score  # noqa: PLC0415
 
 		# Test cluster counts from 2 to min(15, n_samples-1) for
 		# case clustering
@@ -423,6 +443,8 @@ class ClusterCommand:
 		self, cluster_centers: np.ndarray, n_clusters: int
 	) -> None:
 		"""Print cluster results table to console"""
+		from tabulate import tabulate  # noqa: PLC0415
+
 		# Get column names for headers
 		all_columns = self.data_for_clustering.columns.tolist()
 		column_names = [
@@ -605,6 +627,8 @@ class DirectionsCommand:
 
 	def _print_directions_df(self) -> None:
 		"""Print the directions DataFrame to the output tab"""
+		from tabulate import tabulate  # noqa: PLC0415
+
 		directions_df = self._director.configuration_active.directions_df
 		directions_df.rename(
 			columns={
@@ -824,6 +848,8 @@ class FactorAnalysisCommand:
 		self, ndim: int, evaluations: pd.DataFrame
 	) -> FactorAnalyzer:
 		"""Perform the factor analysis using FactorAnalyzer."""
+		from factor_analyzer import FactorAnalyzer  # noqa: PLC0415
+
 		fa = FactorAnalyzer(
 			n_factors=ndim, rotation="varimax", is_corr_matrix=False
 		)
@@ -1158,6 +1184,8 @@ class FactorAnalysisMachineLearningCommand:
 		self, n_components: int
 	) -> None:
 		"""Perform factor analysis and set up all configuration and scores."""
+		from sklearn.preprocessing import StandardScaler  # noqa: PLC0415
+		from sklearn.decomposition import FactorAnalysis  # noqa: PLC0415
 
 		evaluations = self._director.evaluations_active.evaluations
 		item_names = self._director.evaluations_active.item_names
@@ -1264,6 +1292,7 @@ class FactorAnalysisMachineLearningCommand:
 		self, trans: pd.DataFrame, x_new: pd.DataFrame, covar: pd.DataFrame
 	) -> None:
 		"""Set up configuration from factor analysis results."""
+		from sklearn.preprocessing import StandardScaler  # noqa: PLC0415
 
 		director = self._director
 		common = director.common
@@ -1463,6 +1492,7 @@ class FactorAnalysisMachineLearningCommand:
 		nreferent: int,
 	) -> None:
 		"""Print factor analysis results using existing helper method."""
+		from sklearn.preprocessing import StandardScaler  # noqa: PLC0415
 
 		scaler2_data = self._director.configuration_active.point_coords
 		new_trans = scaler2_data.to_numpy()
@@ -1515,6 +1545,7 @@ class FactorAnalysisMachineLearningCommand:
 	) -> None:
 		"""Print all Factor Analysis Machine Learning debug and
 		output information."""
+		from sklearn.preprocessing import StandardScaler  # noqa: PLC0415
 
 		print("\n\nscaler: \n", scaler)
 		print("\nScaler.fit(X): \n", scaler.fit(X))
@@ -1696,6 +1727,7 @@ class MDSCommand:
 		self._mds_components_max_allowed = 10
 		self._mds_components_default = 2
 		self._mds_components_an_integer = True
+		self._seed: int | None = None
 		return
 
 	# ------------------------------------------------------------------------
@@ -1709,6 +1741,7 @@ class MDSCommand:
 		params = common.get_command_parameters("MDS", use_metric=use_metric)
 		n_comp: int = params["n_components"]
 		use_metric: bool = params["use_metric"]
+		self._seed = params["seed"]
 		# Update with user's final choice (may differ from menu choice)
 		self._director.configuration_active.use_metric = use_metric
 		self._director.configuration_active.n_comp = n_comp
@@ -1750,7 +1783,10 @@ class MDSCommand:
 		"""
 		if not self._director.executing_script:
 			use_metric = self._director.configuration_active.use_metric
-			self._compute_scree_data(common, use_metric)
+			# Shown before the seed is known, only to guide the choice
+			self._compute_scree_data(
+				common, use_metric, self._director.session_seeds.next_seed()
+			)
 			common.create_plot_for_tabs("scree")
 		return
 
@@ -1764,7 +1800,7 @@ class MDSCommand:
 		"""
 		if self._director.executing_script:
 			use_metric = self._director.configuration_active.use_metric
-			self._compute_scree_data(common, use_metric)
+			self._compute_scree_data(common, use_metric, self._seed)
 			common.create_plot_for_tabs("scree")
 		return
 
@@ -1774,8 +1810,14 @@ class MDSCommand:
 		self,
 		common: Spaces,
 		use_metric: bool,  # noqa: FBT001
+		seed: int,
 	) -> None:
-		"""Compute scree data (stress for dimensions 1-10) for plot."""
+		"""Compute scree data (stress for dimensions 1-10) for plot, the
+		starts for each number of dimensions drawn from seed.
+		"""
+		from sklearn import manifold  # noqa: PLC0415
+		from tabulate import tabulate  # noqa: PLC0415
+
 		similarities_as_square = (
 			self._director.similarities_active.similarities_as_square
 		)
@@ -1803,6 +1845,7 @@ class MDSCommand:
 				metric_mds=use_metric,
 				init='random',
 				n_init=20,
+				random_state=child_seed(seed, "mds starts", each_n_comp),
 				verbose=0,
 				normalized_stress="auto",
 			)
@@ -1860,7 +1903,10 @@ class MDSCommand:
 			ndim = n_comp
 
 		configuration_instance = self._director.common.mds(
-			n_comp, use_metric, similarities_instance
+			n_comp,
+			use_metric,
+			similarities_instance,
+			child_seed(self._seed, "mds starts", n_comp),
 		)
 		range_points = range(nitem)
 		if len(point_labels) == 0:
@@ -1986,6 +2032,8 @@ class PrincipalComponentsCommand:
 	def _perform_principal_component_analysis(
 		self, n_components: int
 	) -> tuple:
+		from sklearn.decomposition import PCA  # noqa: PLC0415
+
 		item_names = self._director.evaluations_active.item_names
 		# evaluations = self._director.evaluations_active.evaluations
 		X_pca = self._director.evaluations_active.evaluations  # noqa: N806
@@ -2208,13 +2256,19 @@ class UncertaintyAnalysis:
 		self.universe_size: int = 0
 		self.nrepetitions: int = 0
 		self.probability_of_inclusion: float = 0.0
-		self.sample_design: pd.DataFrame = pd.DataFrame()
+		self.sample_design: SampleDesign | None = None
 		self.sample_design_nrepetitions: int = 0
 		self.sample_design_frequencies: pd.DataFrame = pd.DataFrame()
 		self.sample_design_frequencies_as_json: str = ""
 		self.sample_design_analysis_df: pd.DataFrame = pd.DataFrame()
 		self.sample_repetitions: pd.DataFrame = pd.DataFrame()
+		# The position in evaluations of each row of sample_repetitions
+		self.sample_repetition_cases: np.ndarray = np.array([], dtype=np.intp)
 		self.solutions_stress_df: pd.DataFrame = pd.DataFrame()
+		# When stopping early, the largest relative change in any point's
+		# ellipse area after each batch of repetitions
+		self.convergence_tolerance: float = 0.0
+		self.convergence_trace: pd.DataFrame = pd.DataFrame()
 		self.sample_solutions: pd.DataFrame = pd.DataFrame()
 		self.ndim: int = 0
 		self.npoint: int = 0
@@ -2225,86 +2279,112 @@ class UncertaintyAnalysis:
 		self.point_labels: list[str] = []
 		self.target_out: np.ndarray = np.array([])
 		self.solutions: pd.DataFrame = pd.DataFrame()
+		# Whether Uncertainty kept every solution or only solution_accumulator
+		self.keep_solutions: bool = True
+		self.solution_accumulator: PointSolutionAccumulator | None = None
+		# Statistics of each point across solutions, computed on first use
+		# and kept until solutions is replaced
+		self._point_statistics: PointSolutionStatistics | None = None
+		# Each repetition's counts, pivoted from sample_design_frequencies
+		# on first use
+		self._selection_counts: np.ndarray | None = None
+		self._selection_counts_source: pd.DataFrame | None = None
 
 	# ------------------------------------------------------------------------
 
-	def create_table_widget_for_sample_designer(self) -> QTableWidget:
-		nrepetitions = self._director.uncertainty_active.nrepetitions
-		repetition_freqs = (
-			self._director.uncertainty_active.sample_design_frequencies
+	def have_point_statistics(self) -> bool:
+		return not self.solutions.empty or (
+			self.solution_accumulator is not None
+			and self.solution_accumulator.nsolutions > 0
 		)
-		universe_size = self._director.uncertainty_active.universe_size
 
-		table_widget = QTableWidget(nrepetitions, 5)
-
-		for each_repetition in range(1, nrepetitions + 1):
-			_repetition_selected = (
-				repetition_freqs["Repetition"] == each_repetition
-			) & (repetition_freqs["Selected"])
-			_repetition_not_selected = (
-				repetition_freqs["Repetition"] == each_repetition
-			) & (~repetition_freqs["Selected"])
+	# ------------------------------------------------------------------------
 
-			value_1 = f"{each_repetition}"
-			item_1 = QTableWidgetItem(value_1)
-			item_1.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-			table_widget.setItem(
-				each_repetition - 1, 0, QTableWidgetItem(item_1)
-			)
+	def point_statistics(self) -> PointSolutionStatistics:
+		"""Return the statistics of each point across the solutions,
+		computed for all points at once the first time they are needed.
 
-			if repetition_freqs.loc[_repetition_selected]["Count"].empty:
-				value_2 = "0"
-				percent_value_2 = 0.0
-			else:
-				value_2 = f"{
-					repetition_freqs.loc[_repetition_selected][
-						'Count'
-					].to_numpy()[0]
-				}"
-				percent_value_2 = (
-					repetition_freqs.loc[_repetition_selected][
-						"Count"
-					].to_numpy()[0]
-					/ universe_size
-				)
-			item_2 = QTableWidgetItem(value_2)
-			item_2.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-			table_widget.setItem(
-				each_repetition - 1, 1, QTableWidgetItem(item_2)
-			)
-			value_3 = f"{percent_value_2:.2%}"
-			item_3 = QTableWidgetItem(value_3)
-			item_3.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-			table_widget.setItem(
-				each_repetition - 1, 2, QTableWidgetItem(item_3)
+		When the solutions were not kept, they come from
+		solution_accumulator instead.
+		"""
+		accumulator = (
+			self.solution_accumulator if self.solutions.empty else None
+		)
+		if (
+			self._point_statistics is None
+			or self._point_statistics.solutions is not self.solutions
+			or self._point_statistics.npoint != self.npoints
+			or (
+				accumulator is not None
+				and self._point_statistics.accumulator is not accumulator
 			)
-			if repetition_freqs.loc[_repetition_not_selected]["Count"].empty:
-				value_4 = "0"
-				percent_value_4 = 0.0
-			else:
-				value_4 = f"{
-					repetition_freqs.loc[_repetition_not_selected][
-						'Count'
-					].to_numpy()[0]
-				}"
-				percent_value_4 = (
-					repetition_freqs.loc[_repetition_not_selected][
-						"Count"
-					].to_numpy()[0]
-					/ universe_size
-				)
-			item_4 = QTableWidgetItem(value_4)
-			item_4.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-			table_widget.setItem(
-				each_repetition - 1, 3, QTableWidgetItem(item_4)
+		):
+			self._point_statistics = PointSolutionStatistics(
+				self.solutions, self.npoints, accumulator
 			)
-			value_5 = f"{percent_value_4:.2%}"
-			item_5 = QTableWidgetItem(value_5)
-			item_5.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-			table_widget.setItem(
-				each_repetition - 1, 4, QTableWidgetItem(item_5)
+		return self._point_statistics
+
+	# ------------------------------------------------------------------------
+
+	def solution_extremes(self) -> pd.DataFrame:
+		"""Return the solutions or, when they were not kept, each point's
+		minima and maxima, to set the axes of plots from.
+		"""
+		if not self.solutions.empty:
+			return self.solutions
+		point_statistics = self.point_statistics()
+		return pd.DataFrame(
+			np.vstack([point_statistics.minima, point_statistics.maxima]),
+			columns=pd.Index(self.dim_names[:2]),
+		)
+
+	# ------------------------------------------------------------------------
+
+	def selection_counts(self) -> np.ndarray:
+		"""Return how many individuals each repetition includes and leaves
+		out, a row per repetition with the included first.
+
+		The counts are pivoted from sample_design_frequencies at once the
+		first time they are needed and kept until it is replaced, so
+		repetitions missing a row, because they include everyone or no
+		one, count zero.
+		"""
+		frequencies = self.sample_design_frequencies
+		if (
+			self._selection_counts is None
+			or self._selection_counts_source is not frequencies
+		):
+			repetitions = frequencies["Repetition"].to_numpy(dtype=np.intp)
+			left_out = ~frequencies["Selected"].to_numpy(dtype=bool)
+			counts = np.bincount(
+				(repetitions - 1) * 2 + left_out,
+				weights=frequencies["Count"].to_numpy(),
+				minlength=self.nrepetitions * 2,
 			)
+			self._selection_counts = counts.astype(np.int64).reshape(-1, 2)
+			self._selection_counts_source = frequencies
+		return self._selection_counts
+
+	# ------------------------------------------------------------------------
 
+	def create_table_widget_for_sample_designer(self) -> QTableView:
+		"""Show each repetition's counts and shares of the universe,
+		formatting only the rows in view.
+		"""
+		counts = self.selection_counts()
+		shares = counts / self.universe_size
+		table = pd.DataFrame({
+			"Repetition": np.arange(1, len(counts) + 1),
+			"Selected": counts[:, 0],
+			"Selected share": shares[:, 0],
+			"Not selected": counts[:, 1],
+			"Not selected share": shares[:, 1],
+		})
+
+		table_widget = QTableView()
+		table_widget.setModel(
+			FormattedTableModel(table, ["d", "d", ".2%", "d", ".2%"])
+		)
 		return table_widget
 
 	# ------------------------------------------------------------------------
@@ -2312,6 +2392,17 @@ class UncertaintyAnalysis:
 	def print_sample_design(self) -> None:
 		"""Print sample design information."""
 		print("\nSample design information")
+		sample_design = self.sample_design
+		if sample_design is None:
+			return
+		print(
+			f"\n\t{sample_design.nrepetitions} repetitions of "
+			f"{sample_design.universe_size} individuals, each included "
+			f"with {sample_design.probability_of_inclusion:g}% probability"
+		)
+		if sample_design.seed is not None:
+			print(f"\tSeed: {sample_design.seed}")
+		return
 
 	# ------------------------------------------------------------------------
 
@@ -2338,6 +2429,163 @@ class UncertaintyAnalysis:
 
 	# ------------------------------------------------------------------------
 
+	def print_point_statistics(self) -> None:
+		"""Print each point's mean, standard deviations and extrema across
+		the solutions, for when the solutions themselves were not kept.
+		"""
+		point_statistics = self.point_statistics()
+		dim_labels = self.dim_labels[:2]
+		columns = {}
+		for each_dim, dim_label in enumerate(dim_labels):
+			columns[f"{dim_label} mean"] = point_statistics.means[:, each_dim]
+			columns[f"{dim_label} sd"] = np.sqrt(
+				point_statistics.covariances[:, each_dim, each_dim]
+			)
+			columns[f"{dim_label} min"] = point_statistics.minima[:, each_dim]
+			columns[f"{dim_label} max"] = point_statistics.maxima[:, each_dim]
+		print(
+			f"\nEach point across {point_statistics.accumulator.nsolutions} "
+			"solutions\n"
+		)
+		print(
+			pd.DataFrame(columns, index=pd.Index(self.point_labels))
+			.round(4)
+			.to_string()
+		)
+		return
+
+	# ------------------------------------------------------------------------
+
+
+class PointSolutionAccumulator:
+	"""The mean, covariance and extrema of each point's first two
+	coordinates, accumulated as solutions arrive.
+
+	Each batch of solutions is merged into those before it as in Welford's
+	algorithm, generalized by Chan et al. to batches, so only a fixed
+	amount per point is kept however many solutions there are.
+	"""
+
+	def __init__(self, npoint: int) -> None:
+		self.npoint = npoint
+		self.nsolutions: int = 0
+		self.means: np.ndarray = np.zeros((npoint, 2))
+		# Sum over solutions of the outer product of each point's
+		# deviations from its mean
+		self.comoments: np.ndarray = np.zeros((npoint, 2, 2))
+		self.minima: np.ndarray = np.full((npoint, 2), np.inf)
+		self.maxima: np.ndarray = np.full((npoint, 2), -np.inf)
+
+	# ------------------------------------------------------------------------
+
+	def add(self, solutions: np.ndarray) -> None:
+		"""Add solutions, each npoint rows of coordinates."""
+		batch = np.asarray(solutions, dtype=float)[..., :2].reshape(
+			-1, self.npoint, 2
+		)
+		nbatch = batch.shape[0]
+		if nbatch == 0:
+			return
+		batch_means = batch.mean(axis=0)
+		deviations = batch - batch_means
+		batch_comoments = np.einsum("spi,spj->pij", deviations, deviations)
+
+		# Merge with the solutions so far
+		ntotal = self.nsolutions + nbatch
+		delta = batch_means - self.means
+		self.means += delta * (nbatch / ntotal)
+		self.comoments += batch_comoments + np.einsum(
+			"pi,pj->pij", delta, delta
+		) * (self.nsolutions * nbatch / ntotal)
+		self.nsolutions = ntotal
+		self.minima = np.minimum(self.minima, batch.min(axis=0))
+		self.maxima = np.maximum(self.maxima, batch.max(axis=0))
+		return
+
+	# ------------------------------------------------------------------------
+
+	def ellipse_areas(self) -> np.ndarray:
+		"""Return the area of each point's one standard deviation
+		covariance ellipse, pi times the square root of the determinant of
+		its covariance.
+		"""
+		covariances = self.comoments / max(self.nsolutions - 1, 1)
+		return np.pi * np.sqrt(np.maximum(np.linalg.det(covariances), 0.0))
+
+
+# --------------------------------------------------------------------------
+
+
+class PointSolutionStatistics:
+	"""The spread of each point's first two coordinates across the sample
+	solutions.
+
+	Solutions hold each point's coordinates in each solution, npoint rows
+	per solution, so they are reshaped to (npoint, nsolutions, 2) and the
+	means, extrema, covariances and their eigen-decompositions of every
+	point are computed together rather than by slicing the solutions
+	once per point. When only a PointSolutionAccumulator was kept, the
+	statistics are taken from it and there are no coordinates.
+	"""
+
+	def __init__(
+		self,
+		solutions: pd.DataFrame,
+		npoint: int,
+		accumulator: PointSolutionAccumulator | None = None,
+	) -> None:
+		self.solutions = solutions
+		self.npoint = npoint
+		if accumulator is None:
+			coords = solutions.iloc[:, :2].to_numpy(dtype=float)
+			nsolutions = coords.shape[0] // npoint if npoint else 0
+			by_solution = coords[: nsolutions * npoint].reshape(
+				nsolutions, npoint, 2
+			)
+			accumulator = PointSolutionAccumulator(npoint)
+			accumulator.add(by_solution)
+			by_point = by_solution.transpose(1, 0, 2)
+		else:
+			by_point = np.empty((npoint, 0, 2))
+		self.accumulator = accumulator
+		nsolutions = accumulator.nsolutions
+		# Coordinates of each point in each solution
+		self.x_coords: np.ndarray = by_point[:, :, 0]
+		self.y_coords: np.ndarray = by_point[:, :, 1]
+		self.means: np.ndarray = accumulator.means
+		self.maxima: np.ndarray = accumulator.maxima
+		self.minima: np.ndarray = accumulator.minima
+		# Sample covariances, as np.cov, and their eigenvalues in
+		# ascending order with eigenvectors as columns
+		self.covariances: np.ndarray = accumulator.comoments / max(
+			nsolutions - 1, 1
+		)
+		self.eigenvalues, self.eigenvectors = np.linalg.eigh(self.covariances)
+		# Root mean square distance of each point from its mean
+		with np.errstate(divide="ignore", invalid="ignore"):
+			self.spreads: np.ndarray = np.sqrt(
+				np.trace(accumulator.comoments, axis1=1, axis2=2) / nsolutions
+			)
+		self.largest_uncertainties: np.ndarray = np.maximum(
+			self.maxima - self.means, self.means - self.minima
+		).max(axis=1)
+
+	# ------------------------------------------------------------------------
+
+	def ellipse(
+		self, focal_point: int, n_std: float
+	) -> tuple[float, float, float]:
+		"""Return the width, height and counterclockwise angle in degrees
+		of the focal point's n_std covariance ellipse.
+		"""
+		minor, major = np.sqrt(np.maximum(self.eigenvalues[focal_point], 0))
+		major_x, major_y = self.eigenvectors[focal_point][:, 1]
+		angle = float(np.degrees(np.arctan2(major_y, major_x)))
+		return 2 * n_std * float(major), 2 * n_std * float(minor), angle
+
+
+# --------------------------------------------------------------------------
+
 
 class UncertaintyCommand:
 	def __init__(self, director: Status, common: Spaces) -> None:
@@ -2353,6 +2601,17 @@ class UncertaintyCommand:
 		self.target_out: np.ndarray = np.array([])
 		self.active_out: np.ndarray = np.array([])
 		self.target_adjusted = TargetFeature(self._director)
+		# Repetitions stop early, once at least min_repetitions have been
+		# solved, when no point's ellipse area changed by more than
+		# convergence_tolerance over the last batch; 0 solves them all
+		self.convergence_tolerance: float = 0.0
+		self.min_repetitions: int = 0
+		self._previous_ellipse_areas: np.ndarray | None = None
+		self._convergence_trace: list[list[float]] = []
+		self._converged: bool = False
+		# Each repetition's design and MDS starts come from streams of
+		# their own, spawned from this
+		self._seed: int | None = None
 
 		# Dialog parameters for sample design
 		self._designer_title = "Set sample parameters for uncertainty analysis"
@@ -2376,6 +2635,13 @@ class UncertaintyCommand:
 		params = common.get_command_parameters("Uncertainty")
 		probability_of_inclusion: int = params["probability_of_inclusion"]
 		nrepetitions: int = params["nrepetitions"]
+		keep_solutions: bool = params["keep_solutions"]
+		self.convergence_tolerance = float(params["convergence_tolerance"])
+		self.min_repetitions = int(params["min_repetitions"])
+		self._previous_ellipse_areas = None
+		self._convergence_trace = []
+		self._converged = False
+		self._seed = params["seed"]
 		universe_size = director.evaluations_active.nevaluators
 
 		common.capture_and_push_undo_state("Uncertainty", "active", params)
@@ -2389,11 +2655,13 @@ class UncertaintyCommand:
 		self._create_sample_repetitions(director)
 		sample_repetitions = uncertainty_active.sample_repetitions
 		self.target_out, self.active_out = self._get_solutions_from_mds(
-			common, sample_repetitions, nreferent
+			common, sample_repetitions, nreferent, keep_solutions
 		)
 		uncertainty_active.target_out = self.target_out
+		uncertainty_active.keep_solutions = keep_solutions
 		uncertainty_active.solutions = self.solutions
 		uncertainty_active.sample_solutions = self.solutions
+		uncertainty_active.point_coords = self.solutions
 		common.create_solutions_table()
 
 		print(
@@ -2401,6 +2669,10 @@ class UncertaintyCommand:
 				index=False
 			)
 		)
+		if self.convergence_tolerance > 0:
+			self._print_convergence()
+		if not keep_solutions:
+			uncertainty_active.print_point_statistics()
 		common.create_plot_for_tabs("uncertainty")
 		director.create_widgets_for_output_and_log_tabs()
 		director.record_command_as_successfully_completed()
@@ -2445,8 +2717,18 @@ class UncertaintyCommand:
 	# ------------------------------------------------------------------------
 
 	def _get_solutions_from_mds(
-		self, common: Spaces, sample_repetitions: pd.DataFrame, nreferent: int
+		self,
+		common: Spaces,
+		sample_repetitions: pd.DataFrame,
+		nreferent: int,
+		keep_solutions: bool,  # noqa: FBT001
 	) -> tuple[np.ndarray, np.ndarray]:
+		"""Solve each repetition and fit it to the target, adding it to the
+		per-point statistics as it arrives and, when keep_solutions, to the
+		solutions.
+		"""
+		from scipy.spatial import procrustes  # noqa: PLC0415
+
 		director = self._director
 		target_active = director.target_active
 		uncertainty_active = director.uncertainty_active
@@ -2455,23 +2737,32 @@ class UncertaintyCommand:
 		nrepetitions = uncertainty_active.nrepetitions
 		use_metric = director.configuration_active.use_metric
 
-		repetition_sizes = self.get_repetition_sizes(
-			range(nrepetitions), uncertainty_active.sample_design_frequencies
-		)
+		repetition_sizes = self.get_repetition_sizes(uncertainty_active)
 
 		line_of_sight = SimilaritiesFeature(self._director)
 		line_of_sight.nreferent = 0
 		line_of_sight.value_type = "dissimilarities"
+		# Each repetition's pair sums and differences are taken from those
+		# of the whole universe, computed once
+		universe_pairs = EvaluationPairs(
+			director.evaluations_active.evaluations
+		)
+		sample_repetition_cases = uncertainty_active.sample_repetition_cases
 
 		start_case = 0
 		extract_ndim = 2
 		stress_data = []
+		accumulator = PointSolutionAccumulator(target_active.npoint)
+		kept_solutions: list[np.ndarray] = []
 
 		self._setup_progress_bar(nrepetitions)
 
 		for repetition_n, repetition_size in enumerate(
 			repetition_sizes, start=1
 		):
+			repetition_cases = sample_repetition_cases[
+				start_case : start_case + repetition_size
+			]
 			current_repetition, start_case = self.get_current_repetition(
 				start_case,
 				repetition_size,
@@ -2481,11 +2772,16 @@ class UncertaintyCommand:
 				uncertainty_active.item_labels,
 			)
 
-			line_of_sight = director.common.los(current_repetition)
+			line_of_sight = director.common.los(
+				current_repetition, universe_pairs, repetition_cases
+			)
 			self.duplicate_repetition_line_of_sight(common, line_of_sight)
 
 			the_loadings = director.common.mds(
-				extract_ndim, use_metric, line_of_sight
+				extract_ndim,
+				use_metric,
+				line_of_sight,
+				child_seed(self._seed, "mds starts", repetition_n),
 			)
 
 			stress_data.append([repetition_n, the_loadings.best_stress])
@@ -2495,19 +2791,32 @@ class UncertaintyCommand:
 				np.array(the_loadings.point_coords),
 			)
 
-			self.solutions = pd.concat(
-				[self.solutions, pd.DataFrame(active_out)], ignore_index=True
-			)
+			accumulator.add(active_out)
+			if keep_solutions:
+				kept_solutions.append(active_out)
 
 			self._update_progress_bar(repetition_n, nrepetitions)
+			self._converged = self._has_converged(accumulator, repetition_n)
+			if self._converged:
+				break
 
 		self._hide_progress_bar()
 
 		uncertainty_active.solutions_stress_df = pd.DataFrame(
 			stress_data, columns=pd.Index(["Solution", "Stress"])
 		)
+		uncertainty_active.convergence_tolerance = self.convergence_tolerance
+		uncertainty_active.convergence_trace = pd.DataFrame(
+			self._convergence_trace,
+			columns=pd.Index(["Repetitions", "Largest change"]),
+		)
 
-		self.solutions.columns = target_active.dim_names
+		self.solutions = pd.DataFrame(
+			np.vstack(kept_solutions) if kept_solutions
+			else np.empty((0, len(target_active.dim_names))),
+			columns=pd.Index(target_active.dim_names),
+		)
+		uncertainty_active.solution_accumulator = accumulator
 		self.target_out = target_out
 		self.active_out = active_out
 
@@ -2517,6 +2826,76 @@ class UncertaintyCommand:
 
 	# -------------------------------------------------------------------------
 
+	def _has_converged(
+		self, accumulator: PointSolutionAccumulator, repetition_n: int
+	) -> bool:
+		"""After each batch of repetitions, record the largest relative
+		change in any point's ellipse area since the batch before and
+		return whether it is within the tolerance, once enough repetitions
+		have been solved.
+		"""
+		if (
+			self.convergence_tolerance <= 0
+			or repetition_n % UNCERTAINTY_CONVERGENCE_BATCH != 0
+		):
+			return False
+		areas = accumulator.ellipse_areas()
+		previous_areas = self._previous_ellipse_areas
+		self._previous_ellipse_areas = areas
+		if previous_areas is None:
+			return False
+		# An ellipse growing from nothing has changed without limit
+		with np.errstate(divide="ignore", invalid="ignore"):
+			changes = np.where(
+				previous_areas > 0,
+				np.abs(areas - previous_areas) / previous_areas,
+				np.where(areas > 0, np.inf, 0.0),
+			)
+		largest_change = float(changes.max())
+		self._convergence_trace.append([repetition_n, largest_change])
+		return (
+			repetition_n >= self.min_repetitions
+			and largest_change <= self.convergence_tolerance
+		)
+
+	# -------------------------------------------------------------------------
+
+	def _print_convergence(self) -> None:
+		uncertainty_active = self._director.uncertainty_active
+		nsolutions = uncertainty_active.nsolutions
+		nrepetitions = uncertainty_active.nrepetitions
+		if self._converged and nsolutions < nrepetitions:
+			print(
+				f"\nStopped after {nsolutions} of {nrepetitions} repetitions,"
+				f" when no point's ellipse area changed by more than "
+				f"{self.convergence_tolerance:.1%} over "
+				f"{UNCERTAINTY_CONVERGENCE_BATCH} repetitions"
+			)
+		elif self._converged:
+			print(
+				f"\nSolved all {nrepetitions} repetitions, with no point's"
+				f" ellipse area changing by more than "
+				f"{self.convergence_tolerance:.1%} over the last "
+				f"{UNCERTAINTY_CONVERGENCE_BATCH} repetitions"
+			)
+		else:
+			print(
+				f"\nSolved all {nrepetitions} repetitions without ellipse"
+				f" areas settling to within "
+				f"{self.convergence_tolerance:.1%} over "
+				f"{UNCERTAINTY_CONVERGENCE_BATCH} repetitions after at least "
+				f"{self.min_repetitions}"
+			)
+		print("\nLargest relative change in any point's ellipse area\n")
+		print(
+			uncertainty_active.convergence_trace.to_string(
+				index=False, formatters={"Largest change": "{:.2%}".format}
+			)
+		)
+		return
+
+	# -------------------------------------------------------------------------
+
 	def establish_sample_solutions_info(self) -> None:
 		uncertainty_active = self._director.uncertainty_active
 		target_active = self._director.target_active
@@ -2527,7 +2906,9 @@ class UncertaintyCommand:
 		uncertainty_active.dim_labels = target_active.dim_labels
 		uncertainty_active.point_names = target_active.point_names
 		uncertainty_active.point_labels = target_active.point_labels
-		uncertainty_active.nsolutions = uncertainty_active.nrepetitions
+		uncertainty_active.nsolutions = len(
+			uncertainty_active.solutions_stress_df
+		)
 		uncertainty_active.range_points = range(uncertainty_active.npoints)
 
 		return
@@ -2535,18 +2916,10 @@ class UncertaintyCommand:
 	# -------------------------------------------------------------------------
 
 	def get_repetition_sizes(
-		self, range_repetitions: range, repetition_freqs: pd.DataFrame
-	) -> list[int]:
-		repetition_sizes = []
-		for each_repetition in range_repetitions:
-			row_with_repetition_size: int = (each_repetition * 2) + 1
-			column_with_repetition_size: int = 2
-			size = repetition_freqs.iloc[
-				row_with_repetition_size, column_with_repetition_size
-			]
-			repetition_sizes.append(size)
-
-		return repetition_sizes
+		self, uncertainty_active: UncertaintyAnalysis
+	) -> np.ndarray:
+		"""Return how many individuals each repetition includes."""
+		return uncertainty_active.selection_counts()[:, 0]
 
 	# -------------------------------------------------------------------------
 
@@ -2645,35 +3018,13 @@ class UncertaintyCommand:
 			director.progress_spacer.show()
 			QApplication.processEvents()
 
-		sample_design = pd.DataFrame(
-			columns=pd.Index(["RespId", "Repetition", "Selected"])
-		)
-
-		range_of_universe = range(universe_size)
-		range_of_repetitions = range(1, nrepetitions + 1)
-		next_out = 0
-
-		for each_repetition in range_of_repetitions:
-			for each_case in range_of_universe:
-				probability: float = probability_of_inclusion
-				if random.uniform(0.0, 100.0) <= probability:
-					select = True
-				else:
-					select = False
-				sample_design.loc[next_out] = {
-					"RespId": each_case,
-					"Repetition": each_repetition,
-					"Selected": select,
-				}
-				next_out += 1
-
-		sample_design.sort_values(by=["Repetition", "RespId"], inplace=True)
-
-		sample_design_frequencies = (
-			sample_design.groupby(["Repetition", "Selected"])  # type: ignore[call-overload]
-			.size()
-			.reset_index(name="Count")
+		sample_design = SampleDesign(
+			universe_size,
+			nrepetitions,
+			probability_of_inclusion,
+			seed=child_seed(self._seed, "sample design"),
 		)
+		sample_design_frequencies = sample_design.frequencies()
 		sample_design_frequencies_as_json = sample_design_frequencies.to_json(
 			orient="records"
 		)
@@ -2700,7 +3051,6 @@ class UncertaintyCommand:
 		uncertainty_active = self._director.uncertainty_active
 		evaluations = self._director.evaluations_active.evaluations
 		universe_size = uncertainty_active.universe_size
-		nrepetitions = uncertainty_active.nrepetitions
 		sample_design = uncertainty_active.sample_design
 
 		if not director.executing_script:
@@ -2717,25 +3067,11 @@ class UncertaintyCommand:
 				f"does not match size of evaluations: {len(evaluations)}"
 			)
 			raise SpacesError(size_issue_title, size_issue_message)
-		columns = evaluations.columns
-		sample_repetitions = pd.DataFrame(columns=columns)
-		range_of_repetitions = range(1, nrepetitions + 1)
-
-		next_out = 0
-		for each_repetition in range_of_repetitions:
-			repetition_start = 0 + (each_repetition - 1) * universe_size
-			repetition_end = each_repetition * universe_size
-			range_of_this_repetition = range(repetition_start, repetition_end)
-			restart = (each_repetition - 1) * universe_size
-
-			for each_case in range_of_this_repetition:
-				if sample_design.loc[each_case]["Selected"]:
-					sample_repetitions.loc[next_out] = evaluations.loc[
-						each_case - 0 - restart
-					]
-					next_out += 1
-
-		uncertainty_active.sample_repetitions = sample_repetitions
+		cases = sample_design.selected_cases()
+		uncertainty_active.sample_repetitions = evaluations.iloc[
+			cases
+		].reset_index(drop=True)
+		uncertainty_active.sample_repetition_cases = cases.astype(np.intp)
 
 		return
 
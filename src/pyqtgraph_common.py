@@ -9,11 +9,11 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
 	# import numpy as np
+	from collections.abc import Sequence
 	from director import Status
+from constants import DENSITY_PLOT_BINS, DENSITY_PLOT_THRESHOLD
 from exceptions import UnderDevelopmentError, SelectionError
 
-from PySide6.QtWidgets import QSizePolicy, QSpacerItem, QVBoxLayout, QWidget
-
 
 class PyQtGraphCommon:
 	def __init__(self, director: Status) -> None:
@@ -373,10 +373,7 @@ class PyQtGraphCommon:
 		self._director.common.set_axis_extremes_based_on_coordinates(point_coords)
 		
 		tab_plot_widget = self.plot_conf_w_scree()
-		tab_gallery_widget = self.plot_conf_w_scree()
-		self.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		self.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 		self._director.set_focus_on_tab("Plot")
 		return
 
@@ -527,10 +524,7 @@ class PyQtGraphCommon:
 	def request_scree_plot_for_tabs_using_pyqtgraph(self) -> None:
 		pyqtgraph_common = self._director.pyqtgraph_common
 		tab_plot_widget = self._plot_scree_using_pyqtgraph()
-		tab_gallery_widget = self._plot_scree_using_pyqtgraph()
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 		self._director.set_focus_on_tab("Plot")
 		return
 
@@ -539,10 +533,7 @@ class PyQtGraphCommon:
 	def request_scree_factor_plot_for_tabs_using_pyqtgraph(self) -> None:
 		pyqtgraph_common = self._director.pyqtgraph_common
 		tab_plot_widget = self._plot_scree_factor_using_pyqtgraph()
-		tab_gallery_widget = self._plot_scree_factor_using_pyqtgraph()
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 		self._director.set_focus_on_tab("Plot")
 		return
 	# ------------------------------------------------------------------------
@@ -550,10 +541,7 @@ class PyQtGraphCommon:
 	def request_shepard_plot_for_tabs_using_pyqtgraph(self) -> None:
 		pyqtgraph_common = self._director.pyqtgraph_common
 		tab_plot_widget = self.plot_shep_using_pyqtgraph()
-		tab_gallery_widget = self.plot_shep_using_pyqtgraph()
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 		self._director.set_focus_on_tab("Plot")
 		return
 
@@ -749,53 +737,161 @@ class PyQtGraphCommon:
 			plot.addItem(rival_b_label)
 		return
 
+	def use_density_plot(self, n_points: int) -> bool:
+		"""Whether to show n_points respondents as a density image, since
+		beyond DENSITY_PLOT_THRESHOLD a scatter plot pans slowly.
+		"""
+		return n_points > DENSITY_PLOT_THRESHOLD
+
+	# ------------------------------------------------------------------------
+
+	def add_individuals_to_pyqtgraph_plot(
+		self,
+		plot: pg.PlotItem,
+		x: Sequence[float] | np.ndarray,
+		y: Sequence[float] | np.ndarray,
+		color: str,
+		point_size: float,
+		brush: str | None = None,
+		group_labels: Sequence[int] | np.ndarray | None = None,
+		group_colors: Sequence[str] | None = None,
+	) -> None:
+		"""Add respondents as a scatter plot or, beyond
+		DENSITY_PLOT_THRESHOLD, as a density image.
+
+		Points are outlined in color and filled with brush when it is
+		given or, when each respondent's group is given as an index into
+		group_colors, filled in the color of their group.
+		"""
+		if self.use_density_plot(len(x)):
+			self.add_density_image_to_pyqtgraph_plot(
+				plot, x, y, color, group_labels, group_colors
+			)
+			return
+		if group_labels is not None and group_colors is not None:
+			plot.scatterPlot(
+				x,
+				y,
+				pen=None,
+				symbol="o",
+				size=point_size,
+				brush=[
+					pg.mkBrush(group_colors[label % len(group_colors)])
+					for label in group_labels
+				],
+			)
+			return
+		fill = {} if brush is None else {"brush": brush}
+		plot.scatterPlot(
+			x, y, pen=color, symbol="o", size=point_size, **fill
+		)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def add_density_image_to_pyqtgraph_plot(
+		self,
+		plot: pg.PlotItem,
+		x: Sequence[float] | np.ndarray,
+		y: Sequence[float] | np.ndarray,
+		color: str,
+		group_labels: Sequence[int] | np.ndarray | None = None,
+		group_colors: Sequence[str] | None = None,
+	) -> None:
+		"""Add respondents as an image of how many fall in each cell of a
+		DENSITY_PLOT_BINS square grid, more opaque where there are more.
+
+		Cells are drawn in color or, when each respondent's group is given
+		as an index into group_colors, in the color of the cell's most
+		common group.
+		"""
+		x = np.ascontiguousarray(x, dtype=np.float64)
+		y = np.ascontiguousarray(y, dtype=np.float64)
+		if group_labels is None or group_colors is None:
+			groups = np.zeros(x.size, dtype=np.intp)
+			palette = [color]
+		else:
+			groups = np.asarray(group_labels, dtype=np.intp) % len(
+				group_colors
+			)
+			palette = list(group_colors)
+		# Respondents with a missing score have no place on the grid
+		finite = np.isfinite(x) & np.isfinite(y)
+		if not finite.all():
+			x, y, groups = x[finite], y[finite], groups[finite]
+		if x.size == 0:
+			return
+		n_bins = DENSITY_PLOT_BINS
+		hor_min, hor_max = float(x.min()), float(x.max())
+		vert_min, vert_max = float(y.min()), float(y.max())
+		hor_width = max(hor_max - hor_min, 1e-9)
+		vert_height = max(vert_max - vert_min, 1e-9)
+		hor_bin = np.minimum(
+			((x - hor_min) * (n_bins / hor_width)).astype(np.intp), n_bins - 1
+		)
+		vert_bin = np.minimum(
+			((y - vert_min) * (n_bins / vert_height)).astype(np.intp),
+			n_bins - 1,
+		)
+		# One pass counts every group in every cell
+		counts = np.bincount(
+			(groups * n_bins + hor_bin) * n_bins + vert_bin,
+			minlength=len(palette) * n_bins * n_bins,
+		).reshape(len(palette), n_bins, n_bins)
+		totals = counts.sum(axis=0)
+		rgb = np.array(
+			[pg.mkColor(each_color).getRgb()[:3] for each_color in palette],
+			dtype=np.uint8,
+		)
+		image = np.zeros((n_bins, n_bins, 4), dtype=np.uint8)
+		image[..., :3] = rgb[counts.argmax(axis=0)]
+		image[..., 3] = np.round(
+			255 * np.log1p(totals) / np.log1p(totals.max())
+		).astype(np.uint8)
+		# Rows of the image run along the horizontal axis
+		density = pg.ImageItem(image, levels=(0, 255), axisOrder="col-major")
+		density.setRect(
+			pg.QtCore.QRectF(hor_min, vert_min, hor_width, vert_height)
+		)
+		plot.addItem(density)
+		return
+
+	# ------------------------------------------------------------------------
+
 	# -- The following comes from director -----------------------------------
 
 	# ------------------------------------------------------------------------
 
 	def plot_to_gui_using_pyqtgraph(
-		self,
-		plot_widget: pg.GraphicsLayoutWidget,
-		gallery_widget: pg.GraphicsLayoutWidget,
+		self, plot_widget: pg.GraphicsLayoutWidget
 	) -> None:
 		# had been called add_plot_using_pyqtgraph(
 		# self, plot_widget1, plot_widget2)
 		# Add the plot to the Plot tab (replace the current plot)
 		self._director.tab_plot_scroll_area.setWidget(plot_widget)
-		# Disable mouse events on the plot in tab_gallery
-		self.disable_mouse_events(gallery_widget)
-		# Add the plot to the Gallery tab (append to existing plots)
-		widget = QWidget()
-		widget.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-		layout = QVBoxLayout()
-		layout.addWidget(gallery_widget)
-		layout.setSizeConstraint(QVBoxLayout.SetNoConstraint)
-
-		# Add a spacer at the end to push plots to the top
-		spacer = QSpacerItem(
-			20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding
-		)
-		layout.addItem(spacer)
-
-		widget.setLayout(layout)
-		self._director.tab_gallery_layout.addWidget(widget)
+		# Add an image of the same plot to the Gallery tab rather than
+		# building it a second time
+		if not plot_widget.isVisible():
+			plot_widget.resize(self._director.tab_plot_scroll_area.size())
+		self._director.gallery.add_widget(plot_widget)
+		return
 
 	# ------------------------------------------------------------------------
 
 	def confidence_ellipse_using_pyqtgraph(
 		self,
-		x: np.ndarray,
-		y: np.ndarray,
+		focal_point: int,
 		n_std: float = 3.0,
 		edgecolor: str = "r",
 	) -> pg.QtWidgets.QGraphicsEllipseItem:
 		"""
-		Create a covariance confidence ellipse of *x* and *y* for pyqtgraph.
+		Create a covariance confidence ellipse of a point's coordinates
+		across the sample solutions for pyqtgraph.
 
 		Parameters
 		----------
-		x, y : array-like, shape (n, )
-			Input data.
+		focal_point : int
+			The index of a point in the solutions.
 
 		n_std : float
 			The number of standard deviations to determine the ellipse's
@@ -808,27 +904,9 @@ class PyQtGraphCommon:
 		-------
 		pg.QtWidgets.QGraphicsEllipseItem
 		"""
-		cov = np.cov(x, y)
-		pearson = cov[0, 1] / np.sqrt(cov[0, 0] * cov[1, 1])
-
-		# Using a special case to obtain the eigenvalues of this
-		# two-dimensional dataset.
-		ell_radius_x = np.sqrt(1 + pearson)
-		ell_radius_y = np.sqrt(1 - pearson)
-
-		# Calculating the standard deviation of x from
-		# the squareroot of the variance and multiplying
-		# with the given number of standard deviations.
-		scale_x = np.sqrt(cov[0, 0]) * n_std
-		mean_x = np.mean(x)
-
-		# calculating the standard deviation of y ...
-		scale_y = np.sqrt(cov[1, 1]) * n_std
-		mean_y = np.mean(y)
-
-		# Calculate final ellipse dimensions
-		width = ell_radius_x * scale_x * 2
-		height = ell_radius_y * scale_y * 2
+		point_statistics = self._director.uncertainty_active.point_statistics()
+		mean_x, mean_y = point_statistics.means[focal_point]
+		width, height, angle = point_statistics.ellipse(focal_point, n_std)
 
 		# Create ellipse centered at the mean
 		ellipse = pg.QtWidgets.QGraphicsEllipseItem(
@@ -840,10 +918,11 @@ class PyQtGraphCommon:
 		ellipse.setPen(pg.mkPen(color=pen_color, width=2))
 		ellipse.setBrush(pg.mkBrush(None))  # No fill
 
-		# Apply rotation (45 degrees like matplotlib version)
+		# Rotate the major axis onto the covariance's largest-eigenvalue
+		# eigenvector
 		transform = pg.QtGui.QTransform()
 		transform.translate(mean_x, mean_y)
-		transform.rotate(45)
+		transform.rotate(angle)
 		transform.translate(-mean_x, -mean_y)
 		ellipse.setTransform(transform)
 
@@ -852,11 +931,12 @@ class PyQtGraphCommon:
 	# ------------------------------------------------------------------------
 
 	def add_ellipse_mode_pyqtgraph(
-		self, plot: pg.PlotItem, x_coords: np.ndarray, y_coords: np.ndarray,
+		self, plot: pg.PlotItem, each_point: int,
 		x_mean: float, y_mean: float
 	) -> None:
 		"""Add ellipse mode visualization to uncertainty plots."""
-		radius = np.sqrt(np.var(x_coords) + np.var(y_coords))
+		point_statistics = self._director.uncertainty_active.point_statistics()
+		radius = point_statistics.spreads[each_point]
 		circle = pg.CircleROI(
 			[x_mean - radius, y_mean - radius],
 			[2 * radius, 2 * radius],
@@ -910,21 +990,3 @@ class PyQtGraphCommon:
 		)
 		circle.setPen(pg.mkPen("r"))
 		plot.addItem(circle)
-
-	# ------------------------------------------------------------------------
-
-	def disable_mouse_events(
-		self, graphics_layout_widget: pg.GraphicsLayoutWidget
-	) -> None:
-		# Loop over each row
-		for row in range(graphics_layout_widget.ci.layout.rowCount()):
-			# Loop over each column
-			for col in range(
-				graphics_layout_widget.ci.layout.columnCount()
-			):
-				# Get the item in the cell
-				item = graphics_layout_widget.ci.layout.itemAt(row, col)
-				# Check if item is a PlotItem
-				if isinstance(item, pg.graphicsItems.PlotItem.PlotItem):
-					# Disable mouse events for this PlotItem
-					item.vb.setMouseEnabled(x=False, y=False)
@@ -19,6 +19,7 @@ if TYPE_CHECKING:
 	from geometry import PeoplePoints, ReferencePoint
 
 from exceptions import DependencyError, UnderDevelopmentError
+from respondent_picker import RespondentPicker
 
 
 class PyQtGraphMethods:
@@ -39,14 +40,11 @@ class PyQtGraphMethods:
 		common.set_axis_extremes_based_on_coordinates(point_coords)
 
 		tab_plot_widget = self._plot_alike_using_pyqtgraph()
-		tab_gallery_widget = self._plot_alike_using_pyqtgraph()
 
-		if tab_plot_widget is None or tab_gallery_widget is None:
+		if tab_plot_widget is None:
 			return
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -124,16 +122,11 @@ class PyQtGraphMethods:
 
 		common.set_axis_extremes_based_on_coordinates(point_coords)
 		tab_plot_widget = self._plot_base_using_pyqtgraph(base_groups_to_show)
-		tab_gallery_widget = self._plot_base_using_pyqtgraph(
-			base_groups_to_show
-		)
 
-		if tab_plot_widget is None or tab_gallery_widget is None:
+		if tab_plot_widget is None:
 			return
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -189,6 +182,7 @@ class PyQtGraphMethods:
 	) -> None:
 		director = self._director
 		common = director.common
+		pyqtgraph_common = director.pyqtgraph_common
 		rivalry = director.rivalry
 		base_left = rivalry.base_left
 		base_right = rivalry.base_right
@@ -215,11 +209,12 @@ class PyQtGraphMethods:
 		right_region_item.setBrush(right_brush)
 		right_region_item.setPen(pg.mkPen(color=(0, 0, 0), width=2))
 		plot.addItem(right_region_item)
-		plot.scatterPlot(
-			x=base_people_points.x,
-			y=base_people_points.y,
-			pen=score_color,
-			size=point_size,
+		pyqtgraph_common.add_individuals_to_pyqtgraph_plot(
+			plot,
+			base_people_points.x,
+			base_people_points.y,
+			score_color,
+			point_size,
 		)
 
 		return
@@ -242,16 +237,11 @@ class PyQtGraphMethods:
 		tab_plot_widget = self._plot_battleground_using_pyqtgraph(
 			battleground_groups_to_show
 		)
-		tab_gallery_widget = self._plot_battleground_using_pyqtgraph(
-			battleground_groups_to_show
-		)
 
-		if tab_plot_widget is None or tab_gallery_widget is None:
+		if tab_plot_widget is None:
 			return
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -322,6 +312,7 @@ class PyQtGraphMethods:
 	) -> None:
 		director = self._director
 		common = director.common
+		pyqtgraph_common = director.pyqtgraph_common
 		rivalry = director.rivalry
 		scores_active = director.scores_active
 		battleground_segment = rivalry.battleground_segment
@@ -349,14 +340,13 @@ class PyQtGraphMethods:
 		battleground_region_item.setPen(pg.mkPen(color=(0, 0, 0), width=2))
 		plot.addItem(battleground_region_item)
 		if common.have_segments():
-			points = pg.ScatterPlotItem(
+			pyqtgraph_common.add_individuals_to_pyqtgraph_plot(
+				plot,
 				battleground_people_points.x,
 				battleground_people_points.y,
-				pen=score_color,
-				symbol="o",
-				size=point_size,
+				score_color,
+				point_size,
 			)
-			plot.addItem(points)
 
 		return
 
@@ -388,10 +378,7 @@ class PyQtGraphMethods:
 			common.set_axis_extremes_based_on_coordinates(scores.iloc[:, 1:3])
 
 		tab_plot_widget = self.plot_clusters_using_pyqtgraph()
-		tab_gallery_widget = self.plot_clusters_using_pyqtgraph()
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		self.score_1 = score_1
 		self.score_1_name = score_1_name
@@ -434,48 +421,22 @@ class PyQtGraphMethods:
 			# Plot original people points with cluster colors
 			original_data = scores_active.original_clustered_data
 			# Use first two dimensions for plotting
-			x_coords = original_data.iloc[:, 0].tolist()
-			y_coords = original_data.iloc[:, 1].tolist()
-			n_total_points = len(x_coords)
-
-			# Create color array for original data points
-			point_colors = [
-				colors[cluster_labels[i] % len(colors)]
-				for i in range(n_total_points)
-			]
+			x_coords = original_data.iloc[:, 0].to_numpy(dtype=float)
+			y_coords = original_data.iloc[:, 1].to_numpy(dtype=float)
 
-			# Plot all points with their cluster colors
-			plot.scatterPlot(
-				x_coords,
-				y_coords,
-				pen=None,
-				symbol="o",
-				symbolSize=point_size,
-				symbolBrush=[pg.mkBrush(color) for color in point_colors],
+			self._add_clustered_points_to_pyqtgraph_plot(
+				plot, x_coords, y_coords, cluster_labels, colors
 			)
 		else:
 			# Original behavior for distance/similarity clustering
 			# Get coordinate data for ALL points
 			score_1 = scores[hor_axis_name]
 			score_2 = scores[vert_axis_name]
-			x_coords = score_1.tolist()
-			y_coords = score_2.tolist()
-			n_total_points = len(x_coords)
-
-			# Create color array for ALL points
-			point_colors = [
-				colors[cluster_labels[i] % len(colors)]
-				for i in range(n_total_points)
-			]
+			x_coords = score_1.to_numpy(dtype=float)
+			y_coords = score_2.to_numpy(dtype=float)
 
-			# Plot all points with their cluster colors
-			plot.scatterPlot(
-				x_coords,
-				y_coords,
-				pen=None,
-				symbol="o",
-				symbolSize=point_size,
-				symbolBrush=[pg.mkBrush(color) for color in point_colors],
+			self._add_clustered_points_to_pyqtgraph_plot(
+				plot, x_coords, y_coords, cluster_labels, colors
 			)
 
 		# Add cluster centroids as plus signs with different colors
@@ -509,6 +470,33 @@ class PyQtGraphMethods:
 
 	# --------------------------------------------------------------**--------
 
+	def _add_clustered_points_to_pyqtgraph_plot(
+		self,
+		plot: pg.PlotItem,
+		x_coords: np.ndarray,
+		y_coords: np.ndarray,
+		cluster_labels: np.ndarray,
+		colors: list[str],
+	) -> None:
+		pyqtgraph_common = self._director.pyqtgraph_common
+		point_size = self._director.common.point_size
+		n_total_points = len(x_coords)
+
+		# Each point, or each density cell, takes the color of its
+		# cluster, or of its most common cluster
+		pyqtgraph_common.add_individuals_to_pyqtgraph_plot(
+			plot,
+			x_coords,
+			y_coords,
+			colors[0],
+			point_size,
+			group_labels=cluster_labels[:n_total_points],
+			group_colors=colors,
+		)
+		return
+
+	# ------------------------------------------------------------------------
+
 	def request_compare_plot_for_tabs_using_pyqtgraph(self) -> None:
 		director = self._director
 		common = director.common
@@ -518,14 +506,11 @@ class PyQtGraphMethods:
 
 		common.set_axis_extremes_based_on_coordinates(point_coords)
 		tab_plot_widget = self.plot_compare_using_pyqtgraph(target)
-		tab_gallery_widget = self.plot_compare_using_pyqtgraph(target)
 
-		if tab_plot_widget is None or tab_gallery_widget is None:
+		if tab_plot_widget is None:
 			return
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		director.set_focus_on_tab("Plot")
 
@@ -621,11 +606,8 @@ class PyQtGraphMethods:
 		common.set_axis_extremes_based_on_coordinates(point_coords)
 
 		tab_plot_widget = self.plot_a_configuration_using_pyqtgraph()
-		tab_gallery_widget = self.plot_a_configuration_using_pyqtgraph()
-		if tab_plot_widget is not None and tab_gallery_widget is not None:
-			pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-				tab_plot_widget, tab_gallery_widget
-			)
+		if tab_plot_widget is not None:
+			pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -672,11 +654,8 @@ class PyQtGraphMethods:
 
 		common.set_axis_extremes_based_on_coordinates(point_coords)
 		tab_plot_widget = self._plot_contest_using_pyqtgraph()
-		tab_gallery_widget = self._plot_contest_using_pyqtgraph()
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -857,12 +836,7 @@ class PyQtGraphMethods:
 		tab_plot_widget = self._plot_convertible_using_pyqtgraph(
 			convertible_groups_to_show
 		)
-		tab_gallery_widget = self._plot_convertible_using_pyqtgraph(
-			convertible_groups_to_show
-		)
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -918,6 +892,7 @@ class PyQtGraphMethods:
 	) -> None:
 		director = self._director
 		common = director.common
+		pyqtgraph_common = director.pyqtgraph_common
 		rivalry = director.rivalry
 		convertible_to_left = rivalry.convertible_to_left
 		convertible_to_right = rivalry.convertible_to_right
@@ -971,12 +946,12 @@ class PyQtGraphMethods:
 		)
 		plot.addItem(convertible_to_left_region_item)
 
-		plot.scatterPlot(
+		pyqtgraph_common.add_individuals_to_pyqtgraph_plot(
+			plot,
 			convertible_people_points.x,
 			convertible_people_points.y,
-			pen=score_color,
-			symbol="o",
-			size=point_size,
+			score_color,
+			point_size,
 		)
 
 		return
@@ -994,13 +969,8 @@ class PyQtGraphMethods:
 
 		common.set_axis_extremes_based_on_coordinates(point_coords)
 		tab_plot_widget = self._plot_core_using_pyqtgraph(core_groups_to_show)
-		tab_gallery_widget = self._plot_core_using_pyqtgraph(
-			core_groups_to_show
-		)
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -1064,6 +1034,7 @@ class PyQtGraphMethods:
 	) -> None:
 		director = self._director
 		common = director.common
+		pyqtgraph_common = director.pyqtgraph_common
 		rivalry = director.rivalry
 		connector = rivalry.connector
 		core_left = rivalry.core_left
@@ -1094,12 +1065,12 @@ class PyQtGraphMethods:
 		core_b.setPen(pg.mkPen(color="b"))
 		core_b.setBrush(pg.mkBrush(color=core_right._fill))
 		plot.addItem(core_b)
-		plot.scatterPlot(
+		pyqtgraph_common.add_individuals_to_pyqtgraph_plot(
+			plot,
 			core_people_points.x,
 			core_people_points.y,
-			pen=score_color,
-			symbol="o",
-			size=point_size,
+			score_color,
+			point_size,
 		)
 
 		return
@@ -1117,13 +1088,8 @@ class PyQtGraphMethods:
 		tab_plot_widget = self._plot_cutoff_using_pyqtgraph(
 			similarities_active.value_type
 		)
-		gallery_plot_widget = self._plot_cutoff_using_pyqtgraph(
-			similarities_active.value_type
-		)
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, gallery_plot_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -1190,11 +1156,8 @@ class PyQtGraphMethods:
 
 		director.common.set_axis_extremes_based_on_coordinates(point_coords)
 		tab_plot_widget = self._plot_directions_using_pyqtgraph()
-		tab_gallery_widget = self._plot_directions_using_pyqtgraph()
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -1292,11 +1255,8 @@ class PyQtGraphMethods:
 		pyqtgraph_common = director.pyqtgraph_common
 
 		tab_plot_widget = self.plot_evaluation_means_using_pyqtgraph()
-		tab_gallery_widget = self.plot_evaluation_means_using_pyqtgraph()
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -1356,13 +1316,8 @@ class PyQtGraphMethods:
 		tab_plot_widget = self._plot_first_using_pyqtgraph(
 			first_dim_groups_to_show
 		)
-		tab_gallery_widget = self._plot_first_using_pyqtgraph(
-			first_dim_groups_to_show
-		)
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -1419,6 +1374,7 @@ class PyQtGraphMethods:
 	) -> None:
 		director = self._director
 		common = director.common
+		pyqtgraph_common = director.pyqtgraph_common
 		rivalry = director.rivalry
 		first_left = rivalry.first_left
 		first_right = rivalry.first_right
@@ -1446,14 +1402,13 @@ class PyQtGraphMethods:
 		first_right_region_item.setBrush(first_right_brush)
 		first_right_region_item.setPen(pg.mkPen(color=(0, 0, 0), width=2))
 		plot.addItem(first_right_region_item)
-		points = plot.scatterPlot(
-			x=first_dim_people_points.x,
-			y=first_dim_people_points.y,
-			pen=score_color,
-			symbol="o",
-			size=point_size,
+		pyqtgraph_common.add_individuals_to_pyqtgraph_plot(
+			plot,
+			first_dim_people_points.x,
+			first_dim_people_points.y,
+			score_color,
+			point_size,
 		)
-		plot.addItem(points)
 
 		return
 
@@ -1468,11 +1423,8 @@ class PyQtGraphMethods:
 
 		common.set_axis_extremes_based_on_coordinates(group_coords)
 		tab_plot_widget = self.plot_grouped_data_using_pyqtgraph()
-		tab_gallery_widget = self.plot_grouped_data_using_pyqtgraph()
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -1544,11 +1496,8 @@ class PyQtGraphMethods:
 		pyqtgraph_common = director.pyqtgraph_common
 
 		tab_plot_widget = self.plot_a_heatmap_corr_using_pyqtgraph()
-		tab_gallery_widget = self.plot_a_heatmap_corr_using_pyqtgraph()
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -1584,11 +1533,8 @@ class PyQtGraphMethods:
 		pyqtgraph_common = director.pyqtgraph_common
 
 		tab_plot_widget = self.plot_a_heatmap_dist_using_pyqtgraph()
-		tab_gallery_widget = self.plot_a_heatmap_dist_using_pyqtgraph()
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -1624,11 +1570,8 @@ class PyQtGraphMethods:
 		pyqtgraph_common = director.pyqtgraph_common
 
 		tab_plot_widget = self.plot_a_heatmap_rank_diff_using_pyqtgraph()
-		tab_gallery_widget = self.plot_a_heatmap_rank_diff_using_pyqtgraph()
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -1673,11 +1616,8 @@ class PyQtGraphMethods:
 		pyqtgraph_common = director.pyqtgraph_common
 
 		tab_plot_widget = self.plot_a_heatmap_ranked_dist_using_pyqtgraph()
-		tab_gallery_widget = self.plot_a_heatmap_ranked_dist_using_pyqtgraph()
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -1722,11 +1662,8 @@ class PyQtGraphMethods:
 		pyqtgraph_common = director.pyqtgraph_common
 
 		tab_plot_widget = self.plot_a_heatmap_ranked_simi_using_pyqtgraph()
-		tab_gallery_widget = self.plot_a_heatmap_ranked_simi_using_pyqtgraph()
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -1769,11 +1706,8 @@ class PyQtGraphMethods:
 		pyqtgraph_common = director.pyqtgraph_common
 
 		tab_plot_widget = self.plot_a_heatmap_simi_using_pyqtgraph()
-		tab_gallery_widget = self.plot_a_heatmap_simi_using_pyqtgraph()
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -1836,11 +1770,8 @@ class PyQtGraphMethods:
 		pyqtgraph_common = director.pyqtgraph_common
 
 		tab_plot_widget = self._plot_joint_using_pyqtgraph()
-		tab_gallery_widget = self._plot_joint_using_pyqtgraph()
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -1875,14 +1806,15 @@ class PyQtGraphMethods:
 		plot = pyqtgraph_common.add_axes_labels_to_pyqtgraph_plot(plot)
 		pyqtgraph_common.set_ranges_for_pyqtgraph_plot(plot)
 		# pen = pg.mkPen(color=(0, 255, 0))
-		plot.scatterPlot(
-			score_1,
-			score_2,
-			pen=score_color,
-			symbol="o",
-			symbolSize=5,
-			symbolBrush=score_color,
-		)
+		pyqtgraph_common.add_individuals_to_pyqtgraph_plot(
+			plot,
+			score_1.to_numpy(),
+			score_2.to_numpy(),
+			score_color,
+			5,
+			brush=score_color,
+		)
+		RespondentPicker(director, graphics_layout_widget, plot)
 		if common.have_reference_points():
 			pyqtgraph_common.add_connector_to_pyqtgraph_plot(plot)
 			pyqtgraph_common.add_bisector_to_pyqtgraph_plot(plot)
@@ -1916,13 +1848,8 @@ class PyQtGraphMethods:
 		tab_plot_widget = self._plot_likely_using_pyqtgraph(
 			likely_groups_to_show
 		)
-		tab_gallery_widget = self._plot_likely_using_pyqtgraph(
-			likely_groups_to_show
-		)
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -1978,6 +1905,7 @@ class PyQtGraphMethods:
 	) -> None:
 		director = self._director
 		common = director.common
+		pyqtgraph_common = director.pyqtgraph_common
 		rivalry = director.rivalry
 		likely_left = rivalry.likely_left
 		likely_right = rivalry.likely_right
@@ -2013,14 +1941,13 @@ class PyQtGraphMethods:
 		likely_right_region_item.setBrush(likely_right_region_brush)
 		likely_right_region_item.setPen(pg.mkPen(color=(0, 0, 0), width=2))
 		plot.addItem(likely_right_region_item)
-		points = pg.ScatterPlotItem(
-			x=likely_people_points.x,
-			y=likely_people_points.y,
-			pen=score_color,
-			symbol="o",
-			size=point_size,
+		pyqtgraph_common.add_individuals_to_pyqtgraph_plot(
+			plot,
+			likely_people_points.x,
+			likely_people_points.y,
+			score_color,
+			point_size,
 		)
-		plot.addItem(points)
 
 		return
 
@@ -2044,10 +1971,7 @@ class PyQtGraphMethods:
 		common.set_axis_extremes_based_on_coordinates(scores.iloc[:, 1:])
 
 		tab_plot_widget = self.plot_scores_using_pyqtgraph()
-		tab_gallery_widget = self.plot_scores_using_pyqtgraph()
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		self.score_1 = score_1
 		self.score_1_name = score_1_name
@@ -2089,23 +2013,18 @@ class PyQtGraphMethods:
 		plot.setLabel("left", hor_axis_name, color="k", size=15)
 		plot.setLabel("bottom", vert_axis_name, color="k", size=15)
 		pyqtgraph_common.set_ranges_for_pyqtgraph_plot(plot)
-		x_coords = [
-			scores.iloc[each_point, hor_dim + 1]
-			for each_point in range(nscored)
-		]
-		y_coords = [
-			scores.iloc[each_point, vert_dim + 1]
-			for each_point in range(nscored)
-		]
+		x_coords = scores.iloc[:nscored, hor_dim + 1].to_numpy(dtype=float)
+		y_coords = scores.iloc[:nscored, vert_dim + 1].to_numpy(dtype=float)
 		# pen = pg.mkPen(color=score_color)   # had been 255, 0, 0))
-		plot.scatterPlot(
+		pyqtgraph_common.add_individuals_to_pyqtgraph_plot(
+			plot,
 			x_coords,
 			y_coords,
-			pen=score_color,
-			symbol="o",
-			symbolSize=point_size,
-			symbolBrush=score_color,
+			score_color,
+			point_size,
+			brush=score_color,
 		)
+		RespondentPicker(director, graphics_layout_widget, plot)
 
 		director.set_focus_on_tab("Plot")
 
@@ -2120,12 +2039,7 @@ class PyQtGraphMethods:
 		tab_plot_widget = (
 			self._plot_sorted_stress_contributions_using_pyqtgraph()
 		)
-		gallery_plot_widget = (
-			self._plot_sorted_stress_contributions_using_pyqtgraph()
-		)
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, gallery_plot_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 		self._director.set_focus_on_tab("Plot")
 		return
 
@@ -2171,12 +2085,7 @@ class PyQtGraphMethods:
 		tab_plot_widget = (
 			self._plot_stress_contribution_by_point_using_pyqtgraph()
 		)
-		gallery_plot_widget = (
-			self._plot_stress_contribution_by_point_using_pyqtgraph()
-		)
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, gallery_plot_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 		self._director.set_focus_on_tab("Plot")
 		return
 
@@ -2341,13 +2250,8 @@ class PyQtGraphMethods:
 		tab_plot_widget = self._plot_second_using_pyqtgraph(
 			second_dim_groups_to_show
 		)
-		tab_gallery_widget = self._plot_second_using_pyqtgraph(
-			second_dim_groups_to_show
-		)
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -2403,6 +2307,7 @@ class PyQtGraphMethods:
 	) -> None:
 		director = self._director
 		common = director.common
+		pyqtgraph_common = director.pyqtgraph_common
 		rivalry = director.rivalry
 		second_up = rivalry.second_up
 		second_down = rivalry.second_down
@@ -2430,14 +2335,13 @@ class PyQtGraphMethods:
 		second_down_region_item.setBrush(second_down_brush)
 		second_down_region_item.setPen(pg.mkPen(color=(0, 0, 0), width=2))
 		plot.addItem(second_down_region_item)
-		points = plot.scatterPlot(
-			x=second_dim_people_points.x,
-			y=second_dim_people_points.y,
-			pen=score_color,
-			symbol="o",
-			size=point_size,
+		pyqtgraph_common.add_individuals_to_pyqtgraph_plot(
+			plot,
+			second_dim_people_points.x,
+			second_dim_people_points.y,
+			score_color,
+			point_size,
 		)
-		plot.addItem(points)
 
 		return
 
@@ -2452,11 +2356,8 @@ class PyQtGraphMethods:
 
 		common.set_axis_extremes_based_on_coordinates(point_coords)
 		tab_plot_widget = self.plot_target_using_pyqtgraph()
-		tab_gallery_widget = self.plot_target_using_pyqtgraph()
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -2532,14 +2433,11 @@ class PyQtGraphMethods:
 		uncertainty_active = director.uncertainty_active
 
 		common.set_axis_extremes_based_on_coordinates(
-			uncertainty_active.solutions
+			uncertainty_active.solution_extremes()
 		)
 		tab_plot_widget = self.plot_uncertainty_using_pyqtgraph()
-		tab_gallery_widget = self.plot_uncertainty_using_pyqtgraph()
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -2552,8 +2450,7 @@ class PyQtGraphMethods:
 		uncertainty_active = director.uncertainty_active
 		ndim = uncertainty_active.ndim
 		range_points = uncertainty_active.range_points
-		npoint = uncertainty_active.npoints
-		solutions = uncertainty_active.solutions
+		point_statistics = uncertainty_active.point_statistics()
 
 		if ndim > MAXIMUM_NUMBER_OF_DIMENSIONS_FOR_PLOTTING:
 			title = "Too many dimensions for plotting"
@@ -2567,16 +2464,15 @@ class PyQtGraphMethods:
 		graphics_layout_widget, plot = self._initialize_uncertainty_plot()
 
 		for each_point in range_points:
-			x_coords, y_coords = self._extract_point_coordinates(
-				solutions, each_point, npoint
-			)
+			x_coords = point_statistics.x_coords[each_point]
+			y_coords = point_statistics.y_coords[each_point]
 			x_mean, y_mean = common.solutions_means(each_point)
 
 			self._add_point_scatter_and_label(
 				plot, each_point, x_coords, y_coords, x_mean, y_mean
 			)
 			pyqtgraph_common.add_ellipse_mode_pyqtgraph(
-				plot, x_coords, y_coords, x_mean, y_mean
+				plot, each_point, x_mean, y_mean
 			)
 
 		director.set_focus_on_tab("Plot")
@@ -2619,17 +2515,6 @@ class PyQtGraphMethods:
 
 # ------------------------------------------------------------------------
 
-	def _extract_point_coordinates(
-		self, solutions: pd.DataFrame, each_point: int, npoint: int
-	) -> tuple[np.ndarray, np.ndarray]:
-		"""Extract x and y coordinates for a point across repetitions."""
-		point_coordinates_for_repetition = solutions.iloc[each_point::npoint]
-		x_coords = point_coordinates_for_repetition.iloc[:, 0].to_numpy()
-		y_coords = point_coordinates_for_repetition.iloc[:, 1].to_numpy()
-		return x_coords, y_coords
-
-	# ------------------------------------------------------------------------
-
 	def request_spatial_uncertainty_plot_for_tabs_using_pyqtgraph(self) \
 		-> None:
 		director = self._director
@@ -2638,14 +2523,11 @@ class PyQtGraphMethods:
 		uncertainty_active = director.uncertainty_active
 
 		common.set_axis_extremes_based_on_coordinates(
-			uncertainty_active.solutions
+			uncertainty_active.solution_extremes()
 		)
 		tab_plot_widget = self.plot_spatial_uncertainty_using_pyqtgraph()
-		tab_gallery_widget = self.plot_spatial_uncertainty_using_pyqtgraph()
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -2660,8 +2542,7 @@ class PyQtGraphMethods:
 		uncertainty_active = director.uncertainty_active
 		ndim = uncertainty_active.ndim
 		range_points = uncertainty_active.range_points
-		npoint = uncertainty_active.npoints
-		solutions = uncertainty_active.solutions
+		point_statistics = uncertainty_active.point_statistics()
 
 		if ndim > MAXIMUM_NUMBER_OF_DIMENSIONS_FOR_PLOTTING:
 			title = "Too many dimensions for plotting"
@@ -2679,11 +2560,8 @@ class PyQtGraphMethods:
 		plot_to_show = getattr(director, "plot_to_show", "ellipses")
 
 		for each_point in range_points:
-			point_coordinates_for_repetition = solutions.iloc[
-				each_point::npoint
-			]
-			x_coords = point_coordinates_for_repetition.iloc[:, 0].to_numpy()
-			y_coords = point_coordinates_for_repetition.iloc[:, 1].to_numpy()
+			x_coords = point_statistics.x_coords[each_point]
+			y_coords = point_statistics.y_coords[each_point]
 			x_mean, y_mean = common.solutions_means(each_point)
 
 			self._add_point_scatter_and_label(
@@ -2693,7 +2571,7 @@ class PyQtGraphMethods:
 			match plot_to_show:
 				case "ellipses":
 					pyqtgraph_common.add_ellipse_mode_pyqtgraph(
-						plot, x_coords, y_coords, x_mean, y_mean
+						plot, each_point, x_mean, y_mean
 					)
 				case "boxes":
 					pyqtgraph_common.add_box_mode_pyqtgraph(plot, each_point)
@@ -2791,14 +2669,11 @@ class PyQtGraphMethods:
 		uncertainty_active = director.uncertainty_active
 
 		common.set_axis_extremes_based_on_coordinates(
-			uncertainty_active.solutions
+			uncertainty_active.solution_extremes()
 		)
 		tab_plot_widget = self.plot_point_uncertainty_using_pyqtgraph()
-		tab_gallery_widget = self.plot_point_uncertainty_using_pyqtgraph()
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
@@ -2816,7 +2691,6 @@ class PyQtGraphMethods:
 		dim_names = uncertainty_active.dim_names
 		point_labels = uncertainty_active.point_labels
 		range_points = uncertainty_active.range_points
-		npoint = uncertainty_active.npoints
 		ndim = uncertainty_active.ndim
 
 		if ndim > MAXIMUM_NUMBER_OF_DIMENSIONS_FOR_PLOTTING:
@@ -2832,7 +2706,7 @@ class PyQtGraphMethods:
 		selected_point_indices = getattr(
 			director, "selected_point_indices", range_points
 		)
-		solutions = uncertainty_active.solutions
+		point_statistics = uncertainty_active.point_statistics()
 
 		title = "Uncertainty"
 		graphics_layout_widget, plot = (
@@ -2850,11 +2724,8 @@ class PyQtGraphMethods:
 			plot.addItem(label_text)
 
 		for each_point in selected_point_indices:
-			point_coordinates_for_repetition = solutions.iloc[
-				each_point::npoint
-			]
-			x_coords = point_coordinates_for_repetition.iloc[:, 0].to_numpy()
-			y_coords = point_coordinates_for_repetition.iloc[:, 1].to_numpy()
+			x_coords = point_statistics.x_coords[each_point]
+			y_coords = point_statistics.y_coords[each_point]
 			x_mean, y_mean = common.solutions_means(each_point)
 
 			scatter = pg.ScatterPlotItem(
@@ -2866,7 +2737,7 @@ class PyQtGraphMethods:
 			match plot_to_show:
 				case "ellipses":
 					pyqtgraph_common.add_ellipse_mode_pyqtgraph(
-						plot, x_coords, y_coords, x_mean, y_mean
+						plot, each_point, x_mean, y_mean
 					)
 				case "boxes":
 					pyqtgraph_common.add_box_mode_pyqtgraph(plot, each_point)
@@ -2893,11 +2764,8 @@ class PyQtGraphMethods:
 
 		director.common.set_axis_extremes_based_on_coordinates(point_coords)
 		tab_plot_widget = self._plot_vectors_using_pyqtgraph()
-		tab_gallery_widget = self._plot_vectors_using_pyqtgraph()
 
-		pyqtgraph_common.plot_to_gui_using_pyqtgraph(
-			tab_plot_widget, tab_gallery_widget
-		)
+		pyqtgraph_common.plot_to_gui_using_pyqtgraph(tab_plot_widget)
 
 		return
 
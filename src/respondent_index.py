@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from collections.abc import Sequence
+	from director import Status
+
+# Where each segment type's names are kept once Rivalry has assigned
+# individuals to segments
+SEGMENT_NAMES_BY_TYPE: dict[str, str] = {
+	"Base": "base_pcts_df",
+	"Convertible": "conv_pcts_df",
+	"Core": "core_pcts_df",
+	"Likely": "likely_pcts_df",
+	"Battle_ground": "battleground_pcts_df",
+	"First": "first_pcts_df",
+	"Second": "second_pcts_df",
+}
+
+# --------------------------------------------------------------------------
+
+
+class RespondentIndex:
+	"""A KD-tree over the individuals' scores on the two plotted
+	dimensions.
+
+	It is built when scores are calculated so that finding the individual
+	nearest the pointer, or those inside a lasso, is a tree query rather
+	than a pass over every score. Individuals are identified by their
+	position in the scores.
+	"""
+
+	def __init__(
+		self,
+		x: Sequence[float] | np.ndarray | pd.Series,
+		y: Sequence[float] | np.ndarray | pd.Series,
+	) -> None:
+		from scipy.spatial import cKDTree  # noqa: PLC0415
+
+		self.coords = np.column_stack(
+			(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+		)
+		self._tree = cKDTree(self.coords)
+
+	# ------------------------------------------------------------------------
+
+	def nearest(self, x: float, y: float, max_distance: float) -> int | None:
+		"""Return the individual nearest (x, y), or None if none is within
+		max_distance.
+		"""
+		if self.coords.shape[0] == 0:
+			return None
+		distance, nearest = self._tree.query(
+			(x, y), distance_upper_bound=max_distance
+		)
+		if not np.isfinite(distance):
+			return None
+		return int(nearest)
+
+	# ------------------------------------------------------------------------
+
+	def within_polygon(self, vertices: np.ndarray) -> np.ndarray:
+		"""Return, in order, the individuals inside the polygon whose
+		vertices are the rows of vertices.
+		"""
+		from matplotlib.path import Path  # noqa: PLC0415
+
+		vertices = np.asarray(vertices, dtype=np.float64)
+		if vertices.shape[0] < 3:  # noqa: PLR2004
+			return np.array([], dtype=np.intp)
+		# Only individuals within the circle around the polygon's bounding
+		# box need be tested against the polygon itself
+		lower = vertices.min(axis=0)
+		upper = vertices.max(axis=0)
+		candidates = np.asarray(
+			self._tree.query_ball_point(
+				(lower + upper) / 2, np.hypot(*(upper - lower)) / 2
+			),
+			dtype=np.intp,
+		)
+		if candidates.size == 0:
+			return candidates
+		inside = Path(vertices).contains_points(self.coords[candidates])
+		return np.sort(candidates[inside])
+
+
+# --------------------------------------------------------------------------
+
+
+def describe_individual(director: Status, individual: int) -> str:
+	"""Describe an individual by their scores, the segments they are in
+	and their variables in the individuals file.
+	"""
+	common = director.common
+	scores_active = director.scores_active
+	x, y = scores_active.current_respondent_index().coords[individual]
+	lines = [
+		f"Individual {scores_active.scores.iloc[individual, 0]}",
+		f"{scores_active.score_1_name}: {x:.2f}",
+		f"{scores_active.score_2_name}: {y:.2f}",
+	]
+	if common.have_segments():
+		segments = director.rivalry.seg
+		if individual < len(segments):
+			lines.extend(
+				f"{segment_type}: "
+				+ _segment_name(
+					director,
+					segment_type,
+					segments[segment_type].iloc[individual],
+				)
+				for segment_type in SEGMENT_NAMES_BY_TYPE
+			)
+	if common.have_individual_data():
+		ind_vars = director.individuals_active.ind_vars
+		if individual < len(ind_vars):
+			lines.extend(
+				f"{var_name}: {ind_vars[var_name].iloc[individual]}"
+				for var_name in ind_vars.columns
+			)
+	return "\n".join(lines)
+
+
+# --------------------------------------------------------------------------
+
+
+def summarize_individuals(
+	director: Status, individuals: np.ndarray
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+	"""Summarize a selection of individuals.
+
+	Returns the mean, standard deviation, minimum and maximum of their
+	scores and of the numeric variables in the individuals file, and the
+	percent of them in each segment.
+	"""
+	common = director.common
+	scores_active = director.scores_active
+	coords = scores_active.current_respondent_index().coords[individuals]
+	variables = pd.DataFrame(
+		coords,
+		columns=pd.Index(
+			[scores_active.score_1_name, scores_active.score_2_name]
+		),
+	)
+	if common.have_individual_data():
+		ind_vars = director.individuals_active.ind_vars
+		if len(ind_vars) == len(scores_active.scores):
+			numeric_vars = ind_vars.select_dtypes("number").iloc[individuals]
+			variables = pd.concat(
+				[variables, numeric_vars.reset_index(drop=True)], axis=1
+			)
+	stats = pd.DataFrame(
+		{
+			"Mean": variables.mean(),
+			"Standard Deviation": variables.std(),
+			"Min": variables.min(),
+			"Max": variables.max(),
+		}
+	)
+
+	segment_rows = []
+	if common.have_segments() and individuals.size > 0:
+		segments = director.rivalry.seg
+		for segment_type in SEGMENT_NAMES_BY_TYPE:
+			codes = (
+				segments[segment_type]
+				.to_numpy()[individuals]
+				.astype(np.intp)
+			)
+			counts = np.bincount(codes)
+			segment_rows.extend(
+				(
+					segment_type,
+					_segment_name(director, segment_type, code),
+					100 * counts[code] / individuals.size,
+				)
+				for code in np.flatnonzero(counts)
+			)
+	segment_pcts = pd.DataFrame(
+		segment_rows, columns=pd.Index(["Segment type", "Segment", "Percent"])
+	)
+	return stats, segment_pcts
+
+
+# --------------------------------------------------------------------------
+
+
+def _segment_name(director: Status, segment_type: str, code: int) -> str:
+	names = getattr(
+		director.rivalry, SEGMENT_NAMES_BY_TYPE[segment_type], None
+	)
+	if names is None or code not in names.index:
+		return str(code)
+	return str(names.loc[code].iloc[0])
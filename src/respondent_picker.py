@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import numpy as np
+import pyqtgraph as pg
+from PySide6.QtCore import QObject, QPointF, Qt
+
+from typing import TYPE_CHECKING
+
+from constants import PICK_RADIUS_PIXELS
+from respondent_index import describe_individual, summarize_individuals
+
+if TYPE_CHECKING:
+	from pyqtgraph.GraphicsScene.mouseEvents import MouseDragEvent
+	from director import Status
+
+# --------------------------------------------------------------------------
+
+
+class RespondentPicker(QObject):
+	"""Lets the individuals on a Scores or Joint plot be examined.
+
+	Hovering near an individual shows their scores, segments and
+	individuals file variables. Dragging with Shift held draws a lasso;
+	when it is released the individuals inside it are kept as
+	scores_active.selected_individuals and summarized in the Record tab.
+	Both use the scores' RespondentIndex, so neither scans the scores.
+	The picker belongs to the plot's widget and goes with it.
+	"""
+
+	def __init__(
+		self,
+		director: Status,
+		graphics_layout_widget: pg.GraphicsLayoutWidget,
+		plot: pg.PlotItem,
+	) -> None:
+		super().__init__(graphics_layout_widget)
+		self._director = director
+		self._plot = plot
+		self._view_box = plot.getViewBox()
+		self._index = director.scores_active.current_respondent_index()
+
+		self._marker = pg.ScatterPlotItem(
+			size=12, pen=pg.mkPen("r", width=2), brush=None
+		)
+		self._label = pg.TextItem(
+			color="k", fill=pg.mkBrush(255, 255, 224, 230), border="k"
+		)
+		self._lasso = pg.PlotCurveItem(
+			pen=pg.mkPen("r", width=1, style=Qt.PenStyle.DashLine)
+		)
+		for item in (self._marker, self._label, self._lasso):
+			item.setZValue(1000)
+			plot.addItem(item, ignoreBounds=True)
+		self._label.hide()
+		self._lasso_vertices: list[tuple[float, float]] = []
+
+		# Shift-drags draw the lasso; other drags still pan and zoom
+		self._view_box_drag = self._view_box.mouseDragEvent
+		self._view_box.mouseDragEvent = self._drag
+		plot.scene().sigMouseMoved.connect(self._hover)
+
+	# ------------------------------------------------------------------------
+
+	def _hover(self, scene_position: QPointF) -> None:
+		if (
+			self._lasso_vertices
+			or not self._view_box.sceneBoundingRect().contains(
+				scene_position
+			)
+		):
+			self._hide_individual()
+			return
+		position = self._view_box.mapSceneToView(scene_position)
+		pixel_width, pixel_height = self._view_box.viewPixelSize()
+		individual = self._index.nearest(
+			position.x(),
+			position.y(),
+			PICK_RADIUS_PIXELS * max(pixel_width, pixel_height),
+		)
+		if individual is None:
+			self._hide_individual()
+			return
+		x, y = self._index.coords[individual]
+		self._marker.setData([x], [y])
+		self._label.setText(describe_individual(self._director, individual))
+		self._label.setPos(x, y)
+		self._label.show()
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _hide_individual(self) -> None:
+		self._marker.clear()
+		self._label.hide()
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _drag(self, event: MouseDragEvent, axis: int | None = None) -> None:
+		if event.button() != Qt.MouseButton.LeftButton or (
+			not self._lasso_vertices
+			and not event.modifiers() & Qt.KeyboardModifier.ShiftModifier
+		):
+			self._view_box_drag(event, axis)
+			return
+		event.accept()
+		if event.isStart():
+			self._hide_individual()
+			self._lasso_vertices = []
+		position = self._view_box.mapSceneToView(event.scenePos())
+		self._lasso_vertices.append((position.x(), position.y()))
+		# Drawn closed, as it will be selected
+		x, y = zip(
+			*[*self._lasso_vertices, self._lasso_vertices[0]], strict=True
+		)
+		self._lasso.setData(x, y)
+		if event.isFinish():
+			self._select(np.array(self._lasso_vertices))
+			self._lasso_vertices = []
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _select(self, vertices: np.ndarray) -> None:
+		director = self._director
+		individuals = self._index.within_polygon(vertices)
+		director.scores_active.selected_individuals = individuals
+		self._label.setText(f"{individuals.size} selected")
+		self._label.setPos(*vertices.mean(axis=0))
+		self._label.show()
+
+		stats, segment_pcts = summarize_individuals(director, individuals)
+		print(f"\n\tLasso selected {individuals.size} individuals\n")
+		if individuals.size > 0:
+			print(stats.to_string(float_format="{:.2f}".format))
+			if not segment_pcts.empty:
+				print()
+				print(
+					segment_pcts.to_string(
+						index=False, float_format="{:.1f}".format
+					)
+				)
+		return
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import random
+import numpy as np
 import pandas as pd
 import peek # noqa: F401
 from typing import TYPE_CHECKING
@@ -8,13 +8,15 @@ from typing import TYPE_CHECKING
 
 # from dialogs import ModifyValuesDialog, PairofPointsDialog
 from exceptions import SpacesError
+from sample_design import SampleDesign
+from seeds import child_seed
 
 from supporters import ASupporterGrouping
 
 if TYPE_CHECKING:
 	from director import Status
 	from common import Spaces
-	from PySide6.QtWidgets import QTableWidget
+	from PySide6.QtWidgets import QTableView, QTableWidget
 # ---------------------------------------------------------------------------
 
 
@@ -584,9 +586,7 @@ class SampleDesignerCommand:
 		# self._director.uncertainty_active.universe_size = 0
 		# self._director.uncertainty_active.probability_of_inclusion = 0
 		# self._director.uncertainty_active.nrepetitions = 0
-		self._director.uncertainty_active.sample_design = pd.DataFrame(
-			columns=pd.Index(["RespId", "Repetition", "Selected"])
-		)
+		self._director.uncertainty_active.sample_design = None
 		self._director.uncertainty_active.sample_design_frequencies = (
 			pd.DataFrame(
 				columns=pd.Index(["Repetition", "Selected", "Count"])
@@ -619,7 +619,7 @@ class SampleDesignerCommand:
 		self._director.uncertainty_active.probability_of_inclusion = \
 			probability_of_inclusion
 		self._director.uncertainty_active.nrepetitions = nrepetitions
-		self._create_sample_design()
+		self._create_sample_design(params["seed"])
 
 		common.create_sample_design_analysis_table()
 		common._print_sample_design_analysis_results()
@@ -630,42 +630,19 @@ class SampleDesignerCommand:
 
 	# ------------------------------------------------------------------------
 
-	def _create_sample_design(self) -> None:
+	def _create_sample_design(self, seed: int) -> None:
 		universe_size = self._director.uncertainty_active.universe_size
 		probability_of_inclusion = (
 			self._director.uncertainty_active.probability_of_inclusion)
 		nrepetitions = self._director.uncertainty_active.nrepetitions
-		sample_design = self._director.uncertainty_active.sample_design
 
-		# sample_size = int(universe_size * probability_of_inclusion / 100)
-		range_of_universe = range(universe_size)
-		# range_of_sample = range(sample_size)
-		range_of_repetitions = range(1, nrepetitions + 1)
-		n_selected = 0
-		next_out = 0
-		for each_repetition in range_of_repetitions:
-			for each_case in range_of_universe:
-				probability: float = probability_of_inclusion
-				if random.uniform(0.0, 100.0) <= probability:
-					select = True
-					n_selected += 1
-				else:
-					select = False
-				sample_design.loc[next_out] = {
-					"RespId": each_case,
-					"Repetition": each_repetition,
-					"Selected": select,
-				}
-
-				next_out += 1
-
-		sample_design.sort_values(by=["Repetition", "RespId"], inplace=True)
-
-		sample_design_frequencies = (
-			sample_design.groupby(["Repetition", "Selected"])  # type: ignore[call-overload]
-			.size()
-			.reset_index(name="Count")
+		sample_design = SampleDesign(
+			universe_size,
+			nrepetitions,
+			probability_of_inclusion,
+			seed=child_seed(seed, "sample design"),
 		)
+		sample_design_frequencies = sample_design.frequencies()
 		sample_design_frequencies_as_json = sample_design_frequencies.to_json(
 			orient="records"
 		)
@@ -792,31 +769,11 @@ class SampleRepetitionsCommand:
 
 	def _create_sample_repetitions(self) -> None:
 		evaluations = self._director.evaluations_active.evaluations
-		universe_size = self._director.uncertainty_active.universe_size
-		nrepetitions = self._director.uncertainty_active.nrepetitions
 		sample_design = self._director.uncertainty_active.sample_design
 
-		columns = evaluations.columns
-
-		sample_repetitions = pd.DataFrame(columns=columns)
-		range_of_repetitions = range(1, nrepetitions + 1)
-
-		next_out = 0
-		for each_repetition in range_of_repetitions:
-			n_selected_for_repetition = 0
-			repetition_start = 0 + (each_repetition - 1) * universe_size
-			repetition_end = each_repetition * universe_size
-			range_of_this_repetition = range(repetition_start, repetition_end)
-			restart = (each_repetition - 1) * universe_size
-			for each_case in range_of_this_repetition:
-				if sample_design.loc[each_case]["Selected"]:
-					n_selected_for_repetition += 1
-					sample_repetitions.loc[next_out] = evaluations.loc[
-						each_case - 0 - restart
-					]
-					next_out += 1
-				else:
-					pass
+		sample_repetitions = evaluations.iloc[
+			sample_design.selected_cases()
+		].reset_index(drop=True)
 
 		self._director.uncertainty_active.sample_repetitions = (
 			sample_repetitions
@@ -834,7 +791,7 @@ class SampleRepetitionsCommand:
 
 	# ------------------------------------------------------------------------
 
-	def _display(self) -> QTableWidget:
+	def _display(self) -> QTableView:
 		#
 		gui_output_as_widget = self._director.uncertainty_active.\
 			create_table_widget_for_sample_designer()
@@ -896,42 +853,35 @@ class ScoreIndividualsCommand:
 		# dim_labels = self._director.configuration_active.dim_labels
 		# ndim = self._director.configuration_active.ndim
 		point_coords = self._director.configuration_active.point_coords
-		evaluations = self._director.evaluations_active.evaluations
-		nevaluators = self._director.evaluations_active.nevaluators
+		evaluations_active = self._director.evaluations_active
+		evaluations = evaluations_active.evaluations
+		nevaluators = evaluations_active.nevaluators
 
 		score_1_name = dim_names[0]
 		score_2_name = dim_names[1]
 
+		# Each individual's scores are their evaluations weighted by the
+		# items' coordinates, found a chunk of individuals at a time
+		item_coords = point_coords.iloc[: evaluations.shape[1], :2].to_numpy(
+			dtype=np.float64
+		)
 		scores_df = pd.DataFrame(
+			np.vstack(
+				[
+					np.empty((0, 2)),
+					*(
+						chunk @ item_coords
+						for chunk in evaluations_active.evaluation_chunks()
+					),
+				]
+			),
 			columns=pd.Index([score_1_name, score_2_name]),
-			index=pd.Index(evaluations.index)
+			index=pd.Index(evaluations.index),
 		)
-		nscored = len(evaluations)
-
 		range_nscored = range(nevaluators)
-		for each_ind in range(len(evaluations)):
-			score_1 = 0
-			score_2 = 0
-			for each_var in range(len(evaluations.columns)):
-				score_1 += (
-					evaluations.iloc[each_ind, each_var]
-					* point_coords.iloc[each_var, 0]
-				)
-				score_2 += (
-					evaluations.iloc[each_ind, each_var]
-					* point_coords.iloc[each_var, 1]
-				)
-				# score_1 += evaluations.iloc[each_ind, each_var]
-				# * point_coords.iloc[each_var, score_1_name]
-				# score_2 += evaluations.iloc[each_ind, each_var]
-				# * point_coords.iloc[each_var, score_2_name]
-			# scores_df.loc[each_ind][0] = score_1
-			# scores_df.loc[each_ind][1] = score_2
-			scores_df.loc[each_ind, score_1_name] = score_1
-			scores_df.loc[each_ind, score_2_name] = score_2
-			# scores_df.loc[score_1_name][each_ind] = score_1
-			# scores_df.loc[score_2_name][each_ind] = score_2
-		scores_df = (scores_df - scores_df.mean()) / scores_df.std()
+		means = scores_df.mean().to_numpy()
+		stds = scores_df.std().to_numpy()
+		scores_df = (scores_df - means) / stds
 		scores = scores_df.copy()
 		scores.reset_index(inplace=True)
 		scores.rename(columns={"index": "Resp no"}, inplace=True)
@@ -954,6 +904,9 @@ class ScoreIndividualsCommand:
 		self._director.scores_active.score_1 = scores[score_1_name]
 		self._director.scores_active.score_2 = scores[score_2_name]
 		self._director.scores_active.ndim = 2
+		self._director.scores_active.score_weights = item_coords / stds
+		self._director.scores_active.score_offsets = -means / stds
+		self._director.scores_active.index_respondents()
 
 		return
 
@@ -256,12 +256,70 @@ class Rivalry:
 		if not self._director.common.have_scores():
 			return
 
+		scores_active = self._director.scores_active
+		(self.seg, segment_names) = self._assign_individuals_to_segments(
+			scores_active.score_1, scores_active.score_2
+		)
+		self.segment_percentages = self.calculate_segment_percentages(self.seg)
+		self.assemble_segment_percentages(*segment_names)
+
+		return
+
+	# ------------------------------------------------------------------------
+
+	def assign_appended_individuals_to_segments(
+		self, first_appended: int
+	) -> None:
+		"""Assign the individuals scored from first_appended on to
+		segments, leaving those scored before them as they were assigned.
+		"""
+		scores_active = self._director.scores_active
+		regions = (
+			self.base_left, self.base_neither, self.base_right,
+			self.convertible_to_left, self.convertible_to_right,
+			self.convertible_settled, self.likely_left, self.likely_right,
+			self.battleground_segment, self.battleground_settled,
+			self.first_left, self.first_right,
+			self.second_up, self.second_down,
+		)
+		earlier_points = [
+			(region._points.x, region._points.y) for region in regions
+		]
+		(appended, segment_names) = self._assign_individuals_to_segments(
+			scores_active.score_1.iloc[first_appended:].reset_index(
+				drop=True
+			),
+			scores_active.score_2.iloc[first_appended:].reset_index(
+				drop=True
+			),
+		)
+		# Assigning them located only the appended individuals in each
+		# region, so those located before are put back ahead of them
+		for region, (x, y) in zip(regions, earlier_points, strict=True):
+			region._points.x = [*x, *region._points.x]
+			region._points.y = [*y, *region._points.y]
+		self.seg = pd.concat([self.seg, appended], ignore_index=True)
+		self.segment_percentages = self.calculate_segment_percentages(self.seg)
+		self.assemble_segment_percentages(*segment_names)
+
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _assign_individuals_to_segments(
+		self, score_1: pd.Series, score_2: pd.Series
+	) -> tuple[pd.DataFrame, tuple[list[str], ...]]:
+		"""Assign the individuals with these scores to every type of
+		segment.
+
+		Returns their segments and, in the order
+		assemble_segment_percentages takes them, the names of each type's
+		segments.
+		"""
 		rivalry = self._director.rivalry
-		nscored = self._director.scores_active.nscored_individ
+		nscored = len(score_1)
 		score_1_name = self._director.scores_active.score_1_name
-		score_1 = self._director.scores_active.score_1
 		score_2_name = self._director.scores_active.score_2_name
-		score_2 = self._director.scores_active.score_2
 		bisector = rivalry.bisector
 		point_coords = self._director.configuration_active.point_coords
 		hor_dim = self._director.common.hor_dim
@@ -273,7 +331,7 @@ class Rivalry:
 		first_dim_divider = rivalry.first_div
 		second_dim_divider = rivalry.second_div
 
-		self.seg = pd.DataFrame(
+		segments = pd.DataFrame(
 			columns=pd.Index([
 				score_1_name,
 				score_2_name,
@@ -286,7 +344,6 @@ class Rivalry:
 				"Second",
 			])
 		)
-		segments = self.seg
 		segments[score_1_name] = score_1
 		segments[score_2_name] = score_2
 		#
@@ -372,8 +429,7 @@ class Rivalry:
 			segments, nscored, score_1_name, score_2_name, bisector
 		)
 
-		self.segment_percentages = self.calculate_segment_percentages(segments)
-		self.assemble_segment_percentages(
+		return segments, (
 			likely_segment_names,
 			base_segment_names,
 			core_segment_names,
@@ -383,8 +439,6 @@ class Rivalry:
 			convertible_segment_names,
 		)
 
-		return
-
 	# ------------------------------------------------------------------------
 
 	def assemble_segment_percentages(
@@ -478,6 +532,42 @@ class Rivalry:
 
 	# ------------------------------------------------------------------------
 
+	def segment_codes(
+		self, score_1: np.ndarray, score_2: np.ndarray
+	) -> pd.DataFrame:
+		"""Return the segment of each type that individuals with these
+		scores fall in, by the same rules assign_to_segments uses, without
+		assigning them.
+		"""
+		score_1 = np.asarray(score_1, dtype=np.float64)
+		score_2 = np.asarray(score_2, dtype=np.float64)
+		bisector = self.bisector
+		west = self.west
+		east = self.east
+		(left, right, _) = self._core_centres(
+			self.rival_a,
+			self.rival_b,
+			bisector,
+			self._director.configuration_active.point_coords,
+			self._director.common.hor_dim,
+			self._director.common.vert_dim,
+		)
+		return pd.DataFrame({
+			"Base": self._base_codes(score_1, score_2, bisector, west, east),
+			"Convertible": self._convertible_codes(
+				score_1, score_2, bisector, west, east
+			),
+			"Core": self._core_codes(score_1, score_2, left, right),
+			"Likely": self._likely_codes(score_1, score_2, bisector),
+			"Battle_ground": self._battleground_codes(
+				score_1, score_2, bisector, west, east
+			),
+			"First": np.where(score_1 < self.first_div, 1, 2),
+			"Second": np.where(score_2 > self.second_div, 1, 2),
+		})
+
+	# ------------------------------------------------------------------------
+
 	def assign_to_likely_segments(
 		self,
 		segments: pd.DataFrame,
@@ -493,28 +583,11 @@ class Rivalry:
 		point_coords = self._director.configuration_active.point_coords
 		hor_dim = self._director.common.hor_dim
 		# vert_dim = self._director.common.vert_dim
-		if bisector._direction == "Flat":
-			for each_indiv in range(nscored):
-				if (
-					segments.loc[each_indiv, score_2_name]
-					< bisector._intercept
-				):
-					segments.loc[each_indiv, "Likely"] = 1
-				else:
-					segments.loc[each_indiv, "Likely"] = 2
-		else:
-			for each_indiv in range(nscored):
-				if (
-					segments.loc[each_indiv, score_1_name]
-					< (
-						segments.loc[each_indiv, score_2_name]
-						- bisector._intercept
-					)
-					/ bisector._slope
-				):
-					segments.loc[each_indiv, "Likely"] = 1
-				else:
-					segments.loc[each_indiv, "Likely"] = 2
+		segments["Likely"] = self._likely_codes(
+			segments[score_1_name].to_numpy(dtype=np.float64),
+			segments[score_2_name].to_numpy(dtype=np.float64),
+			bisector,
+		)
 
 		rivalry.likely_left._points.x = in_group(
 			segments, nscored, score_1_name, "Likely", {1}
@@ -541,6 +614,20 @@ class Rivalry:
 
 	# ------------------------------------------------------------------------
 
+	def _likely_codes(
+		self, score_1: np.ndarray, score_2: np.ndarray, bisector: Bisector
+	) -> np.ndarray:
+		with np.errstate(divide="ignore", invalid="ignore"):
+			if bisector._direction == "Flat":
+				left = score_2 < bisector._intercept
+			else:
+				left = score_1 < (
+					(score_2 - bisector._intercept) / bisector._slope
+				)
+		return np.where(left, 1, 2)
+
+	# ------------------------------------------------------------------------
+
 	def assign_to_base_segments(
 		self,
 		segments: pd.DataFrame,
@@ -555,39 +642,13 @@ class Rivalry:
 	) -> tuple[pd.DataFrame, list[str]]:
 		rivalry = self._director.rivalry
 		in_group = self._director.common.in_group
-		for each_indiv in segments.index:
-			west_at_x_coord = (
-				segments.loc[each_indiv, score_2_name] - west._intercept
-			) / west._slope
-
-			east_at_x_coord = (
-				segments.loc[each_indiv, score_2_name] - east._intercept
-			) / east._slope
-
-			if bisector._direction == "Flat":
-				segments = self._base_group_when_bisector_is_flat(
-					segments, each_indiv, score_2_name, west, east
-				)
-			elif bisector._direction == "Vertical":
-				segments = self._base_group_when_bisector_is_vertical(
-					segments, each_indiv, score_1_name, west, east
-				)
-			elif bisector._direction == "Upward slope":
-				segments = self._base_group_when_bisector_slopes_upward(
-					segments,
-					each_indiv,
-					score_1_name,
-					west_at_x_coord,
-					east_at_x_coord,
-				)
-			elif bisector._direction == "Downward slope":
-				segments = self._base_group_when_bisector_slopes_downward(
-					segments,
-					each_indiv,
-					score_1_name,
-					west_at_x_coord,
-					east_at_x_coord,
-				)
+		segments["Base"] = self._base_codes(
+			segments[score_1_name].to_numpy(dtype=np.float64),
+			segments[score_2_name].to_numpy(dtype=np.float64),
+			bisector,
+			west,
+			east,
+		)
 
 		rivalry.base_left._points.x = in_group(
 			segments, nscored, score_1_name, "Base", {1}
@@ -622,91 +683,101 @@ class Rivalry:
 
 	# ------------------------------------------------------------------------
 
+	def _base_codes(
+		self,
+		score_1: np.ndarray,
+		score_2: np.ndarray,
+		bisector: Bisector,
+		west: West,
+		east: East,
+	) -> np.ndarray:
+		with np.errstate(divide="ignore", invalid="ignore"):
+			west_at_x_coord = (score_2 - west._intercept) / west._slope
+			east_at_x_coord = (score_2 - east._intercept) / east._slope
+
+		if bisector._direction == "Flat":
+			return self._base_group_when_bisector_is_flat(
+				score_2, west, east
+			)
+		if bisector._direction == "Vertical":
+			return self._base_group_when_bisector_is_vertical(
+				score_1, west, east
+			)
+		if bisector._direction == "Upward slope":
+			return self._base_group_when_bisector_slopes_upward(
+				score_1, west_at_x_coord, east_at_x_coord
+			)
+		if bisector._direction == "Downward slope":
+			return self._base_group_when_bisector_slopes_downward(
+				score_1, west_at_x_coord, east_at_x_coord
+			)
+		return np.full(score_1.shape, np.nan)
+
+	# ------------------------------------------------------------------------
+
 	def _base_group_when_bisector_is_flat(
 		self,
-		segments: pd.DataFrame,
-		each_indiv: int,
-		score_2_name: str,
+		score_2: np.ndarray,
 		west: West,
 		east: East,
-	) -> pd.DataFrame:
-		if segments.loc[each_indiv, score_2_name] < west._start.y:
-			segments.loc[each_indiv, "Base"] = 1
-		elif (
-			east._start.y
-			> segments.loc[each_indiv, score_2_name]
-			> west._start.y
-		):
-			segments.loc[each_indiv, "Base"] = 2
-		else:
-			segments.loc[each_indiv, "Base"] = 3
-		return segments
+	) -> np.ndarray:
+		return np.select(
+			[
+				score_2 < west._start.y,
+				(east._start.y > score_2) & (score_2 > west._start.y),
+			],
+			[1, 2],
+			default=3,
+		)
 
 	# ------------------------------------------------------------------------
 
 	def _base_group_when_bisector_is_vertical(
 		self,
-		segments: pd.DataFrame,
-		each_indiv: int,
-		score_1_name: str,
+		score_1: np.ndarray,
 		west: West,
 		east: East,
-	) -> pd.DataFrame:
-		if segments.loc[each_indiv, score_1_name] < west._start.x:
-			segments.loc[each_indiv, "Base"] = 1
-		elif segments.loc[each_indiv, score_1_name] > east._start.x:
-			segments.loc[each_indiv, "Base"] = 3
-		else:
-			segments.loc[each_indiv, "Base"] = 2
-		return segments
+	) -> np.ndarray:
+		return np.select(
+			[score_1 < west._start.x, score_1 > east._start.x],
+			[1, 3],
+			default=2,
+		)
 
 	# ------------------------------------------------------------------------
 
 	def _base_group_when_bisector_slopes_upward(
 		self,
-		segments: pd.DataFrame,
-		each_indiv: int,
-		score_1_name: str,
-		west_at_x_coord: float,
-		east_at_x_coord: float,
-	) -> pd.DataFrame:
-		if segments.loc[each_indiv, score_1_name] < west_at_x_coord:
-			segments.loc[each_indiv, "Base"] = 1
-		elif (
-			east_at_x_coord
-			> segments.loc[each_indiv, score_1_name]
-			> west_at_x_coord
-		):
-			segments.loc[each_indiv, "Base"] = 2
-		else:
-			segments.loc[each_indiv, "Base"] = 3
-
-		return segments
+		score_1: np.ndarray,
+		west_at_x_coord: np.ndarray,
+		east_at_x_coord: np.ndarray,
+	) -> np.ndarray:
+		return np.select(
+			[
+				score_1 < west_at_x_coord,
+				(east_at_x_coord > score_1) & (score_1 > west_at_x_coord),
+			],
+			[1, 2],
+			default=3,
+		)
 
 	# ------------------------------------------------------------------------
 
 	def _base_group_when_bisector_slopes_downward(
 		self,
-		segments: pd.DataFrame,
-		each_indiv: int,
-		score_1_name: str,
-		west_at_x_coord: float,
-		east_at_x_coord: float,
-	) -> pd.DataFrame:
-		if (
-			segments.loc[each_indiv, score_1_name] < west_at_x_coord
-		):  # switched side
-			segments.loc[each_indiv, "Base"] = 1
-		elif (
-			east_at_x_coord
-			> segments.loc[each_indiv, score_1_name]
-			> west_at_x_coord
-		):  # switched side twice
-			segments.loc[each_indiv, "Base"] = 2
-		else:
-			segments.loc[each_indiv, "Base"] = 3
-
-		return segments
+		score_1: np.ndarray,
+		west_at_x_coord: np.ndarray,
+		east_at_x_coord: np.ndarray,
+	) -> np.ndarray:
+		return np.select(
+			[
+				score_1 < west_at_x_coord,  # switched side
+				# switched side twice
+				(east_at_x_coord > score_1) & (score_1 > west_at_x_coord),
+			],
+			[1, 2],
+			default=3,
+		)
 
 	# ------------------------------------------------------------------------
 
@@ -725,50 +796,13 @@ class Rivalry:
 		rivalry = self._director.rivalry
 		in_group = self._director.common.in_group
 		not_in_group = self._director.common.not_in_group
-		for each_indiv in range(nscored):
-			bisector_x = (
-				segments.loc[each_indiv, score_2_name] - bisector._intercept
-			) / bisector._slope
-			west_at_x_coord = (
-				segments.loc[each_indiv, score_2_name] - west._intercept
-			) / west._slope
-			east_at_x_coord = (
-				segments.loc[each_indiv, score_2_name] - east._intercept
-			) / east._slope
-			#
-			if bisector._direction == "Flat":
-				segments = self._convertible_group_when_bisector_is_flat(
-					segments,
-					each_indiv,
-					bisector._start.y,
-					score_2_name,
-					west,
-					east,
-				)
-			elif bisector._direction == "Vertical":
-				segments = self._convertible_group_when_bisector_is_vertical(
-					segments, each_indiv, score_1_name, bisector, west, east
-				)
-			elif bisector._direction == "Upward slope":
-				segments = self._convertible_group_when_bisector_slopes_upward(
-					segments,
-					each_indiv,
-					score_1_name,
-					bisector_x,
-					west_at_x_coord,
-					east_at_x_coord,
-				)
-			elif bisector._direction == "Downward slope":
-				segments = (
-					self._convertible_group_when_bisector_slopes_downward(
-						segments,
-						each_indiv,
-						score_1_name,
-						bisector_x,
-						west_at_x_coord,
-						east_at_x_coord,
-					)
-				)
+		segments["Convertible"] = self._convertible_codes(
+			segments[score_1_name].to_numpy(dtype=np.float64),
+			segments[score_2_name].to_numpy(dtype=np.float64),
+			bisector,
+			west,
+			east,
+		)
 
 		rivalry.convertible_to_left._points.x = in_group(
 			segments, nscored, score_1_name, "Convertible", {1}
@@ -812,116 +846,108 @@ class Rivalry:
 
 	# ------------------------------------------------------------------------
 
-	def _convertible_group_when_bisector_is_flat(
+	def _convertible_codes(
 		self,
-		segments: pd.DataFrame,
-		each_indiv: int,
-		bisector_start_y: float,
-		score_2_name: str,
+		score_1: np.ndarray,
+		score_2: np.ndarray,
+		bisector: Bisector,
 		west: West,
 		east: East,
-	) -> pd.DataFrame:
+	) -> np.ndarray:
+		with np.errstate(divide="ignore", invalid="ignore"):
+			bisector_x = (score_2 - bisector._intercept) / bisector._slope
+			west_at_x_coord = (score_2 - west._intercept) / west._slope
+			east_at_x_coord = (score_2 - east._intercept) / east._slope
+		#
+		if bisector._direction == "Flat":
+			return self._convertible_group_when_bisector_is_flat(
+				score_2, bisector._start.y, west, east
+			)
+		if bisector._direction == "Vertical":
+			return self._convertible_group_when_bisector_is_vertical(
+				score_1, bisector, west, east
+			)
+		if bisector._direction == "Upward slope":
+			return self._convertible_group_when_bisector_slopes_upward(
+				score_1, bisector_x, west_at_x_coord, east_at_x_coord
+			)
+		if bisector._direction == "Downward slope":
+			return self._convertible_group_when_bisector_slopes_downward(
+				score_1, bisector_x, west_at_x_coord, east_at_x_coord
+			)
+		return np.full(score_1.shape, np.nan)
 
-		if (
-			bisector_start_y
-			< segments.loc[each_indiv, score_2_name]
-			< east._start.y
-		):
-			segments.loc[each_indiv, "Convertible"] = 1
-		elif (
-			bisector_start_y
-			> segments.loc[each_indiv, score_2_name]
-			> west._start.y
-		):
-			segments.loc[each_indiv, "Convertible"] = 2
-		else:
-			segments.loc[each_indiv, "Convertible"] = 3
+	# ------------------------------------------------------------------------
 
-		return segments
+	def _convertible_group_when_bisector_is_flat(
+		self,
+		score_2: np.ndarray,
+		bisector_start_y: float,
+		west: West,
+		east: East,
+	) -> np.ndarray:
+		return np.select(
+			[
+				(bisector_start_y < score_2) & (score_2 < east._start.y),
+				(bisector_start_y > score_2) & (score_2 > west._start.y),
+			],
+			[1, 2],
+			default=3,
+		)
 
 	# ------------------------------------------------------------------------
 
 	def _convertible_group_when_bisector_is_vertical(
 		self,
-		segments: pd.DataFrame,
-		each_indiv: int,
-		score_1_name: str,
+		score_1: np.ndarray,
 		bisector: Bisector,
 		west: West,
 		east: East,
-	) -> pd.DataFrame:
-		if (
-			bisector._start.x
-			< segments.loc[each_indiv, score_1_name]
-			< east._start.x
-		):
-			segments.loc[each_indiv, "Convertible"] = 1
-		elif (
-			bisector._start.x
-			> segments.loc[each_indiv, score_1_name]
-			> west._start.x
-		):
-			segments.loc[each_indiv, "Convertible"] = 2
-		else:
-			segments.loc[each_indiv, "Convertible"] = 3
-
-		return segments
+	) -> np.ndarray:
+		return np.select(
+			[
+				(bisector._start.x < score_1) & (score_1 < east._start.x),
+				(bisector._start.x > score_1) & (score_1 > west._start.x),
+			],
+			[1, 2],
+			default=3,
+		)
 
 	# ------------------------------------------------------------------------
 
 	def _convertible_group_when_bisector_slopes_upward(
 		self,
-		segments: pd.DataFrame,
-		each_indiv: int,
-		score_1_name: str,
-		bisector_x: float,
-		west_at_x_coord: float,
-		east_at_x_coord: float,
-	) -> pd.DataFrame:
-		if (
-			bisector_x
-			< segments.loc[each_indiv, score_1_name]
-			< east_at_x_coord
-		):
-			segments.loc[each_indiv, "Convertible"] = 1
-		elif (
-			bisector_x
-			> segments.loc[each_indiv, score_1_name]
-			> west_at_x_coord
-		):
-			segments.loc[each_indiv, "Convertible"] = 2
-		else:
-			segments.loc[each_indiv, "Convertible"] = 3
-
-		return segments
+		score_1: np.ndarray,
+		bisector_x: np.ndarray,
+		west_at_x_coord: np.ndarray,
+		east_at_x_coord: np.ndarray,
+	) -> np.ndarray:
+		return np.select(
+			[
+				(bisector_x < score_1) & (score_1 < east_at_x_coord),
+				(bisector_x > score_1) & (score_1 > west_at_x_coord),
+			],
+			[1, 2],
+			default=3,
+		)
 
 	# ------------------------------------------------------------------------
 
 	def _convertible_group_when_bisector_slopes_downward(
 		self,
-		segments: pd.DataFrame,
-		each_indiv: int,
-		score_1_name: str,
-		bisector_x: float,
-		west_at_x_coord: float,
-		east_at_x_coord: float,
-	) -> pd.DataFrame:
-		if (
-			bisector_x
-			< segments.loc[each_indiv, score_1_name]
-			< east_at_x_coord
-		):
-			segments.loc[each_indiv, "Convertible"] = 1
-		elif (
-			bisector_x
-			> segments.loc[each_indiv, score_1_name]
-			> west_at_x_coord
-		):
-			segments.loc[each_indiv, "Convertible"] = 2
-		else:
-			segments.loc[each_indiv, "Convertible"] = 3
-
-		return segments
+		score_1: np.ndarray,
+		bisector_x: np.ndarray,
+		west_at_x_coord: np.ndarray,
+		east_at_x_coord: np.ndarray,
+	) -> np.ndarray:
+		return np.select(
+			[
+				(bisector_x < score_1) & (score_1 < east_at_x_coord),
+				(bisector_x > score_1) & (score_1 > west_at_x_coord),
+			],
+			[1, 2],
+			default=3,
+		)
 
 	# -----------------------------------------------------------------------
 
@@ -936,12 +962,36 @@ class Rivalry:
 		point_coords: pd.DataFrame,
 		hor_dim: int,
 		vert_dim: int,
-		nscored: int,
+		nscored: int,  # noqa: ARG002
 	) -> tuple[pd.DataFrame, list[str]]:
 		# point_names = self._director.configuration_active.point_names
 
-		core_radius = self._director.rivalry.core_radius
+		(left, right, core_segment_names) = self._core_centres(
+			rival_a, rival_b, bisector, point_coords, hor_dim, vert_dim
+		)
+		segments["Core"] = self._core_codes(
+			segments[score_1_name].to_numpy(dtype=np.float64),
+			segments[score_2_name].to_numpy(dtype=np.float64),
+			left,
+			right,
+		)
 
+		return segments, core_segment_names
+
+	# ------------------------------------------------------------------------
+
+	def _core_centres(
+		self,
+		rival_a: Point,
+		rival_b: Point,
+		bisector: Bisector,
+		point_coords: pd.DataFrame,
+		hor_dim: int,
+		vert_dim: int,
+	) -> tuple[tuple[float, float], tuple[float, float], list[str]]:
+		"""Return the centres of the left and right core regions and the
+		names of the core segments.
+		"""
 		if bisector._direction == "Flat":
 			if rival_a.y > rival_b.y:
 				# here if rival a is higher vertically than rival b
@@ -972,28 +1022,34 @@ class Rivalry:
 			right_x = point_coords.iloc[rival_a.index, hor_dim]
 			right_y = point_coords.iloc[rival_a.index, vert_dim]
 			core_segment_names = [rival_b.name, "Neither", rival_a.name]
-		#
-		for each_indiv in range(nscored):
-			target_x = segments.loc[each_indiv, score_1_name]
-			target_y = segments.loc[each_indiv, score_2_name]
-			dist_to_left = self.calculate_distance_between_points(
-				Point(left_x, left_y), Point(target_x, target_y)
-			)
-			dist_to_right = self.calculate_distance_between_points(
-				Point(right_x, right_y), Point(target_x, target_y)
-			)
-			#
-			if dist_to_left < core_radius:
-				segments.loc[each_indiv, "Core"] = 1
-			# n_core_1 += 1
-			elif dist_to_right < core_radius:
-				segments.loc[each_indiv, "Core"] = 3
-			# n_core_3 += 1
-			else:
-				segments.loc[each_indiv, "Core"] = 2
-			# n_core_2 += 1
+		return (left_x, left_y), (right_x, right_y), core_segment_names
 
-		return segments, core_segment_names
+	# ------------------------------------------------------------------------
+
+	def _core_codes(
+		self,
+		score_1: np.ndarray,
+		score_2: np.ndarray,
+		left: tuple[float, float],
+		right: tuple[float, float],
+	) -> np.ndarray:
+		core_radius = self._director.rivalry.core_radius
+		(left_x, left_y) = left
+		(right_x, right_y) = right
+		dist_to_left = np.sqrt(
+			(left_x - score_1) * (left_x - score_1)
+			+ (left_y - score_2) * (left_y - score_2)
+		)
+		dist_to_right = np.sqrt(
+			(right_x - score_1) * (right_x - score_1)
+			+ (right_y - score_2) * (right_y - score_2)
+		)
+		#
+		return np.select(
+			[dist_to_left < core_radius, dist_to_right < core_radius],
+			[1, 3],
+			default=2,
+		)
 
 	# ------------------------------------------------------------------------
 
@@ -1013,12 +1069,13 @@ class Rivalry:
 			)
 			self.battleground_settled_people_points = PeoplePoints([], [])
 
-		for each_indiv in range(nscored):
-			battleground_assignment = self._assign_individual_to_battleground(
-				segments, each_indiv, score_1_name, score_2_name,
-				bisector, west, east
-			)
-			segments.loc[each_indiv, "Battle_ground"] = battleground_assignment
+		segments["Battle_ground"] = self._battleground_codes(
+			segments[score_1_name].to_numpy(dtype=np.float64),
+			segments[score_2_name].to_numpy(dtype=np.float64),
+			bisector,
+			west,
+			east,
+		)
 
 		self._update_battleground_points(
 			segments, nscored, score_1_name, score_2_name
@@ -1027,85 +1084,63 @@ class Rivalry:
 		battleground_segment_names = ["Battleground", "Settled"]
 		return segments, battleground_segment_names
 
-	def _assign_individual_to_battleground(
+	def _battleground_codes(
 		self,
-		segments: pd.DataFrame,
-		each_indiv: int,
-		score_1_name: str,
-		score_2_name: str,
+		score_1: np.ndarray,
+		score_2: np.ndarray,
 		bisector: Bisector,
 		west: West,
 		east: East,
-	) -> int:
-		west_at_x_coord = (
-			segments.loc[each_indiv, score_2_name] - west._intercept
-		) / west._slope
-		east_at_x_coord = (
-			segments.loc[each_indiv, score_2_name] - east._intercept
-		) / east._slope
+	) -> np.ndarray:
+		with np.errstate(divide="ignore", invalid="ignore"):
+			west_at_x_coord = (score_2 - west._intercept) / west._slope
+			east_at_x_coord = (score_2 - east._intercept) / east._slope
 
 		if bisector._direction == "Flat":
-			return self._assign_flat_direction(
-				segments, each_indiv, score_2_name, east, west
-			)
+			return self._assign_flat_direction(score_2, east, west)
 		if bisector._direction == "Vertical":
-			return self._assign_vertical_direction(
-				segments, each_indiv, score_1_name, east, west
-			)
+			return self._assign_vertical_direction(score_1, east, west)
 		if bisector._direction in ("Upward slope", "Downward slope"):
 			return self._assign_slope_direction(
-				segments, each_indiv, score_1_name,
-				east_at_x_coord, west_at_x_coord
+				score_1, east_at_x_coord, west_at_x_coord
 			)
-		return SETTLED_ASSIGNMENT
+		return np.full(score_1.shape, SETTLED_ASSIGNMENT)
 
 	def _assign_flat_direction(
 		self,
-		segments: pd.DataFrame,
-		each_indiv: int,
-		score_2_name: str,
+		score_2: np.ndarray,
 		east: East,
 		west: West,
-	) -> int:
-		if (
-			east._intercept
-			< segments.loc[each_indiv, score_2_name]
-			< west._intercept
-		):
-			return BATTLEGROUND_ASSIGNMENT
-		return SETTLED_ASSIGNMENT
+	) -> np.ndarray:
+		return np.where(
+			(east._intercept < score_2) & (score_2 < west._intercept),
+			BATTLEGROUND_ASSIGNMENT,
+			SETTLED_ASSIGNMENT,
+		)
 
 	def _assign_vertical_direction(
 		self,
-		segments: pd.DataFrame,
-		each_indiv: int,
-		score_1_name: str,
+		score_1: np.ndarray,
 		east: East,
 		west: West,
-	) -> int:
-		if (
-			east._start.x
-			> segments.loc[each_indiv, score_1_name]
-			> west._start.x
-		):
-			return BATTLEGROUND_ASSIGNMENT
-		return SETTLED_ASSIGNMENT
+	) -> np.ndarray:
+		return np.where(
+			(east._start.x > score_1) & (score_1 > west._start.x),
+			BATTLEGROUND_ASSIGNMENT,
+			SETTLED_ASSIGNMENT,
+		)
 
 	def _assign_slope_direction(
 		self,
-		segments: pd.DataFrame,
-		each_indiv: int,
-		score_1_name: str,
-		east_at_x_coord: float,
-		west_at_x_coord: float,
-	) -> int:
-		if (
-			east_at_x_coord
-			> segments.loc[each_indiv, score_1_name]
-			> west_at_x_coord
-		):
-			return BATTLEGROUND_ASSIGNMENT
-		return SETTLED_ASSIGNMENT
+		score_1: np.ndarray,
+		east_at_x_coord: np.ndarray,
+		west_at_x_coord: np.ndarray,
+	) -> np.ndarray:
+		return np.where(
+			(east_at_x_coord > score_1) & (score_1 > west_at_x_coord),
+			BATTLEGROUND_ASSIGNMENT,
+			SETTLED_ASSIGNMENT,
+		)
 
 	def _update_battleground_points(
 		self,
@@ -1150,18 +1185,18 @@ class Rivalry:
 	) -> tuple[pd.DataFrame, list[str], list[str]]:
 		rivalry = self._director.rivalry
 		in_group = self._director.common.in_group
-		for each_indiv in range(nscored):
-			# first
-			if segments.loc[each_indiv, score_1_name] < first_div:
-				segments.loc[each_indiv, "First"] = 1
-			else:
-				segments.loc[each_indiv, "First"] = 2
-			# second
-			# if self.second.loc[each_indiv] > self.second_div:
-			if segments.loc[each_indiv, score_2_name] > second_div:
-				segments.loc[each_indiv, "Second"] = 1
-			else:
-				segments.loc[each_indiv, "Second"] = 2
+		# first
+		segments["First"] = np.where(
+			segments[score_1_name].to_numpy(dtype=np.float64) < first_div,
+			1,
+			2,
+		)
+		# second
+		segments["Second"] = np.where(
+			segments[score_2_name].to_numpy(dtype=np.float64) > second_div,
+			1,
+			2,
+		)
 
 		rivalry.first_left._points.x = in_group(
 			segments, nscored, score_1_name, "First", {1}
@@ -1323,7 +1358,8 @@ class Rivalry:
 		considered as going through side_2
 		"""
 		#
-		# randomly set first to be true or false
+		# randomly set first to be true or false - lines through a corner
+		# are rare enough that this is left off the seeded streams
 		#
 		first = random.choice([True, False])
 		#
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from exceptions import SpacesError
+
+# A sample design says which individuals each uncertainty repetition
+# includes. Rather than a row per individual per repetition, a design
+# holds the parameters that generate it, with the seed of its random
+# numbers, and regenerates the selections when they are needed, so that
+# undo snapshots and saved designs stay small whatever the number of
+# individuals and repetitions. A design read from a file without a seed
+# holds its selections packed eight to a byte instead.
+
+SAMPLE_DESIGN_FILE_TYPE: str = "SAMPLE_DESIGN"
+
+# --------------------------------------------------------------------------
+
+
+class SampleDesign:
+	"""The individuals included in each repetition, each individual
+	included with probability_of_inclusion percent chance, independently
+	of the others and of other repetitions.
+	"""
+
+	def __init__(
+		self,
+		universe_size: int,
+		nrepetitions: int,
+		probability_of_inclusion: float,
+		seed: int | None = None,
+		packed_selections: np.ndarray | None = None,
+	) -> None:
+		if seed is None and packed_selections is None:
+			title = "Sample design problem"
+			message = "A sample design needs a seed or its selections."
+			raise SpacesError(title, message)
+		self.universe_size = universe_size
+		self.nrepetitions = nrepetitions
+		self.probability_of_inclusion = probability_of_inclusion
+		self.seed = seed
+		self.packed_selections = packed_selections
+
+	# ------------------------------------------------------------------------
+
+	def selections(self) -> np.ndarray:
+		"""Return whether each individual is included in each repetition,
+		a row per repetition and a column per individual.
+		"""
+		if self.seed is None:
+			return np.unpackbits(
+				self.packed_selections, axis=1, count=self.universe_size
+			).astype(bool)
+		rng = np.random.default_rng(self.seed)
+		draws = rng.uniform(
+			0.0, 100.0, size=(self.nrepetitions, self.universe_size)
+		)
+		return draws <= self.probability_of_inclusion
+
+	# ------------------------------------------------------------------------
+
+	def selected_cases(self) -> np.ndarray:
+		"""Return the position of each included individual, repetition by
+		repetition.
+		"""
+		return np.nonzero(self.selections())[1]
+
+	# ------------------------------------------------------------------------
+
+	def repetition_sizes(self) -> np.ndarray:
+		"""Return how many individuals each repetition includes."""
+		return self.selections().sum(axis=1)
+
+	# ------------------------------------------------------------------------
+
+	def frequencies(self) -> pd.DataFrame:
+		"""Return how many individuals each repetition includes and leaves
+		out, a row for each, as grouping the design by repetition and
+		selection counts them.
+		"""
+		nselected = self.repetition_sizes()
+		counts = np.column_stack((self.universe_size - nselected, nselected))
+		frequencies = pd.DataFrame({
+			"Repetition": np.repeat(np.arange(1, self.nrepetitions + 1), 2),
+			"Selected": np.tile([False, True], self.nrepetitions),
+			"Count": counts.ravel(),
+		})
+		return frequencies[frequencies["Count"] > 0].reset_index(drop=True)
+
+	# ------------------------------------------------------------------------
+
+	def as_dataframe(self) -> pd.DataFrame:
+		"""Return the design in long form, a row for each individual in
+		each repetition.
+		"""
+		return pd.DataFrame({
+			"RespId": np.tile(
+				np.arange(self.universe_size), self.nrepetitions
+			),
+			"Repetition": np.repeat(
+				np.arange(1, self.nrepetitions + 1), self.universe_size
+			),
+			"Selected": self.selections().ravel(),
+		})
+
+	# ------------------------------------------------------------------------
+
+	def write(self, file_name: str) -> None:
+		"""Write the design's parameters and seed or, without a seed, its
+		selections as a line of hexadecimal per repetition.
+		"""
+		seed = "" if self.seed is None else str(self.seed)
+		with Path(file_name).open("w", encoding="utf-8") as f:
+			f.write(f"# TYPE: {SAMPLE_DESIGN_FILE_TYPE}\n")
+			f.write(f"universe_size={self.universe_size}\n")
+			f.write(f"nrepetitions={self.nrepetitions}\n")
+			f.write(
+				f"probability_of_inclusion={self.probability_of_inclusion}\n"
+			)
+			f.write(f"seed={seed}\n")
+			if self.seed is None:
+				f.writelines(
+					f"{each_repetition.tobytes().hex()}\n"
+					for each_repetition in self.packed_selections
+				)
+		return
+
+	# ------------------------------------------------------------------------
+
+	@classmethod
+	def read(cls, file_name: str) -> SampleDesign:
+		"""Read a design written by write, raising ValueError when the file
+		is not one.
+		"""
+		lines = Path(file_name).read_text(encoding="utf-8").splitlines()
+		if (
+			not lines
+			or lines[0].split(":", 1)[-1].strip() != SAMPLE_DESIGN_FILE_TYPE
+		):
+			raise ValueError(file_name)
+		parameters = dict(
+			each_line.split("=", 1) for each_line in lines[1:5]
+		)
+		if set(parameters) != {
+			"universe_size", "nrepetitions", "probability_of_inclusion",
+			"seed",
+		}:
+			raise ValueError(file_name)
+		universe_size = int(parameters["universe_size"])
+		nrepetitions = int(parameters["nrepetitions"])
+		probability_of_inclusion = float(
+			parameters["probability_of_inclusion"]
+		)
+		if parameters["seed"]:
+			return cls(
+				universe_size,
+				nrepetitions,
+				probability_of_inclusion,
+				seed=int(parameters["seed"]),
+			)
+		packed_selections = np.array(
+			[
+				np.frombuffer(bytes.fromhex(each_line), dtype=np.uint8)
+				for each_line in lines[5:]
+			]
+		)
+		if packed_selections.shape != (
+			nrepetitions, (universe_size + 7) // 8
+		):
+			raise ValueError(file_name)
+		return cls(
+			universe_size,
+			nrepetitions,
+			probability_of_inclusion,
+			packed_selections=packed_selections,
+		)
@@ -0,0 +1,471 @@
+from __future__ import annotations
+
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+
+from constants import (
+	SERVICE_BATCH_WAIT_MS,
+	SERVICE_LATENCY_WINDOW,
+	SERVICE_MAX_BATCH_ROWS,
+)
+from exceptions import SpacesError
+from respondent_index import SEGMENT_NAMES_BY_TYPE
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	import pandas as pd
+	from director import Status
+
+# A headless service that scores batches of evaluations, a row of
+# thermometer ratings per individual, against a configuration and contest
+# set up once by a script, and assigns them to segments. Rows arriving
+# together from different requests are scored together, as one matrix
+# product and one pass of the segment rules.
+
+# --------------------------------------------------------------------------
+
+
+class ScoringModel:
+	"""What scoring and segmenting individuals needs, taken from the
+	director once so that later commands cannot change it.
+
+	Scores are the evaluations weighted by the items' coordinates and
+	standardized as Score individuals standardized them; segments are
+	assigned by the rules Rivalry applies to the contest's reference
+	points.
+	"""
+
+	def __init__(self, director: Status) -> None:
+		common = director.common
+		scores_active = director.scores_active
+		if not common.have_scores() or scores_active.score_weights.size == 0:
+			title = "No scores to serve"
+			message = (
+				"The setup script must run Score individuals so that new "
+				"individuals can be scored the same way."
+			)
+			raise SpacesError(title, message)
+		if not common.have_reference_points():
+			title = "No contest to serve"
+			message = (
+				"The setup script must establish Reference points so that "
+				"individuals can be assigned to segments."
+			)
+			raise SpacesError(title, message)
+		if not common.have_segments():
+			director.rivalry.assign_to_segments()
+		self.item_names = list(director.evaluations_active.item_names)
+		self.score_names = [
+			scores_active.score_1_name, scores_active.score_2_name
+		]
+		self.contest = [
+			director.rivalry.rival_a.name, director.rivalry.rival_b.name
+		]
+		self._weights = scores_active.score_weights.copy()
+		self._offsets = scores_active.score_offsets.copy()
+		self._rivalry = director.rivalry
+		self._segment_names = {
+			segment_type: _names_by_code(
+				getattr(director.rivalry, pcts_df_name, None)
+			)
+			for segment_type, pcts_df_name in SEGMENT_NAMES_BY_TYPE.items()
+		}
+
+	# ------------------------------------------------------------------------
+
+	def rows_to_evaluations(self, rows: list) -> np.ndarray:
+		"""Return rows, each a list of evaluations in item order or a dict
+		by item name, as a matrix with missing evaluations as NaN.
+		"""
+		evaluations = np.full((len(rows), len(self.item_names)), np.nan)
+		for each_row, row in enumerate(rows):
+			if isinstance(row, dict):
+				unknown = set(row) - set(self.item_names)
+				if unknown:
+					message = (
+						f"Row {each_row} has unknown items: "
+						f"{', '.join(sorted(unknown))}"
+					)
+					raise ValueError(message)
+				values = [row.get(item_name) for item_name in self.item_names]
+			elif len(row) == len(self.item_names):
+				values = row
+			else:
+				message = (
+					f"Row {each_row} has {len(row)} evaluations, "
+					f"expected {len(self.item_names)}"
+				)
+				raise ValueError(message)
+			evaluations[each_row] = [
+				np.nan if value is None else float(value) for value in values
+			]
+		return evaluations
+
+	# ------------------------------------------------------------------------
+
+	def score(self, evaluations: np.ndarray) -> pd.DataFrame:
+		"""Return the scores and segment codes of individuals with these
+		evaluations.
+		"""
+		scores = evaluations @ self._weights + self._offsets
+		codes = self._rivalry.segment_codes(scores[:, 0], scores[:, 1])
+		codes.insert(0, self.score_names[0], scores[:, 0])
+		codes.insert(1, self.score_names[1], scores[:, 1])
+		return codes
+
+	# ------------------------------------------------------------------------
+
+	def describe(self, scored: pd.DataFrame) -> list[dict]:
+		"""Return each scored individual's scores and segments as a
+		dict, missing scores, and the segments of those missing them, as
+		None.
+		"""
+		described = []
+		for row in scored.itertuples(index=False):
+			values = dict(zip(scored.columns, row, strict=True))
+			individual: dict[str, object] = {
+				score_name: (
+					None if np.isnan(values[score_name])
+					else float(values[score_name])
+				)
+				for score_name in self.score_names
+			}
+			# Without both scores an individual is in no segment
+			individual["segments"] = None if None in individual.values() else {
+				segment_type: self._segment_names[segment_type].get(
+					values[segment_type], str(values[segment_type])
+				)
+				for segment_type in SEGMENT_NAMES_BY_TYPE
+			}
+			described.append(individual)
+		return described
+
+	# ------------------------------------------------------------------------
+
+	def summary(self) -> dict:
+		return {
+			"items": self.item_names,
+			"scores": self.score_names,
+			"contest": self.contest,
+			"segments": {
+				segment_type: sorted(set(names.values()))
+				for segment_type, names in self._segment_names.items()
+			},
+		}
+
+
+# --------------------------------------------------------------------------
+
+
+def _names_by_code(pcts_df: pd.DataFrame | None) -> dict[int, str]:
+	if pcts_df is None or pcts_df.empty:
+		return {}
+	return {
+		int(code): str(name)
+		for code, name in zip(pcts_df.index, pcts_df.iloc[:, 0], strict=True)
+	}
+
+
+# --------------------------------------------------------------------------
+
+
+@dataclass
+class _PendingBatch:
+	evaluations: np.ndarray
+	received: float
+	done: threading.Event = field(default_factory=threading.Event)
+	result: pd.DataFrame = field(init=False)
+	error: Exception | None = None
+
+
+# --------------------------------------------------------------------------
+
+
+class ServiceMetrics:
+	"""Counts, throughput and latency of the requests served so far.
+
+	Latency percentiles are over the last SERVICE_LATENCY_WINDOW requests,
+	from when a request's rows were queued until they were scored.
+	Throughput is rows over the time spent scoring them, so it does not
+	fall while the service waits for requests.
+	"""
+
+	def __init__(self) -> None:
+		self._lock = threading.Lock()
+		self._started = time.perf_counter()
+		self._latencies: deque[float] = deque(maxlen=SERVICE_LATENCY_WINDOW)
+		self.requests = 0
+		self.rows = 0
+		self.batches = 0
+		self.errors = 0
+		self.scoring_seconds = 0.0
+
+	# ------------------------------------------------------------------------
+
+	def record_batch(
+		self, latencies: list[float], nrows: int, scoring_seconds: float
+	) -> None:
+		with self._lock:
+			self.batches += 1
+			self.requests += len(latencies)
+			self.rows += nrows
+			self.scoring_seconds += scoring_seconds
+			self._latencies.extend(latencies)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def record_error(self) -> None:
+		with self._lock:
+			self.errors += 1
+		return
+
+	# ------------------------------------------------------------------------
+
+	def snapshot(self) -> dict:
+		with self._lock:
+			elapsed = time.perf_counter() - self._started
+			latencies_ms = np.array(self._latencies) * 1000.0
+			snapshot = {
+				"requests": self.requests,
+				"rows": self.rows,
+				"batches": self.batches,
+				"errors": self.errors,
+				"seconds_running": round(elapsed, 3),
+				"seconds_scoring": round(self.scoring_seconds, 3),
+				"rows_per_second": (
+					round(self.rows / self.scoring_seconds, 1)
+					if self.scoring_seconds > 0
+					else 0
+				),
+				"rows_per_batch": (
+					round(self.rows / self.batches, 1) if self.batches else 0
+				),
+			}
+		if latencies_ms.size:
+			for name, percentile in (("p50", 50), ("p95", 95), ("p99", 99)):
+				snapshot[f"latency_ms_{name}"] = round(
+					float(np.percentile(latencies_ms, percentile)), 3
+				)
+			snapshot["latency_ms_max"] = round(float(latencies_ms.max()), 3)
+		return snapshot
+
+
+# --------------------------------------------------------------------------
+
+
+class MicroBatcher:
+	"""Scores rows from concurrent requests together.
+
+	A worker thread takes the first waiting request, then gathers those
+	that arrive within SERVICE_BATCH_WAIT_MS, up to SERVICE_MAX_BATCH_ROWS
+	rows, and scores them all at once before handing each request its
+	own rows back.
+	"""
+
+	def __init__(self, model: ScoringModel, metrics: ServiceMetrics) -> None:
+		self._model = model
+		self._metrics = metrics
+		self._pending: queue.Queue[_PendingBatch] = queue.Queue()
+		self._worker = threading.Thread(
+			target=self._score_batches, name="scoring-batcher", daemon=True
+		)
+		self._worker.start()
+
+	# ------------------------------------------------------------------------
+
+	def score(self, evaluations: np.ndarray) -> pd.DataFrame:
+		"""Queue the evaluations and wait for their scores and segments."""
+		pending = _PendingBatch(evaluations, time.perf_counter())
+		self._pending.put(pending)
+		pending.done.wait()
+		if pending.error is not None:
+			raise pending.error
+		return pending.result
+
+	# ------------------------------------------------------------------------
+
+	def _score_batches(self) -> None:
+		while True:
+			batch = self._gather_batch()
+			started = time.perf_counter()
+			try:
+				scored = self._model.score(
+					np.vstack([pending.evaluations for pending in batch])
+				)
+			except Exception as e:  # noqa: BLE001
+				# Report the failure to every request in the batch
+				for pending in batch:
+					pending.error = e
+					pending.done.set()
+				continue
+			finished = time.perf_counter()
+			first_row = 0
+			for pending in batch:
+				nrows = len(pending.evaluations)
+				pending.result = scored.iloc[
+					first_row : first_row + nrows
+				].reset_index(drop=True)
+				first_row += nrows
+				pending.done.set()
+			self._metrics.record_batch(
+				[finished - pending.received for pending in batch],
+				first_row,
+				finished - started,
+			)
+
+	# ------------------------------------------------------------------------
+
+	def _gather_batch(self) -> list[_PendingBatch]:
+		batch = [self._pending.get()]
+		nrows = len(batch[0].evaluations)
+		deadline = time.perf_counter() + SERVICE_BATCH_WAIT_MS / 1000.0
+		while nrows < SERVICE_MAX_BATCH_ROWS:
+			remaining = deadline - time.perf_counter()
+			if remaining <= 0:
+				break
+			try:
+				pending = self._pending.get(timeout=remaining)
+			except queue.Empty:
+				break
+			batch.append(pending)
+			nrows += len(pending.evaluations)
+		return batch
+
+
+# --------------------------------------------------------------------------
+
+
+class _ScoringRequestHandler(BaseHTTPRequestHandler):
+	"""POST /score with {"rows": [...]} returns each row's scores and
+	segments; GET /metrics and GET /model describe the service.
+	"""
+
+	server: _ScoringServer
+
+	def do_GET(self) -> None:
+		if self.path == "/metrics":
+			self._reply(200, self.server.metrics.snapshot())
+		elif self.path == "/model":
+			self._reply(200, self.server.model.summary())
+		else:
+			self._reply(404, {"error": f"Unknown path {self.path}"})
+		return
+
+	# ------------------------------------------------------------------------
+
+	def do_POST(self) -> None:
+		if self.path != "/score":
+			self._reply(404, {"error": f"Unknown path {self.path}"})
+			return
+		try:
+			length = int(self.headers.get("Content-Length", 0))
+			request = json.loads(self.rfile.read(length))
+			evaluations = self.server.model.rows_to_evaluations(
+				list(request["rows"])
+			)
+		except (KeyError, TypeError, ValueError) as e:
+			self.server.metrics.record_error()
+			self._reply(400, {"error": str(e)})
+			return
+		try:
+			scored = self.server.batcher.score(evaluations)
+		except Exception as e:  # noqa: BLE001
+			self.server.metrics.record_error()
+			self._reply(500, {"error": str(e)})
+			return
+		self._reply(
+			200, {"individuals": self.server.model.describe(scored)}
+		)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def _reply(self, status: int, body: dict) -> None:
+		encoded = json.dumps(body).encode("utf-8")
+		self.send_response(status)
+		self.send_header("Content-Type", "application/json")
+		self.send_header("Content-Length", str(len(encoded)))
+		self.end_headers()
+		self.wfile.write(encoded)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def log_message(self, format: str, *args: object) -> None:  # noqa: A002, ARG002
+		# Requests are counted in /metrics rather than logged one by one
+		return
+
+
+# --------------------------------------------------------------------------
+
+
+class _ScoringServer(ThreadingHTTPServer):
+	daemon_threads = True
+
+	def __init__(self, port: int, model: ScoringModel) -> None:
+		super().__init__(("127.0.0.1", port), _ScoringRequestHandler)
+		self.model = model
+		self.metrics = ServiceMetrics()
+		self.batcher = MicroBatcher(model, self.metrics)
+
+
+# --------------------------------------------------------------------------
+
+
+def serve_scoring(script_file: str, port: int, qt_arguments: list[str]) -> int:
+	"""Run the setup script without showing a window, then serve scores
+	and segments on 127.0.0.1 at port until interrupted.
+
+	Returns:
+		The exit status, 1 when the setup script or the model fails
+	"""
+	os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+	from PySide6.QtWidgets import QApplication  # noqa: PLC0415
+	from director import Status  # noqa: PLC0415
+	from filemenu import OpenScriptCommand  # noqa: PLC0415
+
+	app = QApplication(qt_arguments)  # noqa: F841
+	director = Status()
+	runner = OpenScriptCommand(director, director.common)
+	director.executing_script = True
+	try:
+		with Path(os.devnull).open("w", encoding="utf-8") as output_sink:
+			with redirect_stdout(output_sink):
+				lines = Path(script_file).read_text(encoding="utf-8")
+				for line_num, line in enumerate(lines.splitlines(), 1):
+					if line.strip() and not line.lstrip().startswith("#"):
+						runner.execute_script_line(line.strip(), line_num)
+			model = ScoringModel(director)
+	except SpacesError as e:
+		print(f"{e.title}: {e.message}", file=sys.stderr)
+		return 1
+	except OSError as e:
+		print(e, file=sys.stderr)
+		return 1
+	finally:
+		director.executing_script = False
+	server = _ScoringServer(port, model)
+	print(
+		f"Scoring {len(model.item_names)} items against "
+		f"{' and '.join(model.contest)} on http://127.0.0.1:{port}"
+	)
+	try:
+		server.serve_forever()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		server.server_close()
+	return 0
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import numpy as np
+
+# Every random choice an analysis makes comes from a stream of its own,
+# spawned from the seed recorded with the command that makes it: one for
+# the sample design, one for each MDS run's random starts and one for
+# clustering. A stream depends only on the seed, its purpose and its
+# position, such as the repetition it solves, and not on which streams
+# were drawn before it, so repetitions solved in any order or at once
+# give what solving them one after another does, and running a saved
+# script again repeats its results.
+
+SEED_STREAMS: dict[str, int] = {
+	"sample design": 0,
+	"mds starts": 1,
+	"clustering": 2,
+	"sampling": 3,
+}
+
+# --------------------------------------------------------------------------
+
+
+class SessionSeeds:
+	"""Hands each command that makes random choices, and is not given a
+	seed, a seed of its own, spawned in turn from the session's seed.
+	"""
+
+	def __init__(self, session_seed: int | None = None) -> None:
+		sequence = np.random.SeedSequence(session_seed)
+		self.session_seed = int(sequence.entropy)  # type: ignore[arg-type]
+		self._sequence = sequence
+
+	# ------------------------------------------------------------------------
+
+	def next_seed(self) -> int:
+		"""Return a seed for the next command."""
+		return int(self._sequence.spawn(1)[0].generate_state(1)[0])
+
+
+# --------------------------------------------------------------------------
+
+
+def seed_stream(
+	seed: int, purpose: str, *indices: int
+) -> np.random.SeedSequence:
+	"""Return the stream for purpose, at indices, spawned from seed."""
+	return np.random.SeedSequence(
+		seed, spawn_key=(SEED_STREAMS[purpose], *indices)
+	)
+
+
+# --------------------------------------------------------------------------
+
+
+def child_seed(seed: int, purpose: str, *indices: int) -> int:
+	"""Return a seed from the stream for purpose, at indices, for code such
+	as scikit-learn's that takes a random_state rather than a generator.
+	"""
+	return int(seed_stream(seed, purpose, *indices).generate_state(1)[0])
+
+
+# --------------------------------------------------------------------------
+
+
+def child_generator(
+	seed: int, purpose: str, *indices: int
+) -> np.random.Generator:
+	"""Return a generator drawing from the stream for purpose, at
+	indices.
+	"""
+	return np.random.default_rng(seed_stream(seed, purpose, *indices))
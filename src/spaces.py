@@ -1,16 +1,39 @@
 from __future__ import annotations
 
 # Standard library imports
+import argparse
 import re
 import sys
+import time
+
+# Taken before the Qt and Spaces imports so startup time includes them
+STARTUP_BEGAN = time.perf_counter()
+
+from startup_profile import StartupProfiler  # noqa: E402
+
+# Import timing has to start before the imports below, so whether to
+# profile is decided from the raw arguments rather than from argparse
+STARTUP_PROFILER = StartupProfiler(
+	STARTUP_BEGAN, enabled="--profile-startup" in sys.argv
+)
+STARTUP_PROFILER.start_timing_imports()
 
 # from dataclasses import dataclass
 # from peek import peek
-from PySide6.QtGui import QFont
-from PySide6.QtCore import QFile, QIODevice
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtWidgets import QApplication, QTextEdit
-from director import Status, SplashWindow  # ty: ignore[unresolved-import]
+from pathlib import Path  # noqa: E402
+from PySide6.QtGui import QFont, QTextCursor  # noqa: E402
+from PySide6.QtCore import QFile, QIODevice, QTimer  # noqa: E402
+from PySide6.QtUiTools import QUiLoader  # noqa: E402
+from PySide6.QtWidgets import QApplication, QPlainTextEdit  # noqa: E402
+from constants import (  # noqa: E402
+	LOG_MAXIMUM_ENTRIES,
+	RECORD_FLUSH_INTERVAL_MS,
+	RECORD_MAXIMUM_BUFFERED_CHARACTERS,
+	RECORD_SCROLLBACK_LINES,
+	SERVICE_PORT,
+	STARTUP_BUDGET_SECONDS,
+)
+from director import Status, SplashWindow  # noqa: E402  # ty: ignore[unresolved-import]
 
 
 # end of imports
@@ -22,7 +45,22 @@ from director import Status, SplashWindow  # ty: ignore[unresolved-import]
 
 
 class MyTextEditWrapper:
-	def __init__(self, text_to_tab: QTextEdit) -> None:
+	"""Stands in for sys.stdout, sending printed output to the Record tab.
+
+	Writes are buffered and appended to the Record tab together when the
+	flush timer fires, when a command finishes, or when the buffer grows
+	past RECORD_MAXIMUM_BUFFERED_CHARACTERS, rather than one fragment at a
+	time. Only the last scrollback_lines lines are kept in the Record tab,
+	0 keeping them all. When session_log_file is given, the full output
+	is also written to it.
+	"""
+
+	def __init__(
+		self,
+		text_to_tab: QPlainTextEdit,
+		scrollback_lines: int = RECORD_SCROLLBACK_LINES,
+		session_log_file: str | None = None,
+	) -> None:
 		self.text_to_tab = text_to_tab
 		# Could use "Consolas" or "Courier New" for fixed font
 		# or "Monaco" or "Menlo" for Mac -- not rendered as fixed width
@@ -45,13 +83,30 @@ class MyTextEditWrapper:
 		# are still capped consistently to at most one blank line.
 		self._trailing_newlines = 0
 
+		self.text_to_tab.setMaximumBlockCount(scrollback_lines)
+		self._buffer: list[str] = []
+		self._buffered_characters = 0
+		self._flush_timer = QTimer()
+		self._flush_timer.setSingleShot(True)
+		self._flush_timer.setInterval(RECORD_FLUSH_INTERVAL_MS)
+		self._flush_timer.timeout.connect(self.flush)
+		self._session_log = (
+			None if session_log_file is None
+			else Path(session_log_file).open("w", encoding="utf-8")  # noqa: SIM115
+		)
+
 	# -----------------------------------------------------------------------
 
 	def write(self, text: str) -> int:
 		original_length = len(text)
 		text = self._normalize_blank_lines(text)
 		if text:
-			self.text_to_tab.insertPlainText(text)
+			self._buffer.append(text)
+			self._buffered_characters += len(text)
+			if self._buffered_characters > RECORD_MAXIMUM_BUFFERED_CHARACTERS:
+				self.flush()
+			elif not self._flush_timer.isActive():
+				self._flush_timer.start()
 		return original_length
 
 	# -----------------------------------------------------------------------
@@ -87,21 +142,62 @@ class MyTextEditWrapper:
 	# -----------------------------------------------------------------------
 
 	def flush(self) -> None:
-		pass
+		if not self._buffer:
+			return
+		self._flush_timer.stop()
+		text = "".join(self._buffer)
+		self._buffer.clear()
+		self._buffered_characters = 0
+		self.text_to_tab.moveCursor(QTextCursor.MoveOperation.End)
+		self.text_to_tab.insertPlainText(text)
+		if self._session_log is not None:
+			self._session_log.write(text)
+			self._session_log.flush()
+		return
+
+	# -----------------------------------------------------------------------
+
+	def close(self) -> None:
+		self.flush()
+		if self._session_log is not None:
+			self._session_log.close()
+			self._session_log = None
+		return
 
 # --------------------------------------------------------------------------
 
 
 class MyApplication:
-	def __init__(self) -> None:
-		self.spaces_app = QApplication(sys.argv)
-		self.director = self.initialize_gui_window()
+	def __init__(
+		self, options: argparse.Namespace, qt_arguments: list[str]
+	) -> None:
+		self.options = options
+		self.startup_profiler = STARTUP_PROFILER
+		with self.startup_profiler.span("Create QApplication"):
+			self.spaces_app = QApplication(qt_arguments)
+		self.director = self.initialize_gui_window(self.startup_profiler)
+		self.record_writer = MyTextEditWrapper(
+			self.director.text_to_tab,
+			options.record_scrollback,
+			options.session_log,
+		)
+		sys.stdout = self.record_writer
+		self.director.command_log.maximum_entries = options.log_entries
 		self.welcome_splash = None
 
 	def execute(self) -> None:
 		self.print_python_version_info()
-		self.welcome_splash = SplashWindow()
-		self.welcome_splash.show()
+		with self.startup_profiler.span("Splash window"):
+			self.welcome_splash = SplashWindow()
+			self.welcome_splash.show()
+		if self.startup_profiler.enabled:
+			# Let Qt paint both windows so the timeline ends when
+			# they are actually on screen
+			with self.startup_profiler.span("First paint"):
+				self.spaces_app.processEvents()
+		self.record_startup_time()
+		if self.startup_profiler.enabled:
+			self.finish_startup_profile()
 		print(
 			f"\nIn this version of {self.director.right_statusbar_message} "
 			f"there are {len(self.director.request_dict)} menu items, "
@@ -113,8 +209,39 @@ class MyApplication:
 		# peek("Peek seems to be working")
 		self.start_event_loop()
 		self.print_debug_logs()
+		self.record_writer.close()
 		sys.exit()
 
+	def record_startup_time(self) -> None:
+		"""Record seconds from process start until the windows are shown
+		so that startup time can be tracked from release to release.
+		"""
+		self.director.startup_seconds = time.perf_counter() - STARTUP_BEGAN
+		print(f"Startup took {self.director.startup_seconds:.2f} seconds")
+		return
+
+	def finish_startup_profile(self) -> None:
+		"""Write the startup timeline, report it on the console and exit,
+		with a failing exit status when startup exceeded the budget so the
+		profile run can serve as a benchmark.
+		"""
+		startup_profiler = self.startup_profiler
+		budget_seconds = self.options.startup_budget
+		startup_profiler.stop_timing_imports()
+		startup_profiler.write_trace(
+			self.options.startup_profile_file, budget_seconds
+		)
+		report_lines = startup_profiler.create_report(budget_seconds)
+		report_lines.append(
+			f"\nTimeline written to {self.options.startup_profile_file}"
+		)
+		print("\n".join(report_lines), file=sys.__stdout__)
+		exit_status = (
+			0 if startup_profiler.elapsed_seconds() <= budget_seconds else 1
+		)
+		self.record_writer.close()
+		sys.exit(exit_status)
+
 	@staticmethod
 	def print_python_version_info() -> None:
 		print(sys.version)
@@ -122,10 +249,11 @@ class MyApplication:
 		return
 
 	@staticmethod
-	def initialize_gui_window() -> Status:
-		director = Status()
-		director.show()
-		sys.stdout = MyTextEditWrapper(director.text_to_tab)
+	def initialize_gui_window(startup_profiler: StartupProfiler) -> Status:
+		with startup_profiler.span("Create main window"):
+			director = Status(startup_profiler=startup_profiler)
+		with startup_profiler.span("Show main window"):
+			director.show()
 		# sys.stdout = open('record_of_output.txt', 'wt')
 		return director
 
@@ -148,6 +276,7 @@ class MyApplication:
 		return self.spaces_app.exec()
 
 	def print_debug_logs(self) -> None:
+		print(f"{self.director.startup_seconds=:.2f}")
 		print(f"{self.director.commands_used=}")
 		print(f"{self.director.command_exit_code=}")
 		print(f"{self.director.undo_stack_source=}\n")
@@ -161,8 +290,79 @@ class MyApplication:
 # --------------------------------------------------------------------------
 
 
+def parse_command_line(
+	arguments: list[str],
+) -> tuple[argparse.Namespace, list[str]]:
+	"""Separate Spaces' own options from those meant for Qt.
+
+	Returns:
+		The parsed options and the arguments to hand to QApplication
+	"""
+	parser = argparse.ArgumentParser(prog="spaces")
+	parser.add_argument(
+		"--profile-startup",
+		action="store_true",
+		help="record a startup timeline, report it and exit",
+	)
+	parser.add_argument(
+		"--startup-budget",
+		type=float,
+		default=STARTUP_BUDGET_SECONDS,
+		help="seconds startup may take before the profile run fails",
+	)
+	parser.add_argument(
+		"--startup-profile-file",
+		default="startup_profile.json",
+		help="file the startup timeline is written to",
+	)
+	parser.add_argument(
+		"--record-scrollback",
+		type=int,
+		default=RECORD_SCROLLBACK_LINES,
+		help="lines kept in the Record tab, 0 to keep them all",
+	)
+	parser.add_argument(
+		"--log-entries",
+		type=int,
+		default=LOG_MAXIMUM_ENTRIES,
+		help="commands whose output the Log tab keeps",
+	)
+	parser.add_argument(
+		"--session-log",
+		help="file to write all Record tab output to",
+	)
+	parser.add_argument(
+		"--serve",
+		metavar="SCRIPT",
+		help="run SCRIPT without a window, then serve scores and segments",
+	)
+	parser.add_argument(
+		"--port",
+		type=int,
+		default=SERVICE_PORT,
+		help="port the scoring service listens on",
+	)
+	options, other_arguments = parser.parse_known_args(arguments[1:])
+	qt_arguments = [arguments[0], *other_arguments]
+	return options, qt_arguments
+
+
+# --------------------------------------------------------------------------
+
+
 if __name__ == "__main__":
 
-	my_app = MyApplication()
+	command_line_options, arguments_for_qt = parse_command_line(sys.argv)
+	if command_line_options.serve:
+		from scoring_service import serve_scoring
+
+		sys.exit(
+			serve_scoring(
+				command_line_options.serve,
+				command_line_options.port,
+				arguments_for_qt,
+			)
+		)
+	my_app = MyApplication(command_line_options, arguments_for_qt)
 	my_app.execute()
 	
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import sys
+import time
+from contextlib import contextmanager, suppress
+from pathlib import Path
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+	from collections.abc import Iterator
+	from importlib.machinery import ModuleSpec
+
+# Only the standard library is imported here because spaces.py imports
+# this module before anything else when --profile-startup is given
+
+# --------------------------------------------------------------------------
+
+
+class StartupProfiler:
+	"""Records a timeline of named spans from process start until the main
+	window is shown and writes it as a Chrome trace event file, which
+	chrome://tracing, Perfetto and speedscope display as a flame graph.
+
+	A disabled profiler records nothing, so Status can call span()
+	unconditionally.
+	"""
+
+	def __init__(self, origin: float, *, enabled: bool = True) -> None:
+		self.origin = origin
+		self.enabled = enabled
+		self.events: list[dict[str, Any]] = []
+		self._import_timer: _TimedImportFinder | None = None
+
+	# ------------------------------------------------------------------------
+
+	@contextmanager
+	def span(self, name: str, category: str = "startup") -> Iterator[None]:
+		"""Time the enclosed block and record it under name and category."""
+		if not self.enabled:
+			yield
+			return
+		began = time.perf_counter()
+		try:
+			yield
+		finally:
+			ended = time.perf_counter()
+			self.events.append({
+				"name": name,
+				"cat": category,
+				"ph": "X",
+				"ts": (began - self.origin) * 1_000_000,
+				"dur": (ended - began) * 1_000_000,
+				"pid": 1,
+				"tid": 1,
+			})
+
+	# ------------------------------------------------------------------------
+
+	def elapsed_seconds(self) -> float:
+		elapsed = time.perf_counter() - self.origin
+		return elapsed
+
+	# ------------------------------------------------------------------------
+
+	def start_timing_imports(self) -> None:
+		"""Record the execution time of every module imported from now on."""
+		if not self.enabled or self._import_timer is not None:
+			return
+		self._import_timer = _TimedImportFinder(self)
+		sys.meta_path.insert(0, self._import_timer)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def stop_timing_imports(self) -> None:
+		if self._import_timer is None:
+			return
+		sys.meta_path.remove(self._import_timer)
+		self._import_timer = None
+		return
+
+	# ------------------------------------------------------------------------
+
+	def write_trace(self, file_name: str, budget_seconds: float) -> None:
+		total_seconds = self.elapsed_seconds()
+		trace = {
+			"traceEvents": sorted(self.events, key=lambda event: event["ts"]),
+			"displayTimeUnit": "ms",
+			"otherData": {
+				"total_seconds": round(total_seconds, 4),
+				"budget_seconds": budget_seconds,
+				"within_budget": total_seconds <= budget_seconds,
+			},
+		}
+		with Path(file_name).open("w", encoding="utf-8") as file_handle:
+			json.dump(trace, file_handle, indent=1)
+		return
+
+	# ------------------------------------------------------------------------
+
+	def create_report(
+		self, budget_seconds: float, n_slowest: int = 10
+	) -> list[str]:
+		"""Summarize the timeline as lines of text: the total against the
+		budget followed by the slowest startup steps and imports.
+		"""
+		total_seconds = self.elapsed_seconds()
+		verdict = "within" if total_seconds <= budget_seconds else "OVER"
+		report_lines = [(
+			f"Startup took {total_seconds:.2f} seconds, {verdict} the "
+			f"budget of {budget_seconds:.2f} seconds"
+		)]
+		for category, heading in (
+			("startup", "Slowest startup steps"),
+			("icon", "Slowest icons"),
+			("import", "Slowest imports (including nested imports)"),
+		):
+			in_category = [
+				event for event in self.events if event["cat"] == category
+			]
+			in_category.sort(key=lambda event: event["dur"], reverse=True)
+			if not in_category:
+				continue
+			report_lines.append(f"\n{heading}:")
+			report_lines.extend(
+				f"\t{event['dur'] / 1000:9.1f} ms  {event['name']}"
+				for event in in_category[:n_slowest]
+			)
+		return report_lines
+
+
+# --------------------------------------------------------------------------
+
+
+class _TimedImportFinder:
+	"""Meta path finder that lets the real finders locate each module and
+	then wraps the loader's exec_module so the module's execution is
+	recorded as an import span.
+	"""
+
+	def __init__(self, profiler: StartupProfiler) -> None:
+		self._profiler = profiler
+
+	def find_spec(
+		self,
+		fullname: str,
+		path: Any = None,  # noqa: ANN401
+		target: Any = None,  # noqa: ANN401
+	) -> ModuleSpec | None:
+		spec = None
+		for finder in sys.meta_path:
+			if finder is self or not hasattr(finder, "find_spec"):
+				continue
+			spec = finder.find_spec(fullname, path, target)
+			if spec is not None:
+				break
+		if spec is None:
+			return None
+		loader = spec.loader
+		# Builtin and frozen modules are loaded by classes shared by every
+		# such module, so only per-module loader instances are wrapped
+		if loader is None or isinstance(loader, type):
+			return spec
+		original_exec_module = getattr(loader, "exec_module", None)
+		if original_exec_module is None:
+			return spec
+		profiler = self._profiler
+
+		def timed_exec_module(module: object) -> None:
+			with profiler.span(fullname, "import"):
+				original_exec_module(module)
+
+		with suppress(AttributeError):
+			loader.exec_module = timed_exec_module
+		return spec
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 
 import peek  # noqa: F401
-from pyqtgraph.Qt import QtCore
 from PySide6.QtWidgets import (
 	QLabel,
+	QTableView,
 	QTableWidget,
 	QTableWidgetItem,
 	QVBoxLayout,
@@ -24,6 +24,7 @@ from dictionaries import (
 	title_generator_dict,
 )
 from exceptions import SpacesError
+from table_model import FormattedTableModel
 # ----------------------------------------------------------------------------
 
 
@@ -69,7 +70,7 @@ class BasicTableWidget:
 
 	# ------------------------------------------------------------------------
 
-	def display_table(self, table_name: str) -> QTableWidget:
+	def display_table(self, table_name: str) -> QTableView:
 		"""Create and return a basic table widget"""
 		result = None
 
@@ -115,13 +116,13 @@ class BasicTableWidget:
 		column_headers: list[str],
 		row_height: int,
 		format_str: str,
-	) -> QTableWidget:
+	) -> QTableView:
 		"""Build a basic table with the given data and formatting"""
 		try:
-			# Create the table widget
-			table_widget = QTableWidget(data.shape[0], data.shape[1])
+			# Create the table view
+			table_widget = QTableView()
 
-			# Use the shared function to fill and format the table data
+			# Use the shared function to show the formatted table data
 			self._director.common.fill_table_with_formatted_data(
 				table_widget, data, format_str
 			)
@@ -150,7 +151,7 @@ class SquareTableWidget:
 	def __init__(self, director: Status) -> None:
 		self._director = director
 
-	def display_table(self, table_name: str) -> QTableWidget:
+	def display_table(self, table_name: str) -> QTableView:
 		"""Create and return a square table widget"""
 		if table_name not in square_table_dict:
 			print(f"Unknown square table: {table_name}")
@@ -180,29 +181,15 @@ class SquareTableWidget:
 		row_height: int,
 		format_str: str,
 		diagonal: str,
-	) -> QTableWidget:
+	) -> QTableView:
 		"""Build a square table with the given data and formatting"""
 		try:
-			# Create the table widget
-			table_widget = QTableWidget(data.shape[0], data.shape[1])
-
-			# Fill table with data, handling diagonal elements specially
-			for row in range(data.shape[0]):
-				for col in range(data.shape[1]):
-					value = data.iloc[row, col]
-
-					# Format the value, using the diagonal string for diagonal
-					if row == col:
-						formatted_value = diagonal
-					else:
-						formatted_value = f"{value:{format_str}}"
-
-					item = QTableWidgetItem(formatted_value)
-					item.setTextAlignment(
-						QtCore.Qt.AlignmentFlag.AlignCenter
-						| QtCore.Qt.AlignmentFlag.AlignVCenter
-					)
-					table_widget.setItem(row, col, item)
+			# Create the table view, showing the diagonal string on the
+			# diagonal
+			table_widget = QTableView()
+			table_widget.setModel(
+				FormattedTableModel(data, format_str, diagonal=diagonal)
+			)
 
 			# Set headers and visual properties
 			self._director.set_column_and_row_headers(
@@ -236,7 +223,7 @@ class GeneralStatisticalTableWidget:
 			"Unknown general statistical table requested. "
 		)
 
-	def display_table(self, table_name: str) -> QTableWidget:
+	def display_table(self, table_name: str) -> QTableView:
 		"""Create and return a general statistical table widget"""
 
 		# Check if table_name exists in configuration
@@ -321,7 +308,7 @@ class GeneralStatisticalTableWidget:
 		column_headers: list[str],
 		row_height: int,
 		format_spec: str | list[str],
-	) -> QTableWidget:
+	) -> QTableView:
 		"""Build a statistical table with the given data and formatting
 
 		Parameters:
@@ -330,10 +317,10 @@ class GeneralStatisticalTableWidget:
 			If str, the same format is used for all columns
 			If list, each element is the format for a specific column
 		"""
-		# Create the table widget
-		table_widget = QTableWidget(data.shape[0], data.shape[1])
+		# Create the table view
+		table_widget = QTableView()
 
-		# Use the shared function to fill and format the table data
+		# Use the shared function to show the formatted table data
 		self._director.common.fill_table_with_formatted_data(
 			table_widget, data, format_spec
 		)
@@ -361,7 +348,7 @@ class RivalryTableWidget:
 			"Unknown rivalry table requested. "
 		)
 
-	def display_table(self, table_name: str) -> QTableWidget:
+	def display_table(self, table_name: str) -> QTableView:
 		"""Create and return a rivalry table widget"""
 
 		# Check if table_name exists in configuration
@@ -418,7 +405,7 @@ class RivalryTableWidget:
 		format_spec: str | list[str],
 		*,
 		noscores: bool = False,
-	) -> QTableWidget:
+	) -> QTableView:
 		"""Build a rivalry table with the given data and formatting
 
 		Parameters:
@@ -449,10 +436,10 @@ class RivalryTableWidget:
 			message = "data should not be None when noscores=False"
 			raise ValueError(message)
 
-		# Create the table widget
-		table_widget = QTableWidget(data.shape[0], data.shape[1])
+		# Create the table view
+		table_widget = QTableView()
 
-		# Use the shared function to fill and format the table data
+		# Use the shared function to show the formatted table data
 		self._director.common.fill_table_with_formatted_data(
 			table_widget, data, format_spec
 		)
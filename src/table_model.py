@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from numbers import Real
+
+import numpy as np
+import pandas as pd
+from PySide6.QtCore import (
+	QAbstractTableModel,
+	QModelIndex,
+	QPersistentModelIndex,
+	Qt,
+)
+
+# --------------------------------------------------------------------------
+
+
+class FormattedTableModel(QAbstractTableModel):
+	"""Shows a DataFrame or two-dimensional array in a QTableView.
+
+	Cells are formatted with format_spec only when the view asks for
+	them, so a table costs the same whatever its number of rows until it
+	is scrolled. format_spec is one format for every column or a list with
+	one per column, "d" showing numbers as integers and "s" as text, left
+	aligned. When diagonal is given it is shown on the diagonal instead of
+	the data, as in square tables.
+	"""
+
+	def __init__(
+		self,
+		data: pd.DataFrame | np.ndarray,
+		format_spec: str | list[str],
+		diagonal: str | None = None,
+	) -> None:
+		super().__init__()
+		if isinstance(data, pd.DataFrame):
+			# Kept as one array per column so each keeps its own dtype
+			self._columns = [
+				data.iloc[:, col].to_numpy() for col in range(data.shape[1])
+			]
+		else:
+			values = np.asarray(data)
+			self._columns = [values[:, col] for col in range(values.shape[1])]
+		self._n_rows = data.shape[0]
+		self._column_formats = [
+			column_format_for(format_spec, col)
+			for col in range(len(self._columns))
+		]
+		self._diagonal = diagonal
+		self._header_labels: dict[Qt.Orientation, dict[int, str]] = {
+			Qt.Orientation.Horizontal: {},
+			Qt.Orientation.Vertical: {},
+		}
+
+	# ------------------------------------------------------------------------
+
+	def rowCount(  # noqa: N802
+		self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()  # noqa: B008
+	) -> int:
+		return 0 if parent.isValid() else self._n_rows
+
+	# ------------------------------------------------------------------------
+
+	def columnCount(  # noqa: N802
+		self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()  # noqa: B008
+	) -> int:
+		return 0 if parent.isValid() else len(self._columns)
+
+	# ------------------------------------------------------------------------
+
+	def data(
+		self,
+		index: QModelIndex | QPersistentModelIndex,
+		role: int = Qt.ItemDataRole.DisplayRole,
+	) -> str | Qt.AlignmentFlag | None:
+		if not index.isValid():
+			return None
+		row, col = index.row(), index.column()
+		column_format = self._column_formats[col]
+		if role == Qt.ItemDataRole.DisplayRole:
+			if self._diagonal is not None and row == col:
+				return self._diagonal
+			value = self._columns[col][row]
+			try:
+				return format_cell_value(value, column_format)
+			except (ValueError, TypeError):
+				return "Error"
+		if role == Qt.ItemDataRole.TextAlignmentRole:
+			return cell_alignment_for(column_format)
+		return None
+
+	# ------------------------------------------------------------------------
+
+	def headerData(  # noqa: N802
+		self,
+		section: int,
+		orientation: Qt.Orientation,
+		role: int = Qt.ItemDataRole.DisplayRole,
+	) -> str | None:
+		if role != Qt.ItemDataRole.DisplayRole:
+			return None
+		# Numbered from one when no label is set, as in a QTableWidget
+		return self._header_labels[orientation].get(section, str(section + 1))
+
+	# ------------------------------------------------------------------------
+
+	def setHeaderData(  # noqa: N802
+		self,
+		section: int,
+		orientation: Qt.Orientation,
+		value: object,
+		role: int = Qt.ItemDataRole.EditRole,
+	) -> bool:
+		if role not in (Qt.ItemDataRole.EditRole, Qt.ItemDataRole.DisplayRole):
+			return False
+		self._header_labels[orientation][section] = str(value)
+		self.headerDataChanged.emit(orientation, section, section)
+		return True
+
+
+# --------------------------------------------------------------------------
+
+
+def column_format_for(format_spec: str | list[str], col: int) -> str:
+	"""Return the format of column col in format_spec."""
+	if isinstance(format_spec, list):
+		if col < len(format_spec):
+			return format_spec[col]
+		# Columns beyond the list use its first format
+		return format_spec[0] if format_spec else ""
+	return format_spec
+
+
+# --------------------------------------------------------------------------
+
+
+def format_cell_value(value: object, column_format: str) -> str:
+	"""Format a single cell value according to the column format."""
+	if column_format == "d":
+		if isinstance(value, Real):
+			return str(int(value))
+		return str(value)
+	if column_format == "s":
+		return str(value)
+	if isinstance(value, Real):
+		return f"{value:{column_format}}"
+	return str(value)
+
+
+# --------------------------------------------------------------------------
+
+
+def cell_alignment_for(column_format: str) -> Qt.AlignmentFlag:
+	"""Align text to the left and everything else in the centre."""
+	if column_format == "s":
+		return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+	return Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
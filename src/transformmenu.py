@@ -11,7 +11,6 @@ from typing import TYPE_CHECKING
 from PySide6.QtWidgets import QDialog # noqa: F401
 # from dialogs import MoveDialog, SelectItemsDialog, SetValueDialog
 
-from scipy.spatial import procrustes
 # from rivalry import Rivalry
 
 if TYPE_CHECKING:
@@ -60,6 +59,8 @@ class CompareCommand:
 	# ------------------------------------------------------------------------
 
 	def _compare(self) -> float:
+		from scipy.spatial import procrustes  # noqa: PLC0415
+
 		dim_labels = self._director.configuration_active.dim_labels
 		point_names = self._director.configuration_active.point_names
 		point_coords = self._director.configuration_active.point_coords
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 
 from PySide6.QtWidgets import (
 	# QDialog,
+	QTableView,
 	QTableWidget,
 	QTableWidgetItem,
 	QTextEdit,
@@ -15,6 +16,12 @@ from PySide6.QtWidgets import (
 # Local application imports
 
 
+from command_metrics import (
+	COMMAND_STATUSES,
+	METRICS_HEADINGS,
+	describe_exit_code,
+	format_metrics,
+)
 from exceptions import SpacesError
 # from dialogs import ModifyItemsDialog
 
@@ -58,30 +65,28 @@ class HistoryCommand:
 	def _print_history(self) -> None:
 		commands_used = self._director.commands_used
 		command_exit_code = self._director.command_exit_code
+		command_metrics = self._director.command_metrics
 
 		print("\n\tCommands used\n")
 
 		# Create header
-		header = f"\t{'Command':<40} {'Status':<25}"
+		metrics_header = "".join(
+			f"{heading:>13}" for heading in METRICS_HEADINGS)
+		header = f"\t{'Command':<40} {'Status':<25}{metrics_header}"
 		print(header)
-		print("\t" + "-" * 65)
+		print("\t" + "-" * (65 + len(metrics_header)))
 
 		# Print each command with proper alignment
 		range_commands_used = range(1, len(commands_used))
 		for i in range_commands_used:
 			command = commands_used[i]
-			status = command_exit_code[i]
-			match status:
-				case 1:
-					status_str = "Failed"
-				case 0:
-					status_str = "Completed successfully"
-				case -1:
-					status_str = "In process"
-				case _:
-					status_str = "Unknown status"
-
-			line = f"\t{command:<40} {status_str:<25}"
+			status_str = describe_exit_code(command_exit_code[i])
+
+			metrics_columns = "".join(
+				f"{value:>13}"
+				for value in format_metrics(command_metrics[i])
+			)
+			line = f"\t{command:<40} {status_str:<25}{metrics_columns}"
 			print(line)
 		return
 
@@ -92,7 +97,7 @@ class HistoryCommand:
 		gui_output_as_widget = self._create_table_widget_for_history()
 		#
 		self._director.set_column_and_row_headers(
-			gui_output_as_widget, ["Command", "Status"], []
+			gui_output_as_widget, ["Command", "Status", *METRICS_HEADINGS], []
 		)
 		#
 		self._director.resize_and_set_table_size(gui_output_as_widget, 4)
@@ -105,8 +110,10 @@ class HistoryCommand:
 	def _create_table_widget_for_history(self) -> QTableWidget:
 		commands_used = self._director.commands_used
 		command_exit_code = self._director.command_exit_code
+		command_metrics = self._director.command_metrics
 
-		table_widget = QTableWidget(len(commands_used), 2)
+		table_widget = QTableWidget(
+			len(commands_used), 2 + len(METRICS_HEADINGS))
 		#
 		range_commands_used = range(1, len(commands_used))
 		for each_command in range_commands_used:
@@ -114,20 +121,19 @@ class HistoryCommand:
 				each_command, 0, QTableWidgetItem(commands_used[each_command])
 			)
 			status = command_exit_code[each_command]
-			match status:
-				case 1:
-					status_str = "Failed"
-				case 0:
-					status_str = "Completed successfully"
-				case -1:
-					status_str = "In process"
-				case _:
-					raise SpacesError(
-						self.unknown_status_of_command_error_title,
-						self.unknown_status_of_command_error_message,
-					)
+			if status not in COMMAND_STATUSES:
+				raise SpacesError(
+					self.unknown_status_of_command_error_title,
+					self.unknown_status_of_command_error_message,
+				)
+			status_str = describe_exit_code(status)
 			#
 			table_widget.setItem(each_command, 1, QTableWidgetItem(status_str))
+			for column, value in enumerate(
+				format_metrics(command_metrics[each_command]), start=2
+			):
+				table_widget.setItem(
+					each_command, column, QTableWidgetItem(value))
 		return table_widget
 
 	# ------------------------------------------------------------------------
@@ -461,7 +467,7 @@ class ViewSampleDesignCommand:
 
 	# ------------------------------------------------------------------------
 
-	def _display(self) -> QTableWidget:
+	def _display(self) -> QTableView:
 		#
 		gui_output_as_widget = self._director.uncertainty_active.\
 			create_table_widget_for_sample_designer()
@@ -519,7 +525,7 @@ class ViewSampleRepetitionsCommand:
 
 	# ------------------------------------------------------------------------
 
-	def _display(self) -> QTableWidget:
+	def _display(self) -> QTableView:
 		#
 		gui_output_as_widget = self._director.uncertainty_active.\
 			create_table_widget_for_sample_designer()
@@ -667,7 +673,10 @@ class ViewSpatialUncertaintyCommand:
 		common.capture_and_push_undo_state(
 			"View spatial uncertainty", "passive", params)
 
-		print(sample_solutions)
+		if sample_solutions.empty:
+			uncertainty_active.print_point_statistics()
+		else:
+			print(sample_solutions)
 
 		# Create the plot with the specified visualization mode
 		common.create_plot_for_tabs("spatial_uncertainty")